@@ -1,45 +1,223 @@
-from typing import Generator
-from fastapi import Depends, HTTPException, status
+from typing import Optional
+from fastapi import Depends, HTTPException, Query, WebSocketException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from app.infrastructure.database import get_db
+from app.api.middleware import TokenBucketLimiter, retry_after_header
+from app.infrastructure.database import get_db, get_read_db, get_session
 from app.infrastructure.repositories import SQLAlchemyProductRepository
 from app.infrastructure.user_repository import UserRepository
-from app.domain.interfaces import IProductRepository, IUserRepository
+from app.infrastructure.reservation_repository import SQLAlchemyReservationRepository
+from app.infrastructure.location_repository import SQLAlchemyLocationRepository
+from app.infrastructure.allocation_repository import SQLAlchemyAllocationRepository
+from app.infrastructure.inventory_repository import SQLAlchemyInventoryRepository
+from app.infrastructure.job_repository import SQLAlchemyJobRepository
+from app.infrastructure.cache import LocalCache
+from app.infrastructure.cached_repositories import (
+    CachedProductRepository,
+    CoalescingProductRepository,
+    CachedUserRepository,
+    evict_on
+)
+from app.infrastructure.change_feed import ChangeSignal
+from app.infrastructure.stock_broadcaster import StockBroadcaster, refresh_on
+from app.infrastructure.invalidation import (
+    create_invalidation_bus,
+    PRODUCT_CHANGED,
+    USER_CHANGED
+)
+from app.domain.interfaces import (
+    IProductRepository,
+    IUserRepository,
+    IReservationRepository,
+    ILocationRepository,
+    IAllocationRepository,
+    IInventoryRepository,
+    IJobRepository
+)
 from app.domain.services import ProductService
 from app.domain.auth_service import AuthService
+from app.domain.reservation_service import ReservationService
+from app.domain.location_service import LocationService
+from app.domain.allocation_service import AllocationService
+from app.domain.inventory_service import InventoryService
+from app.domain.job_service import JobService
+from app.core.config import settings
+from app.core.singleflight import AsyncSingleFlight, SingleFlight
 from app.domain.user_models import User
 from app.core.security import decode_access_token
+from app.core.request_timing import record_user, timed_auth
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+invalidation_bus = create_invalidation_bus(
+    settings.CACHE_INVALIDATION_BUS,
+    settings.DATABASE_URL
+)
+product_cache = LocalCache(
+    "products",
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.CACHE_TTL_SECONDS
+)
+user_cache = LocalCache(
+    "users",
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.CACHE_TTL_SECONDS
+)
+invalidation_bus.subscribe(PRODUCT_CHANGED, evict_on(product_cache))
+invalidation_bus.subscribe(USER_CHANGED, evict_on(user_cache))
+user_rate_limiter = TokenBucketLimiter(
+    settings.RATE_LIMIT_PER_SECOND,
+    settings.RATE_LIMIT_BURST
+)
+product_flight = SingleFlight("products")
+change_feed_flight = AsyncSingleFlight("product_changes")
+invalidation_bus.subscribe(PRODUCT_CHANGED, product_flight.forget)
+invalidation_bus.subscribe(PRODUCT_CHANGED, change_feed_flight.forget)
+product_change_signal = ChangeSignal()
+invalidation_bus.subscribe(PRODUCT_CHANGED, product_change_signal.notify)
+stock_broadcaster = StockBroadcaster(queue_size=settings.STREAM_QUEUE_SIZE)
+invalidation_bus.subscribe(
+    PRODUCT_CHANGED,
+    refresh_on(stock_broadcaster, invalidation_bus.origin, get_session)
+)
+job_signal = ChangeSignal()
 
-def get_product_repository(
+
+async def get_product_repository(
     db: Session = Depends(get_db)
 ) -> IProductRepository:
-    return SQLAlchemyProductRepository(db)
+    return SQLAlchemyProductRepository(db, invalidation_bus)
 
 
-def get_product_service(
+async def get_product_service(
     repository: IProductRepository = Depends(get_product_repository)
 ) -> ProductService:
-    return ProductService(repository)
+    return ProductService(repository, stock_broadcaster)
+
+
+async def get_product_read_service(
+    db: Session = Depends(get_read_db)
+) -> ProductService:
+    if db.info.get("replica"):
+        return ProductService(CoalescingProductRepository(
+            SQLAlchemyProductRepository(db, invalidation_bus),
+            product_flight,
+            scope="replica"
+        ))
+    
+    repository = CoalescingProductRepository(
+        SQLAlchemyProductRepository(db, invalidation_bus),
+        product_flight
+    )
+    return ProductService(
+        CachedProductRepository(repository, product_cache, invalidation_bus)
+    )
+
 
+async def get_reservation_repository(
+    db: Session = Depends(get_db)
+) -> IReservationRepository:
+    return SQLAlchemyReservationRepository(db, invalidation_bus)
+
+
+async def get_reservation_service(
+    repository: IReservationRepository = Depends(get_reservation_repository)
+) -> ReservationService:
+    return ReservationService(
+        repository,
+        default_ttl_seconds=settings.RESERVATION_DEFAULT_TTL_SECONDS,
+        max_ttl_seconds=settings.RESERVATION_MAX_TTL_SECONDS
+    )
+
+
+async def get_location_repository(
+    db: Session = Depends(get_db)
+) -> ILocationRepository:
+    return SQLAlchemyLocationRepository(db, invalidation_bus)
 
-def get_user_repository(db: Session = Depends(get_db)) -> IUserRepository:
-    return UserRepository(db)
+
+async def get_location_service(
+    repository: ILocationRepository = Depends(get_location_repository)
+) -> LocationService:
+    return LocationService(repository, stock_broadcaster)
+
+
+async def get_allocation_repository(
+    db: Session = Depends(get_db)
+) -> IAllocationRepository:
+    return SQLAlchemyAllocationRepository(db, invalidation_bus)
+
+
+async def get_allocation_service(
+    repository: IAllocationRepository = Depends(get_allocation_repository)
+) -> AllocationService:
+    return AllocationService(
+        repository,
+        stock_broadcaster,
+        max_lines=settings.ALLOCATION_MAX_LINES
+    )
+
+
+async def get_inventory_repository(
+    db: Session = Depends(get_read_db)
+) -> IInventoryRepository:
+    return SQLAlchemyInventoryRepository(db)
+
+
+async def get_inventory_service(
+    repository: IInventoryRepository = Depends(get_inventory_repository)
+) -> InventoryService:
+    return InventoryService(repository)
+
+
+async def get_job_repository(
+    db: Session = Depends(get_db)
+) -> IJobRepository:
+    return SQLAlchemyJobRepository(db)
 
 
-def get_auth_service(
+async def get_job_service(
+    repository: IJobRepository = Depends(get_job_repository)
+) -> JobService:
+    return JobService(
+        repository,
+        job_signal.notify,
+        import_max_items=settings.JOB_IMPORT_MAX_ITEMS
+    )
+
+
+async def get_user_repository(db: Session = Depends(get_db)) -> IUserRepository:
+    return UserRepository(db, invalidation_bus)
+
+
+async def get_cached_user_repository(
+    user_repository: IUserRepository = Depends(get_user_repository)
+) -> IUserRepository:
+    return CachedUserRepository(user_repository, user_cache, invalidation_bus)
+
+
+async def get_auth_service(
     user_repository: IUserRepository = Depends(get_user_repository)
 ) -> AuthService:
     return AuthService(user_repository)
 
 
+def authenticate_token(token: str, user_repository: IUserRepository) -> Optional[User]:
+    payload = decode_access_token(token)
+    if payload is None:
+        return None
+    
+    username: str = payload.get("sub")
+    if username is None:
+        return None
+    
+    return user_repository.get_by_username(username)
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    user_repository: IUserRepository = Depends(get_user_repository)
+    user_repository: IUserRepository = Depends(get_cached_user_repository)
 ) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -47,28 +225,59 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    payload = decode_access_token(token)
-    if payload is None:
+    with timed_auth():
+        user = authenticate_token(token, user_repository)
+    if user is None:
         raise credentials_exception
+    record_user(user.username)
     
-    username: str = payload.get("sub")
-    if username is None:
-        raise credentials_exception
+    retry_after = user_rate_limiter.acquire(user.username)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded",
+            headers=retry_after_header(retry_after)
+        )
     
-    user = user_repository.get_by_username(username)
+    return user
+
+
+async def get_websocket_user(
+    token: str = Query(..., description="Access token; browsers cannot set headers on WebSockets"),
+    user_repository: IUserRepository = Depends(get_cached_user_repository)
+) -> User:
+    with timed_auth():
+        user = authenticate_token(token, user_repository)
     if user is None:
-        raise credentials_exception
+        raise WebSocketException(
+            code=status.WS_1008_POLICY_VIOLATION,
+            reason="Could not validate credentials"
+        )
     
     return user
 
 
 __all__ = [
     "get_db",
+    "get_read_db",
     "get_product_repository",
     "get_product_service",
+    "get_product_read_service",
+    "get_reservation_repository",
+    "get_reservation_service",
+    "get_location_repository",
+    "get_location_service",
+    "get_allocation_repository",
+    "get_allocation_service",
+    "get_inventory_repository",
+    "get_inventory_service",
+    "get_job_repository",
+    "get_job_service",
     "get_user_repository",
+    "get_cached_user_repository",
     "get_auth_service",
     "get_current_user",
+    "get_websocket_user",
     "Depends"
 ]
 
@@ -4,7 +4,14 @@ from app.core.exceptions import (
     ProductNotFoundError,
     DuplicateSKUError,
     InvalidAmountError,
-    InsufficientStockError
+    InsufficientStockError,
+    ReservationNotFoundError,
+    ReservationStateError,
+    VersionConflictError,
+    PreconditionFailedError,
+    AllocationShortfallError,
+    JobNotFoundError,
+    JobStateError
 )
 
 
@@ -33,6 +40,48 @@ def handle_service_error(error: Exception) -> HTTPException:
             detail=error.message
         )
     
+    if isinstance(error, AllocationShortfallError):
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=error.message
+        )
+    
+    if isinstance(error, ReservationNotFoundError):
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=error.message
+        )
+    
+    if isinstance(error, ReservationStateError):
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=error.message
+        )
+    
+    if isinstance(error, JobNotFoundError):
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=error.message
+        )
+    
+    if isinstance(error, JobStateError):
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=error.message
+        )
+    
+    if isinstance(error, PreconditionFailedError):
+        return HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=error.message
+        )
+    
+    if isinstance(error, VersionConflictError):
+        return HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=error.message
+        )
+    
     if isinstance(error, ApplicationError):
         return HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -50,6 +99,13 @@ EXCEPTION_STATUS_MAP = {
     DuplicateSKUError: status.HTTP_400_BAD_REQUEST,
     InvalidAmountError: status.HTTP_400_BAD_REQUEST,
     InsufficientStockError: status.HTTP_400_BAD_REQUEST,
+    ReservationNotFoundError: status.HTTP_404_NOT_FOUND,
+    ReservationStateError: status.HTTP_409_CONFLICT,
+    VersionConflictError: status.HTTP_409_CONFLICT,
+    PreconditionFailedError: status.HTTP_412_PRECONDITION_FAILED,
+    AllocationShortfallError: status.HTTP_409_CONFLICT,
+    JobNotFoundError: status.HTTP_404_NOT_FOUND,
+    JobStateError: status.HTTP_409_CONFLICT,
     ApplicationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
 }
 
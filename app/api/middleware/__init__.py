@@ -0,0 +1,23 @@
+from app.api.middleware.read_your_writes import ReadYourWritesMiddleware
+from app.api.middleware.admission import (
+    AdmissionControlMiddleware,
+    AdmissionController,
+    TokenBucketLimiter,
+    retry_after_header
+)
+from app.api.middleware.capture import TrafficCaptureMiddleware
+from app.api.middleware.access_log import AccessLogMiddleware
+from app.api.middleware.error_rate import ErrorRateMiddleware
+from app.api.middleware.compression import CompressionMiddleware
+
+__all__ = [
+    "ReadYourWritesMiddleware",
+    "AdmissionControlMiddleware",
+    "AdmissionController",
+    "TokenBucketLimiter",
+    "retry_after_header",
+    "TrafficCaptureMiddleware",
+    "AccessLogMiddleware",
+    "ErrorRateMiddleware",
+    "CompressionMiddleware"
+]
@@ -0,0 +1,59 @@
+import random
+import time
+from typing import Callable, Iterable
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.api.middleware.capture import route_template
+from app.core.request_timing import begin_request
+
+
+class AccessLogMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        writer: Callable[[dict], None],
+        sample_rate: float = 0.1,
+        slow_threshold_ms: float = 500.0,
+        exclude_prefixes: Iterable[str] = ()
+    ):
+        self.app = app
+        self.writer = writer
+        self.sample_rate = sample_rate
+        self.slow_threshold_ms = slow_threshold_ms
+        self.exclude_prefixes = tuple(exclude_prefixes)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_prefixes):
+            await self.app(scope, receive, send)
+            return
+        
+        timings = begin_request()
+        status_code = 500
+        
+        async def recording_send(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, recording_send)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            slow = duration_ms >= self.slow_threshold_ms
+            if status_code >= 400 or slow or random.random() < self.sample_rate:
+                client = scope.get("client")
+                self.writer({
+                    "method": scope["method"],
+                    "route": route_template(scope),
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration_ms": round(duration_ms, 3),
+                    "db_ms": round(timings.db_seconds * 1000, 3),
+                    "db_queries": timings.db_queries,
+                    "auth_ms": round(timings.auth_seconds * 1000, 3),
+                    "user": timings.user,
+                    "client": client[0] if client else None,
+                    "slow": slow,
+                    "sampled": status_code < 400 and not slow
+                })
@@ -0,0 +1,180 @@
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Iterable, Optional, Tuple
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.core.metrics import metrics
+
+
+GENERAL = "general"
+
+
+class TokenBucketLimiter:
+    def __init__(self, rate_per_second: float, burst: int, max_keys: int = 100000):
+        self.rate = rate_per_second
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._limited = metrics.counter("admission.rate_limited")
+    
+    def acquire(self, key: str) -> float:
+        if self.rate <= 0:
+            return 0.0
+        
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (float(self.burst), now))
+            tokens = min(float(self.burst), tokens + (now - updated) * self.rate)
+            if tokens >= 1:
+                retry_after = 0.0
+                tokens -= 1
+            else:
+                retry_after = (1 - tokens) / self.rate
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        
+        if retry_after:
+            self._limited.inc()
+        return retry_after
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        capacity: int,
+        reserved: Dict[str, int],
+        max_queue: int = 256,
+        queue_timeout_seconds: float = 1.0
+    ):
+        self.reserved = dict(reserved)
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self._general_free = max(0, capacity - sum(self.reserved.values()))
+        self._reserved_free = dict(self.reserved)
+        self._waiters: Deque[Tuple[str, asyncio.Future]] = deque()
+        self._in_flight = metrics.gauge("admission.in_flight")
+        self._queue_wait = metrics.summary("admission.queue_wait_seconds")
+        self._count = 0
+    
+    def try_acquire(self, lane: str) -> Optional[str]:
+        if self._reserved_free.get(lane, 0) > 0:
+            self._reserved_free[lane] -= 1
+            return self._admitted(lane)
+        if self._general_free > 0:
+            self._general_free -= 1
+            return self._admitted(GENERAL)
+        return None
+    
+    async def acquire(self, lane: str) -> Optional[str]:
+        slot = self.try_acquire(lane)
+        if slot is not None or len(self._waiters) >= self.max_queue:
+            return slot
+        
+        future = asyncio.get_running_loop().create_future()
+        waiter = (lane, future)
+        self._waiters.append(waiter)
+        started = time.perf_counter()
+        try:
+            return await asyncio.wait_for(future, self.queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._queue_wait.observe(time.perf_counter() - started)
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+    
+    def release(self, slot: str) -> None:
+        self._count -= 1
+        for waiter in self._waiters:
+            lane, future = waiter
+            if future.done() or (slot != GENERAL and slot != lane):
+                continue
+            self._waiters.remove(waiter)
+            future.set_result(self._admitted(slot))
+            return
+        
+        if slot == GENERAL:
+            self._general_free += 1
+        else:
+            self._reserved_free[slot] += 1
+        self._in_flight.set(self._count)
+    
+    def _admitted(self, slot: str) -> str:
+        self._count += 1
+        self._in_flight.set(self._count)
+        return slot
+
+
+class AdmissionControlMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: AdmissionController,
+        lanes: Dict[str, Iterable[str]],
+        exempt_prefixes: Iterable[str] = (),
+        pool_wait: Optional[Callable[[], float]] = None,
+        pool_wait_threshold_seconds: float = 0.5,
+        retry_after_seconds: int = 1
+    ):
+        self.app = app
+        self.controller = controller
+        self.lanes = {lane: tuple(prefixes) for lane, prefixes in lanes.items()}
+        self.exempt_prefixes = tuple(exempt_prefixes)
+        self.pool_wait = pool_wait
+        self.pool_wait_threshold_seconds = pool_wait_threshold_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self._shed = metrics.counter("admission.shed")
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exempt_prefixes):
+            await self.app(scope, receive, send)
+            return
+        
+        lane = self.lane_for(scope["path"])
+        if (
+            lane == GENERAL
+            and self.pool_wait is not None
+            and self.pool_wait() > self.pool_wait_threshold_seconds
+        ):
+            await self._reject(scope, receive, send, "Database pool saturated")
+            return
+        
+        slot = await self.controller.acquire(lane)
+        if slot is None:
+            await self._reject(scope, receive, send, "Server overloaded")
+            return
+        
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(slot)
+    
+    def lane_for(self, path: str) -> str:
+        for lane, prefixes in self.lanes.items():
+            if path.startswith(prefixes):
+                return lane
+        return GENERAL
+    
+    async def _reject(self, scope: Scope, receive: Receive, send: Send, reason: str) -> None:
+        self._shed.inc()
+        response = JSONResponse(
+            status_code=503,
+            content={"detail": f"{reason}, retry later"},
+            headers={"Retry-After": str(self.retry_after_seconds)}
+        )
+        await response(scope, receive, send)
+
+
+def retry_after_header(seconds: float) -> Dict[str, str]:
+    return {"Retry-After": str(max(1, math.ceil(seconds)))}
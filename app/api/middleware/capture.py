@@ -0,0 +1,112 @@
+import json
+import random
+import time
+from typing import Any, Callable, Iterable, Optional
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+REDACTED = "***"
+REDACTED_FIELDS = frozenset({"password", "token", "access_token", "refresh_token"})
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def redact(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if key in REDACTED_FIELDS else redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return value
+
+
+def route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class TrafficCaptureMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        writer: Callable[[dict], None],
+        sample_rate: float = 0.1,
+        capture_bodies: bool = False,
+        max_body_bytes: int = 4096,
+        exclude_prefixes: Iterable[str] = ()
+    ):
+        self.app = app
+        self.writer = writer
+        self.sample_rate = sample_rate
+        self.capture_bodies = capture_bodies
+        self.max_body_bytes = max_body_bytes
+        self.exclude_prefixes = tuple(exclude_prefixes)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"].startswith(self.exclude_prefixes)
+            or random.random() >= self.sample_rate
+        ):
+            await self.app(scope, receive, send)
+            return
+        
+        request_bytes = 0
+        response_bytes = 0
+        status_code = 500
+        chunks = []
+        
+        async def counting_receive() -> Message:
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                body = message.get("body", b"")
+                if self.capture_bodies and request_bytes + len(body) <= self.max_body_bytes:
+                    chunks.append(body)
+                request_bytes += len(body)
+            return message
+        
+        async def counting_send(message: Message) -> None:
+            nonlocal response_bytes, status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+        
+        started_at = time.time()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            record = {
+                "ts": round(started_at, 6),
+                "method": scope["method"],
+                "route": route_template(scope),
+                "path": scope["path"],
+                "query": scope.get("query_string", b"").decode("latin-1"),
+                "path_params": scope.get("path_params", {}),
+                "status": status_code,
+                "request_bytes": request_bytes,
+                "response_bytes": response_bytes,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                "authenticated": any(name == b"authorization" for name, _ in scope["headers"])
+            }
+            body = self._body(scope, chunks, request_bytes)
+            if body is not None:
+                record["body"] = body
+            self.writer(record)
+    
+    def _body(self, scope: Scope, chunks: list, request_bytes: int) -> Optional[Any]:
+        if not self.capture_bodies or not request_bytes or request_bytes > self.max_body_bytes:
+            return None
+        
+        content_type = dict(scope["headers"]).get(b"content-type", b"")
+        if not content_type.startswith(b"application/json"):
+            return None
+        
+        try:
+            return redact(json.loads(b"".join(chunks)))
+        except ValueError:
+            return None
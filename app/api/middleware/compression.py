@@ -0,0 +1,200 @@
+import zlib
+from typing import Dict, Iterable, List, Optional
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.metrics import metrics
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class GzipStream:
+    encoding = "gzip"
+    
+    def __init__(self, level: int = 6):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+    
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+    
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliStream:
+    encoding = "br"
+    
+    def __init__(self, level: int = 4):
+        self._compressor = brotli.Compressor(quality=level)
+    
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+    
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+    
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdStream:
+    encoding = "zstd"
+    
+    def __init__(self, level: int = 3):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+    
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+    
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+CODECS = {
+    codec.encoding: codec
+    for codec, module in ((GzipStream, zlib), (BrotliStream, brotli), (ZstdStream, zstandard))
+    if module is not None
+}
+
+
+def available_encodings(preferred: Iterable[str]) -> List[str]:
+    encodings = [encoding.strip().lower() for encoding in preferred]
+    return [encoding for encoding in encodings if encoding in CODECS]
+
+
+def negotiate(accept_encoding: str, offered: List[str]) -> Optional[str]:
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+    
+    best, best_weight = None, 0.0
+    for encoding in offered:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: Iterable[str] = ("br", "zstd", "gzip"),
+        levels: Optional[Dict[str, int]] = None,
+        minimum_size: int = 1024,
+        content_types: Iterable[str] = ("application/json",),
+        threadpool_min_size: int = 256 * 1024
+    ):
+        self.app = app
+        self.encodings = available_encodings(encodings)
+        self.levels = dict(levels or {})
+        self.minimum_size = minimum_size
+        self.content_types = frozenset(t.strip().lower() for t in content_types)
+        self.threadpool_min_size = threadpool_min_size
+        self._bytes_in = metrics.counter("compression.bytes_in")
+        self._bytes_out = metrics.counter("compression.bytes_out")
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        start: Optional[Message] = None
+        stream = None
+        passthrough = False
+        
+        async def compressing_send(message: Message) -> None:
+            nonlocal start, stream, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                passthrough = not self._compressible(message)
+                if passthrough:
+                    await send(message)
+                return
+            
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+            
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            
+            if stream is None:
+                headers = MutableHeaders(scope=start)
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+                
+                stream = CODECS[encoding](**self._level(encoding))
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    compressed = await self._compress_all(stream, body)
+                    headers["Content-Length"] = str(len(compressed))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                await send(start)
+            
+            self._bytes_in.inc(len(body))
+            chunk = stream.compress(body) + (stream.flush() if more_body else stream.finish())
+            self._bytes_out.inc(len(chunk))
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+        
+        await self.app(scope, receive, compressing_send)
+    
+    def _compressible(self, message: Message) -> bool:
+        if message["status"] < 200 or message["status"] in (204, 304):
+            return False
+        headers = Headers(raw=message["headers"])
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+        return content_type in self.content_types
+    
+    def _level(self, encoding: str) -> Dict[str, int]:
+        return {"level": self.levels[encoding]} if encoding in self.levels else {}
+    
+    async def _compress_all(self, stream, body: bytes) -> bytes:
+        self._bytes_in.inc(len(body))
+        if len(body) >= self.threadpool_min_size:
+            compressed = await run_in_threadpool(lambda: stream.compress(body) + stream.finish())
+        else:
+            compressed = stream.compress(body) + stream.finish()
+        self._bytes_out.inc(len(compressed))
+        return compressed
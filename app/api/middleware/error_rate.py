@@ -0,0 +1,28 @@
+from typing import Iterable
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.infrastructure.health import ErrorRateTracker
+
+
+class ErrorRateMiddleware:
+    def __init__(self, app: ASGIApp, tracker: ErrorRateTracker, exclude_prefixes: Iterable[str] = ()):
+        self.app = app
+        self.tracker = tracker
+        self.exclude_prefixes = tuple(exclude_prefixes)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_prefixes):
+            await self.app(scope, receive, send)
+            return
+        
+        status_code = 500
+        
+        async def recording_send(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, recording_send)
+        finally:
+            self.tracker.record(status_code)
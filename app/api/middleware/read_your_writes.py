@@ -0,0 +1,42 @@
+import time
+from typing import Iterable
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReadYourWritesMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        cookie_name: str,
+        window_seconds: float,
+        exempt_paths: Iterable[str] = ()
+    ):
+        self.app = app
+        self.cookie_name = cookie_name
+        self.window_seconds = window_seconds
+        self.exempt_paths = frozenset(exempt_paths)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] in SAFE_METHODS
+            or scope["path"] in self.exempt_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_pin(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                pinned_until = time.time() + self.window_seconds
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{self.cookie_name}={pinned_until:.3f}; Max-Age={int(self.window_seconds) or 1}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+            await send(message)
+        
+        await self.app(scope, receive, send_with_pin)
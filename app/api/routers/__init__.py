@@ -1,4 +1,19 @@
 from app.api.routers.products import router as products_router
 from app.api.routers.auth import router as auth_router
+from app.api.routers.reservations import router as reservations_router
+from app.api.routers.subscriptions import router as subscriptions_router
+from app.api.routers.locations import router as locations_router
+from app.api.routers.allocations import router as allocations_router
+from app.api.routers.inventory import router as inventory_router
+from app.api.routers.jobs import router as jobs_router
 
-__all__ = ["products_router", "auth_router"]
+__all__ = [
+    "products_router",
+    "auth_router",
+    "reservations_router",
+    "subscriptions_router",
+    "locations_router",
+    "allocations_router",
+    "inventory_router",
+    "jobs_router"
+]
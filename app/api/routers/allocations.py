@@ -0,0 +1,65 @@
+from typing import Union
+from fastapi import APIRouter, status, Depends
+from fastapi.responses import JSONResponse
+from app.api.schemas import (
+    AllocationRequest,
+    AllocationResponse,
+    AllocatedLineResponse,
+    AllocationShortfallResponse,
+    ShortfallResponse,
+    ErrorResponse
+)
+from app.api.dependency_factories import get_allocation_service, get_current_user
+from app.domain.user_models import User
+from app.api.error_handlers import handle_service_error
+from app.domain.allocation_service import AllocationService
+from app.core.exceptions import (
+    ProductNotFoundError,
+    InvalidAmountError,
+    AllocationShortfallError
+)
+
+
+router = APIRouter(prefix="/allocations", tags=["Allocations"])
+
+
+@router.post(
+    "",
+    response_model=AllocationResponse,
+    summary="Decrement stock for several products in one transaction",
+    responses={
+        200: {"description": "Every line allocated"},
+        400: {"model": ErrorResponse, "description": "Invalid quantity or too many lines"},
+        404: {"model": ErrorResponse, "description": "Product not found"},
+        409: {"model": AllocationShortfallResponse, "description": "Nothing allocated; lines that cannot be filled"}
+    }
+)
+def create_allocation(
+    allocation: AllocationRequest,
+    service: AllocationService = Depends(get_allocation_service),
+    current_user: User = Depends(get_current_user)
+) -> Union[AllocationResponse, JSONResponse]:
+    try:
+        allocated = service.allocate([(line.product_id, line.quantity) for line in allocation.lines])
+        return AllocationResponse(lines=[
+            AllocatedLineResponse(
+                product_id=line.product_id,
+                sku=line.product.sku,
+                quantity=line.quantity,
+                stock=line.product.stock,
+                version=line.product.version
+            )
+            for line in allocated.lines
+        ])
+    
+    except AllocationShortfallError as e:
+        return JSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content=AllocationShortfallResponse(
+                detail=e.message,
+                shortfalls=[ShortfallResponse.model_validate(s) for s in e.shortfalls]
+            ).model_dump()
+        )
+    
+    except (ProductNotFoundError, InvalidAmountError) as e:
+        raise handle_service_error(e)
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends
+from app.api.schemas import InventorySummaryResponse
+from app.api.dependency_factories import get_inventory_service, get_current_user
+from app.domain.user_models import User
+from app.domain.inventory_service import InventoryService
+
+
+router = APIRouter(prefix="/inventory", tags=["Inventory"])
+
+
+@router.get(
+    "/summary",
+    response_model=InventorySummaryResponse,
+    summary="Get catalog-wide stock totals",
+    responses={
+        200: {"description": "Totals maintained on every stock change"}
+    }
+)
+def get_inventory_summary(
+    service: InventoryService = Depends(get_inventory_service),
+    current_user: User = Depends(get_current_user)
+) -> InventorySummaryResponse:
+    return InventorySummaryResponse.model_validate(service.get_summary())
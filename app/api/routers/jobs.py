@@ -0,0 +1,136 @@
+import os
+from fastapi import APIRouter, HTTPException, Response, status, Depends
+from fastapi.responses import FileResponse, JSONResponse
+from app.api.schemas import ProductImportRequest, JobResponse, ErrorResponse
+from app.api.dependency_factories import get_job_service, get_current_user
+from app.domain.user_models import User
+from app.api.error_handlers import handle_service_error
+from app.domain.job_models import Job
+from app.domain.job_service import JobService
+from app.core.config import settings
+from app.core.exceptions import InvalidAmountError, JobNotFoundError, JobStateError
+
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+def accepted(job: Job, response: Response) -> JobResponse:
+    response.headers["Location"] = f"{settings.API_V1_PREFIX}/jobs/{job.id}"
+    return JobResponse.model_validate(job)
+
+
+@router.post(
+    "/product-imports",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue a bulk product import",
+    responses={
+        202: {"description": "Import queued; poll the Location URL"},
+        400: {"model": ErrorResponse, "description": "Too many products"}
+    }
+)
+def submit_product_import(
+    request: ProductImportRequest,
+    response: Response,
+    service: JobService = Depends(get_job_service),
+    current_user: User = Depends(get_current_user)
+) -> JobResponse:
+    try:
+        job = service.submit_product_import(
+            [product.model_dump() for product in request.products],
+            created_by=current_user.username
+        )
+        return accepted(job, response)
+    
+    except InvalidAmountError as e:
+        raise handle_service_error(e)
+
+
+@router.post(
+    "/product-exports",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue an NDJSON export of every product",
+    responses={
+        202: {"description": "Export queued; poll the Location URL"}
+    }
+)
+def submit_product_export(
+    response: Response,
+    service: JobService = Depends(get_job_service),
+    current_user: User = Depends(get_current_user)
+) -> JobResponse:
+    return accepted(service.submit_product_export(created_by=current_user.username), response)
+
+
+@router.post(
+    "/inventory-reconciliations",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue an inventory summary reconciliation",
+    responses={
+        202: {"description": "Reconciliation queued; poll the Location URL"}
+    }
+)
+def submit_inventory_reconcile(
+    response: Response,
+    service: JobService = Depends(get_job_service),
+    current_user: User = Depends(get_current_user)
+) -> JobResponse:
+    return accepted(service.submit_inventory_reconcile(created_by=current_user.username), response)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    summary="Get job status and progress",
+    responses={
+        200: {"description": "Job found"},
+        404: {"model": ErrorResponse, "description": "Job not found"}
+    }
+)
+def get_job(
+    job_id: int,
+    service: JobService = Depends(get_job_service),
+    current_user: User = Depends(get_current_user)
+) -> JobResponse:
+    try:
+        return JobResponse.model_validate(service.get_job(job_id))
+    
+    except JobNotFoundError as e:
+        raise handle_service_error(e)
+
+
+@router.get(
+    "/{job_id}/result",
+    summary="Get the result of a succeeded job",
+    responses={
+        200: {
+            "content": {"application/json": {}, "application/x-ndjson": {}},
+            "description": "Result summary, or the exported file for products.export"
+        },
+        404: {"model": ErrorResponse, "description": "Job or export file not found"},
+        409: {"model": ErrorResponse, "description": "Job has not succeeded"}
+    }
+)
+def get_job_result(
+    job_id: int,
+    service: JobService = Depends(get_job_service),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        job = service.get_result(job_id)
+    
+    except (JobNotFoundError, JobStateError) as e:
+        raise handle_service_error(e)
+    
+    if job.kind != Job.PRODUCT_EXPORT:
+        return JSONResponse(job.result or {})
+    
+    path = os.path.join(settings.JOB_EXPORT_DIR, job.result["file"])
+    if not os.path.exists(path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Export file for job {job_id} is no longer available"
+        )
+    return FileResponse(path, media_type="application/x-ndjson", filename=job.result["file"])
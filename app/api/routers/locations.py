@@ -0,0 +1,107 @@
+from fastapi import APIRouter, Depends
+from app.api.schemas import (
+    StockAdjustment,
+    LocationStockResponse,
+    StockBreakdownResponse,
+    LocationAdjustmentResponse,
+    ErrorResponse
+)
+from app.api.dependency_factories import get_location_service, get_current_user
+from app.domain.user_models import User
+from app.api.error_handlers import handle_service_error
+from app.domain.location_service import LocationService
+from app.core.exceptions import (
+    ProductNotFoundError,
+    InvalidAmountError,
+    InsufficientStockError
+)
+
+
+router = APIRouter(prefix="/products", tags=["Locations"])
+
+
+@router.get(
+    "/{product_id}/locations",
+    response_model=StockBreakdownResponse,
+    summary="Get stock by location",
+    responses={
+        200: {"description": "Product total and per-location stock"},
+        404: {"model": ErrorResponse, "description": "Product not found"}
+    }
+)
+def get_locations(
+    product_id: int,
+    service: LocationService = Depends(get_location_service),
+    current_user: User = Depends(get_current_user)
+) -> StockBreakdownResponse:
+    try:
+        breakdown = service.get_breakdown(product_id)
+        return StockBreakdownResponse(
+            product_id=breakdown.product_id,
+            total_stock=breakdown.total,
+            unassigned_stock=breakdown.unassigned,
+            locations=[LocationStockResponse.model_validate(l) for l in breakdown.locations]
+        )
+    
+    except ProductNotFoundError as e:
+        raise handle_service_error(e)
+
+
+@router.post(
+    "/{product_id}/locations/{location}/increment",
+    response_model=LocationAdjustmentResponse,
+    summary="Increment stock at a location",
+    responses={
+        200: {"description": "Location and product stock incremented"},
+        400: {"model": ErrorResponse, "description": "Invalid amount or location"},
+        404: {"model": ErrorResponse, "description": "Product not found"}
+    }
+)
+def increment_location_stock(
+    product_id: int,
+    location: str,
+    adjustment: StockAdjustment = StockAdjustment(),
+    service: LocationService = Depends(get_location_service),
+    current_user: User = Depends(get_current_user)
+) -> LocationAdjustmentResponse:
+    try:
+        location_stock, product = service.increment_stock(product_id, location, adjustment.amount)
+        return LocationAdjustmentResponse(
+            product_id=product.id,
+            location=location_stock.location,
+            stock=location_stock.stock,
+            total_stock=product.stock
+        )
+    
+    except (ProductNotFoundError, InvalidAmountError) as e:
+        raise handle_service_error(e)
+
+
+@router.post(
+    "/{product_id}/locations/{location}/decrement",
+    response_model=LocationAdjustmentResponse,
+    summary="Decrement stock at a location",
+    responses={
+        200: {"description": "Location and product stock decremented"},
+        400: {"model": ErrorResponse, "description": "Invalid amount or insufficient stock at location"},
+        404: {"model": ErrorResponse, "description": "Product not found"}
+    }
+)
+def decrement_location_stock(
+    product_id: int,
+    location: str,
+    adjustment: StockAdjustment = StockAdjustment(),
+    service: LocationService = Depends(get_location_service),
+    current_user: User = Depends(get_current_user)
+) -> LocationAdjustmentResponse:
+    try:
+        location_stock, product = service.decrement_stock(product_id, location, adjustment.amount)
+        return LocationAdjustmentResponse(
+            product_id=product.id,
+            location=location_stock.location,
+            stock=location_stock.stock,
+            total_stock=product.stock
+        )
+    
+    except (ProductNotFoundError, InvalidAmountError, InsufficientStockError) as e:
+        raise handle_service_error(e)
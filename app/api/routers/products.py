@@ -1,27 +1,62 @@
-from typing import List
-from fastapi import APIRouter, HTTPException, status, Depends
+import asyncio
+from typing import Iterator, List, Optional
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from app.api.schemas import (
     ProductCreate,
     ProductUpdate,
     ProductResponse,
     StockAdjustment,
+    ProductLookupRequest,
+    ProductLookupResponse,
+    ProductChangeResponse,
+    ProductChangeFeed,
     ErrorResponse
 )
-from app.api.dependency_factories import get_product_service, get_current_user
+from app.api.dependency_factories import (
+    get_product_service,
+    get_product_read_service,
+    get_current_user,
+    product_change_signal,
+    change_feed_flight
+)
+from app.core.config import settings
+from app.infrastructure.database import get_read_db
 from app.domain.user_models import User
+from app.domain.models import Product
 from app.api.error_handlers import handle_service_error
 from app.domain.services import ProductService
 from app.core.exceptions import (
     ProductNotFoundError,
     DuplicateSKUError,
     InvalidAmountError,
-    InsufficientStockError
+    InsufficientStockError,
+    VersionConflictError
 )
 
 
 router = APIRouter(prefix="/products", tags=["Products"])
 
 
+def product_etag(product: Product) -> str:
+    return f'"{product.version}"'
+
+
+def if_match_version(if_match: Optional[str]) -> Optional[int]:
+    if if_match is None or if_match.strip() == "*":
+        return None
+    
+    tag = if_match.strip()
+    if len(tag) > 2 and tag[0] == tag[-1] == '"' and tag[1:-1].isdigit():
+        return int(tag[1:-1])
+    raise HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail="If-Match must be a single strong entity tag taken from ETag"
+    )
+
+
 @router.post(
     "",
     response_model=ProductResponse,
@@ -60,13 +95,118 @@ def create_product(
 def get_all_products(
     skip: int = 0,
     limit: int = 100,
-    service: ProductService = Depends(get_product_service),
+    after: Optional[int] = Query(None, ge=0, description="Last product ID already seen (keyset pagination)"),
+    service: ProductService = Depends(get_product_read_service),
     current_user: User = Depends(get_current_user)
 ) -> List[ProductResponse]:
-    products = service.get_all_products(skip=skip, limit=limit)
+    products = service.get_all_products(skip=skip, limit=limit, after_id=after)
     return [ProductResponse.model_validate(p) for p in products]
 
 
+@router.post(
+    "/lookup",
+    response_model=ProductLookupResponse,
+    summary="Resolve many products by ID and/or SKU",
+    responses={
+        200: {"description": "Found products and missing keys"},
+        422: {"description": "No keys or too many keys"}
+    }
+)
+def lookup_products(
+    lookup: ProductLookupRequest,
+    service: ProductService = Depends(get_product_read_service),
+    current_user: User = Depends(get_current_user)
+) -> ProductLookupResponse:
+    by_id, missing_ids = service.get_products_by_ids(lookup.ids)
+    by_sku, missing_skus = service.get_products_by_skus(lookup.skus)
+    products = {p.id: p for p in by_id + by_sku}
+    
+    return ProductLookupResponse(
+        products=[ProductResponse.model_validate(p) for p in products.values()],
+        missing_ids=missing_ids,
+        missing_skus=missing_skus
+    )
+
+
+@router.get(
+    "/changes",
+    response_model=ProductChangeFeed,
+    summary="Get product changes since a cursor",
+    responses={
+        200: {"description": "Changes after the cursor, possibly empty after waiting"},
+        400: {"model": ErrorResponse, "description": "Invalid cursor"}
+    }
+)
+async def get_product_changes(
+    since: int = Query(0, description="Last sequence number already seen"),
+    limit: int = Query(100, ge=1, le=settings.CHANGE_FEED_MAX_LIMIT),
+    wait: float = Query(0.0, ge=0, le=settings.CHANGE_FEED_MAX_WAIT_SECONDS),
+    service: ProductService = Depends(get_product_read_service),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+) -> ProductChangeFeed:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    
+    try:
+        while True:
+            changes = await change_feed_flight.do(
+                (bool(db.info.get("replica")), since, limit),
+                lambda: run_in_threadpool(service.get_changes, since, limit)
+            )
+            remaining = deadline - loop.time()
+            if changes or remaining <= 0:
+                break
+            await run_in_threadpool(db.close)
+            await product_change_signal.wait(min(remaining, settings.CHANGE_FEED_POLL_SECONDS))
+    
+    except InvalidAmountError as e:
+        raise handle_service_error(e)
+    
+    return ProductChangeFeed(
+        changes=[
+            ProductChangeResponse(
+                seq=change.seq,
+                op="delete" if change.deleted else "upsert",
+                product_id=change.product_id,
+                sku=change.sku,
+                product=ProductResponse.model_validate(change.product) if change.product else None
+            )
+            for change in changes
+        ],
+        cursor=changes[-1].seq if changes else since,
+        has_more=len(changes) == limit
+    )
+
+
+def _export_lines(service: ProductService, db: Session) -> Iterator[str]:
+    try:
+        for batch in service.iter_product_batches(settings.PRODUCT_EXPORT_BATCH_SIZE):
+            yield "".join(ProductResponse.model_validate(p).model_dump_json() + "\n" for p in batch)
+    finally:
+        db.close()
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export every product as NDJSON",
+    responses={
+        200: {"content": {"application/x-ndjson": {}}, "description": "One product per line, ordered by ID"}
+    }
+)
+def export_products(
+    service: ProductService = Depends(get_product_read_service),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+) -> StreamingResponse:
+    return StreamingResponse(
+        _export_lines(service, db),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="products.ndjson"'}
+    )
+
+
 @router.get(
     "/{product_id}",
     response_model=ProductResponse,
@@ -78,11 +218,13 @@ def get_all_products(
 )
 def get_product(
     product_id: int,
-    service: ProductService = Depends(get_product_service),
+    response: Response,
+    service: ProductService = Depends(get_product_read_service),
     current_user: User = Depends(get_current_user)
 ) -> ProductResponse:
     try:
         product = service.get_product_by_id(product_id)
+        response.headers["ETag"] = product_etag(product)
         return ProductResponse.model_validate(product)
     
     except ProductNotFoundError as e:
@@ -96,12 +238,16 @@ def get_product(
     responses={
         200: {"description": "Product updated"},
         404: {"model": ErrorResponse, "description": "Product not found"},
-        400: {"model": ErrorResponse, "description": "Invalid input"}
+        400: {"model": ErrorResponse, "description": "Invalid input or stock below the amount held at locations"},
+        409: {"model": ErrorResponse, "description": "Product changed concurrently; re-read and retry"},
+        412: {"model": ErrorResponse, "description": "If-Match does not match the current version"}
     }
 )
 def update_product(
     product_id: int,
     product_update: ProductUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     service: ProductService = Depends(get_product_service),
     current_user: User = Depends(get_current_user)
 ) -> ProductResponse:
@@ -109,11 +255,18 @@ def update_product(
         updated = service.update_product(
             product_id=product_id,
             name=product_update.name,
-            stock=product_update.stock
+            stock=product_update.stock,
+            expected_version=if_match_version(if_match)
         )
+        response.headers["ETag"] = product_etag(updated)
         return ProductResponse.model_validate(updated)
     
-    except (ProductNotFoundError, InvalidAmountError) as e:
+    except (
+        ProductNotFoundError,
+        InvalidAmountError,
+        InsufficientStockError,
+        VersionConflictError
+    ) as e:
         raise handle_service_error(e)
 
 
@@ -150,6 +303,7 @@ def delete_product(
 )
 def increment_stock(
     product_id: int,
+    response: Response,
     adjustment: StockAdjustment = StockAdjustment(),
     service: ProductService = Depends(get_product_service),
     current_user: User = Depends(get_current_user)
@@ -159,6 +313,7 @@ def increment_stock(
             product_id=product_id,
             amount=adjustment.amount
         )
+        response.headers["ETag"] = product_etag(updated)
         return ProductResponse.model_validate(updated)
     
     except (ProductNotFoundError, InvalidAmountError) as e:
@@ -177,6 +332,7 @@ def increment_stock(
 )
 def decrement_stock(
     product_id: int,
+    response: Response,
     adjustment: StockAdjustment = StockAdjustment(),
     service: ProductService = Depends(get_product_service),
     current_user: User = Depends(get_current_user)
@@ -186,6 +342,7 @@ def decrement_stock(
             product_id=product_id,
             amount=adjustment.amount
         )
+        response.headers["ETag"] = product_etag(updated)
         return ProductResponse.model_validate(updated)
     
     except (ProductNotFoundError, InvalidAmountError, InsufficientStockError) as e:
@@ -0,0 +1,121 @@
+from fastapi import APIRouter, status, Depends
+from app.api.schemas import (
+    ReservationCreate,
+    ReservationResponse,
+    StockAvailability,
+    ErrorResponse
+)
+from app.api.dependency_factories import get_reservation_service, get_current_user
+from app.domain.user_models import User
+from app.api.error_handlers import handle_service_error
+from app.domain.reservation_service import ReservationService
+from app.core.exceptions import (
+    ProductNotFoundError,
+    InvalidAmountError,
+    InsufficientStockError,
+    ReservationNotFoundError,
+    ReservationStateError
+)
+
+
+router = APIRouter(prefix="/products", tags=["Reservations"])
+
+
+@router.post(
+    "/{product_id}/reservations",
+    response_model=ReservationResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Reserve stock for a product",
+    responses={
+        201: {"description": "Stock reserved"},
+        400: {"model": ErrorResponse, "description": "Invalid amount or insufficient available stock"},
+        404: {"model": ErrorResponse, "description": "Product not found"}
+    }
+)
+def create_reservation(
+    product_id: int,
+    reservation: ReservationCreate = ReservationCreate(),
+    service: ReservationService = Depends(get_reservation_service),
+    current_user: User = Depends(get_current_user)
+) -> ReservationResponse:
+    try:
+        created = service.reserve(
+            product_id=product_id,
+            quantity=reservation.quantity,
+            ttl_seconds=reservation.ttl_seconds
+        )
+        return ReservationResponse.model_validate(created)
+    
+    except (ProductNotFoundError, InvalidAmountError, InsufficientStockError) as e:
+        raise handle_service_error(e)
+
+
+@router.get(
+    "/{product_id}/availability",
+    response_model=StockAvailability,
+    summary="Get available-to-sell stock",
+    responses={
+        200: {"description": "Available stock"},
+        404: {"model": ErrorResponse, "description": "Product not found"}
+    }
+)
+def get_availability(
+    product_id: int,
+    service: ReservationService = Depends(get_reservation_service),
+    current_user: User = Depends(get_current_user)
+) -> StockAvailability:
+    try:
+        available = service.get_available_stock(product_id)
+        return StockAvailability(product_id=product_id, available=available)
+    
+    except ProductNotFoundError as e:
+        raise handle_service_error(e)
+
+
+@router.post(
+    "/{product_id}/reservations/{reservation_id}/commit",
+    response_model=ReservationResponse,
+    summary="Commit a reservation and decrement on-hand stock",
+    responses={
+        200: {"description": "Reservation committed"},
+        400: {"model": ErrorResponse, "description": "Insufficient on-hand stock"},
+        404: {"model": ErrorResponse, "description": "Reservation not found"},
+        409: {"model": ErrorResponse, "description": "Reservation is no longer active"}
+    }
+)
+def commit_reservation(
+    product_id: int,
+    reservation_id: int,
+    service: ReservationService = Depends(get_reservation_service),
+    current_user: User = Depends(get_current_user)
+) -> ReservationResponse:
+    try:
+        committed = service.commit(product_id, reservation_id)
+        return ReservationResponse.model_validate(committed)
+    
+    except (ReservationNotFoundError, ReservationStateError, InsufficientStockError) as e:
+        raise handle_service_error(e)
+
+
+@router.post(
+    "/{product_id}/reservations/{reservation_id}/release",
+    response_model=ReservationResponse,
+    summary="Release a reservation without touching on-hand stock",
+    responses={
+        200: {"description": "Reservation released"},
+        404: {"model": ErrorResponse, "description": "Reservation not found"},
+        409: {"model": ErrorResponse, "description": "Reservation is no longer active"}
+    }
+)
+def release_reservation(
+    product_id: int,
+    reservation_id: int,
+    service: ReservationService = Depends(get_reservation_service),
+    current_user: User = Depends(get_current_user)
+) -> ReservationResponse:
+    try:
+        released = service.release(product_id, reservation_id)
+        return ReservationResponse.model_validate(released)
+    
+    except (ReservationNotFoundError, ReservationStateError) as e:
+        raise handle_service_error(e)
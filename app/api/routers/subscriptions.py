@@ -0,0 +1,145 @@
+import asyncio
+import json
+from typing import List, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.websockets import WebSocketDisconnect
+from app.api.dependency_factories import (
+    get_product_read_service,
+    get_current_user,
+    get_websocket_user,
+    stock_broadcaster
+)
+from app.api.schemas import ErrorResponse
+from app.core.config import settings
+from app.domain.services import ProductService
+from app.domain.user_models import User
+from app.infrastructure.database import get_read_db
+from app.infrastructure.stock_broadcaster import StockSubscription, stock_event
+
+
+router = APIRouter(prefix="/subscriptions", tags=["Subscriptions"])
+
+WS_CLOSE_TRY_AGAIN_LATER = 1013
+
+
+async def _subscribe(
+    service: ProductService,
+    db: Session,
+    product_ids: List[int],
+    skus: List[str]
+) -> Tuple[StockSubscription, dict]:
+    if not product_ids and not skus:
+        raise ValueError("Subscribe to at least one product_id or sku")
+    if len(product_ids) + len(skus) > settings.STREAM_MAX_PRODUCTS:
+        raise ValueError(f"At most {settings.STREAM_MAX_PRODUCTS} products per subscription")
+    
+    products, missing = await run_in_threadpool(service.find_products, product_ids, skus)
+    await run_in_threadpool(db.close)
+    
+    subscription = stock_broadcaster.subscribe(products)
+    snapshot = {
+        "type": "subscribed",
+        "products": [stock_event(product, None, "snapshot") for product in products],
+        "missing": missing
+    }
+    return subscription, snapshot
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _stream_events(subscription: StockSubscription, snapshot: dict):
+    try:
+        yield _sse("subscribed", snapshot)
+        while True:
+            try:
+                event = await subscription.next_event(settings.STREAM_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if event is None:
+                yield _sse("dropped", {"type": "dropped", "reason": "slow consumer"})
+                return
+            yield _sse(event["type"], event)
+    finally:
+        stock_broadcaster.unsubscribe(subscription)
+
+
+@router.get(
+    "/stock",
+    summary="Stream stock changes (Server-Sent Events)",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Event stream"},
+        400: {"model": ErrorResponse, "description": "No or too many products requested"}
+    }
+)
+async def stream_stock(
+    product_id: List[int] = Query([], description="Product IDs to watch"),
+    sku: List[str] = Query([], description="SKUs to watch"),
+    service: ProductService = Depends(get_product_read_service),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+) -> StreamingResponse:
+    try:
+        subscription, snapshot = await _subscribe(service, db, product_id, sku)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return StreamingResponse(
+        _stream_events(subscription, snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/stock/ws")
+async def websocket_stock(
+    websocket: WebSocket,
+    product_id: List[int] = Query([]),
+    sku: List[str] = Query([]),
+    service: ProductService = Depends(get_product_read_service),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_websocket_user)
+) -> None:
+    try:
+        subscription, snapshot = await _subscribe(service, db, product_id, sku)
+    except ValueError as e:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(e))
+        return
+    
+    await websocket.accept()
+    receiver = asyncio.ensure_future(_drain_client(websocket))
+    try:
+        await websocket.send_json(snapshot)
+        while not receiver.done():
+            event_task = asyncio.ensure_future(subscription.next_event())
+            done, _ = await asyncio.wait(
+                {event_task, receiver},
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            if event_task not in done:
+                event_task.cancel()
+                break
+            event = event_task.result()
+            if event is None:
+                await websocket.close(code=WS_CLOSE_TRY_AGAIN_LATER, reason="slow consumer")
+                break
+            await websocket.send_json(event)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
+        stock_broadcaster.unsubscribe(subscription)
+
+
+async def _drain_client(websocket: WebSocket) -> None:
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
@@ -4,8 +4,32 @@ from app.api.schemas.products import (
     ProductUpdate,
     ProductResponse,
     StockAdjustment,
+    ProductLookupRequest,
+    ProductLookupResponse,
+    ProductChangeResponse,
+    ProductChangeFeed,
     ErrorResponse
 )
+from app.api.schemas.locations import (
+    LocationStockResponse,
+    StockBreakdownResponse,
+    LocationAdjustmentResponse
+)
+from app.api.schemas.reservations import (
+    ReservationCreate,
+    ReservationResponse,
+    StockAvailability
+)
+from app.api.schemas.allocations import (
+    AllocationLineRequest,
+    AllocationRequest,
+    AllocatedLineResponse,
+    AllocationResponse,
+    ShortfallResponse,
+    AllocationShortfallResponse
+)
+from app.api.schemas.inventory import InventorySummaryResponse
+from app.api.schemas.jobs import ProductImportRequest, JobResponse
 
 __all__ = [
     "ProductBase",
@@ -13,5 +37,24 @@ __all__ = [
     "ProductUpdate",
     "ProductResponse",
     "StockAdjustment",
-    "ErrorResponse"
+    "ProductLookupRequest",
+    "ProductLookupResponse",
+    "ProductChangeResponse",
+    "ProductChangeFeed",
+    "ErrorResponse",
+    "ReservationCreate",
+    "ReservationResponse",
+    "StockAvailability",
+    "LocationStockResponse",
+    "StockBreakdownResponse",
+    "LocationAdjustmentResponse",
+    "AllocationLineRequest",
+    "AllocationRequest",
+    "AllocatedLineResponse",
+    "AllocationResponse",
+    "ShortfallResponse",
+    "AllocationShortfallResponse",
+    "InventorySummaryResponse",
+    "ProductImportRequest",
+    "JobResponse"
 ]
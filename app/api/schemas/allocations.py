@@ -0,0 +1,71 @@
+from typing import List
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class AllocationLineRequest(BaseModel):
+    product_id: int = Field(..., gt=0, description="Product to take stock from")
+    quantity: int = Field(default=1, gt=0, description="Units to take")
+
+
+class AllocationRequest(BaseModel):
+    lines: List[AllocationLineRequest] = Field(
+        ...,
+        min_length=1,
+        description="Order lines; repeated products are summed"
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "lines": [
+                    {"product_id": 1, "quantity": 2},
+                    {"product_id": 7, "quantity": 1}
+                ]
+            }
+        }
+    )
+
+
+class AllocatedLineResponse(BaseModel):
+    product_id: int = Field(..., description="Product")
+    sku: str = Field(..., description="Product SKU")
+    quantity: int = Field(..., description="Units taken")
+    stock: int = Field(..., description="Product stock after the allocation")
+    version: int = Field(..., description="Product row version after the allocation")
+
+
+class AllocationResponse(BaseModel):
+    lines: List[AllocatedLineResponse] = Field(..., description="One entry per product, in request order")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "lines": [
+                    {"product_id": 1, "sku": "IP16-256-BLK", "quantity": 2, "stock": 18, "version": 4},
+                    {"product_id": 7, "sku": "USB-C-1M", "quantity": 1, "stock": 40, "version": 2}
+                ]
+            }
+        }
+    )
+
+
+class ShortfallResponse(BaseModel):
+    product_id: int = Field(..., description="Product that cannot be filled")
+    requested: int = Field(..., description="Units requested")
+    available: int = Field(..., description="Unassigned units available")
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AllocationShortfallResponse(BaseModel):
+    detail: str = Field(..., description="Error message")
+    shortfalls: List[ShortfallResponse] = Field(..., description="Lines that cannot be filled")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "detail": "Insufficient stock for 1 allocation line",
+                "shortfalls": [{"product_id": 7, "requested": 3, "available": 1}]
+            }
+        }
+    )
@@ -0,0 +1,22 @@
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class InventorySummaryResponse(BaseModel):
+    total_skus: int = Field(..., description="Number of products")
+    total_units: int = Field(..., description="Sum of product stock")
+    out_of_stock: int = Field(..., description="Products with no stock")
+    low_stock: int = Field(..., description="Products in stock but below the low-stock threshold")
+    low_stock_threshold: int = Field(..., description="Stock below this counts as low")
+    
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "total_skus": 1250,
+                "total_units": 48210,
+                "out_of_stock": 17,
+                "low_stock": 64,
+                "low_stock_threshold": 10
+            }
+        }
+    )
@@ -0,0 +1,54 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field, ConfigDict
+from app.api.schemas.products import ProductCreate
+
+
+class ProductImportRequest(BaseModel):
+    products: List[ProductCreate] = Field(..., min_length=1, description="Products to create; existing SKUs are skipped")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "products": [
+                    {"name": "Apple iPhone 16", "sku": "IP16-256-BLK", "stock": 20},
+                    {"name": "Apple iPhone 16", "sku": "IP16-256-WHT", "stock": 12}
+                ]
+            }
+        }
+    )
+
+
+class JobResponse(BaseModel):
+    id: int = Field(..., description="Unique job identifier")
+    kind: str = Field(..., description="products.import, products.export or inventory.reconcile")
+    status: str = Field(..., description="queued, running, succeeded or failed")
+    progress_done: int = Field(..., description="Units of work completed")
+    progress_total: Optional[int] = Field(None, description="Total units of work, once known")
+    attempts: int = Field(..., description="Times a worker has picked the job up")
+    error: Optional[str] = Field(None, description="Last failure, if any")
+    result: Optional[Dict[str, Any]] = Field(None, description="Result summary once succeeded")
+    created_by: Optional[str] = Field(None, description="User who submitted the job")
+    created_at: datetime = Field(..., description="Submission timestamp")
+    started_at: Optional[datetime] = Field(None, description="First pick-up timestamp")
+    finished_at: Optional[datetime] = Field(None, description="Completion timestamp")
+    
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "id": 7,
+                "kind": "products.import",
+                "status": "running",
+                "progress_done": 1500,
+                "progress_total": 4000,
+                "attempts": 1,
+                "error": None,
+                "result": {"created": 1490, "skipped": 10},
+                "created_by": "alice",
+                "created_at": "2025-01-15T10:30:00Z",
+                "started_at": "2025-01-15T10:30:01Z",
+                "finished_at": None
+            }
+        }
+    )
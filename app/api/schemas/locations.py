@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import List
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class LocationStockResponse(BaseModel):
+    location: str = Field(..., description="Location code (store or warehouse)")
+    stock: int = Field(..., description="Units on hand at this location")
+    updated_at: datetime = Field(..., description="Last change at this location")
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class StockBreakdownResponse(BaseModel):
+    product_id: int = Field(..., description="Product")
+    total_stock: int = Field(..., description="Product-level stock (all locations plus unassigned)")
+    unassigned_stock: int = Field(..., description="Stock not held at any location")
+    locations: List[LocationStockResponse] = Field(..., description="Per-location stock")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "product_id": 1,
+                "total_stock": 25,
+                "unassigned_stock": 5,
+                "locations": [
+                    {"location": "STORE-01", "stock": 12, "updated_at": "2025-01-15T10:30:00Z"},
+                    {"location": "STORE-02", "stock": 8, "updated_at": "2025-01-15T10:31:00Z"}
+                ]
+            }
+        }
+    )
+
+
+class LocationAdjustmentResponse(BaseModel):
+    product_id: int = Field(..., description="Product")
+    location: str = Field(..., description="Location code")
+    stock: int = Field(..., description="Units now at this location")
+    total_stock: int = Field(..., description="Product-level stock after the change")
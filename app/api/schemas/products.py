@@ -1,6 +1,7 @@
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field, ConfigDict
+from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+from app.core.config import settings
 
 
 class ProductBase(BaseModel):
@@ -39,6 +40,7 @@ class ProductResponse(ProductBase):
     id: int = Field(..., description="Unique product identifier")
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
+    version: int = Field(..., description="Row version, also sent as the ETag")
     
     model_config = ConfigDict(
         from_attributes=True,
@@ -49,7 +51,8 @@ class ProductResponse(ProductBase):
                 "sku": "IP16-256-BLK",
                 "stock": 20,
                 "created_at": "2025-01-15T10:30:00Z",
-                "updated_at": "2025-01-15T10:30:00Z"
+                "updated_at": "2025-01-15T10:30:00Z",
+                "version": 3
             }
         }
     )
@@ -67,6 +70,75 @@ class StockAdjustment(BaseModel):
     )
 
 
+class ProductLookupRequest(BaseModel):
+    ids: List[int] = Field(default_factory=list, description="Product IDs to resolve")
+    skus: List[str] = Field(default_factory=list, description="SKUs to resolve (case-insensitive)")
+    
+    @model_validator(mode="after")
+    def check_key_count(self) -> "ProductLookupRequest":
+        total = len(self.ids) + len(self.skus)
+        if total == 0:
+            raise ValueError("Provide at least one id or sku")
+        if total > settings.PRODUCT_LOOKUP_MAX_KEYS:
+            raise ValueError(f"At most {settings.PRODUCT_LOOKUP_MAX_KEYS} keys per lookup")
+        return self
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "ids": [1, 2],
+                "skus": ["IP16-256-BLK", "MISSING-SKU"]
+            }
+        }
+    )
+
+
+class ProductLookupResponse(BaseModel):
+    products: List[ProductResponse] = Field(..., description="Found products, ids first then skus, in request order")
+    missing_ids: List[int] = Field(..., description="Requested IDs with no product")
+    missing_skus: List[str] = Field(..., description="Requested SKUs with no product")
+
+
+class ProductChangeResponse(BaseModel):
+    seq: int = Field(..., description="Change sequence number")
+    op: str = Field(..., description="upsert or delete")
+    product_id: int = Field(..., description="Changed product")
+    sku: str = Field(..., description="Stock Keeping Unit")
+    product: Optional[ProductResponse] = Field(None, description="Current state, absent for deletes")
+
+
+class ProductChangeFeed(BaseModel):
+    changes: List[ProductChangeResponse] = Field(..., description="Changes ordered by sequence")
+    cursor: int = Field(..., description="Pass as `since` to continue after these changes")
+    has_more: bool = Field(..., description="More changes are immediately available")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "changes": [
+                    {
+                        "seq": 41,
+                        "op": "upsert",
+                        "product_id": 1,
+                        "sku": "IP16-256-BLK",
+                        "product": {
+                            "id": 1,
+                            "name": "Apple iPhone 16",
+                            "sku": "IP16-256-BLK",
+                            "stock": 18,
+                            "created_at": "2025-01-15T10:30:00Z",
+                            "updated_at": "2025-01-15T11:02:00Z"
+                        }
+                    },
+                    {"seq": 42, "op": "delete", "product_id": 7, "sku": "OLD-001", "product": None}
+                ],
+                "cursor": 42,
+                "has_more": False
+            }
+        }
+    )
+
+
 class ErrorResponse(BaseModel):
     detail: str = Field(..., description="Error message")
     
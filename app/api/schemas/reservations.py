@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class ReservationCreate(BaseModel):
+    quantity: int = Field(default=1, gt=0, description="Units to hold")
+    ttl_seconds: Optional[int] = Field(
+        None,
+        gt=0,
+        description="Seconds until the hold expires (server default if omitted)"
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "quantity": 2,
+                "ttl_seconds": 600
+            }
+        }
+    )
+
+
+class ReservationResponse(BaseModel):
+    id: int = Field(..., description="Unique reservation identifier")
+    product_id: int = Field(..., description="Reserved product")
+    quantity: int = Field(..., description="Units held")
+    status: str = Field(..., description="active, committed, released or expired")
+    expires_at: datetime = Field(..., description="Expiry timestamp (UTC)")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "id": 1,
+                "product_id": 1,
+                "quantity": 2,
+                "status": "active",
+                "expires_at": "2025-01-15T10:40:00Z",
+                "created_at": "2025-01-15T10:30:00Z"
+            }
+        }
+    )
+
+
+class StockAvailability(BaseModel):
+    product_id: int = Field(..., description="Product identifier")
+    available: int = Field(..., description="On-hand stock minus active reservations")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "product_id": 1,
+                "available": 18
+            }
+        }
+    )
@@ -7,6 +7,79 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     API_V1_PREFIX: str = "/api/v1"
     DATABASE_URL: str = "postgresql://postgres:postgres@db:5432/storedb"
+    READ_DATABASE_URLS: str = ""
+    READ_REPLICA_EJECT_SECONDS: float = 30.0
+    READ_YOUR_WRITES_SECONDS: float = 5.0
+    READ_YOUR_WRITES_COOKIE: str = "rw_pin"
+    DB_AUTO_CREATE_TABLES: bool = False
+    DB_SCHEMA_CHECK_STRICT: bool = False
+    SQLITE_PROFILE_ENABLED: bool = True
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_PRAGMAS: str = "cache_size=-65536,temp_store=MEMORY"
+    SQLITE_READ_POOL_SIZE: int = 8
+    SQLITE_WRITE_TIMEOUT_SECONDS: float = 30.0
+    CACHE_INVALIDATION_BUS: str = "memory"
+    CACHE_TTL_SECONDS: float = 30.0
+    CACHE_MAX_ENTRIES: int = 10000
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_MAX_CONCURRENCY: int = 40
+    ADMISSION_HEALTH_RESERVED: int = 2
+    ADMISSION_AUTH_RESERVED: int = 4
+    ADMISSION_MAX_QUEUE: int = 256
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 1.0
+    ADMISSION_POOL_WAIT_THRESHOLD_SECONDS: float = 0.5
+    ADMISSION_POOL_WAIT_WINDOW_SECONDS: float = 5.0
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
+    RATE_LIMIT_PER_SECOND: float = 20.0
+    RATE_LIMIT_BURST: int = 40
+    HEALTH_CHECK_INTERVAL_SECONDS: float = 5.0
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = 2.0
+    HEALTH_ERROR_WINDOW_SECONDS: float = 60.0
+    ACCESS_LOG_ENABLED: bool = True
+    ACCESS_LOG_SAMPLE_RATE: float = 0.1
+    ACCESS_LOG_SLOW_MS: float = 500.0
+    ACCESS_LOG_QUEUE_SIZE: int = 10000
+    CAPTURE_ENABLED: bool = False
+    CAPTURE_PATH: str = "captures/traffic.ndjson"
+    CAPTURE_SAMPLE_RATE: float = 0.1
+    CAPTURE_MAX_BYTES: int = 50 * 1024 * 1024
+    CAPTURE_BACKUP_COUNT: int = 5
+    CAPTURE_BODIES: bool = False
+    CAPTURE_MAX_BODY_BYTES: int = 4096
+    ALLOCATION_MAX_LINES: int = 100
+    PRODUCT_LOOKUP_MAX_KEYS: int = 500
+    PRODUCT_EXPORT_BATCH_SIZE: int = 500
+    LOW_STOCK_THRESHOLD: int = 10
+    INVENTORY_SUMMARY_SHARDS: int = 16
+    INVENTORY_RECONCILE_INTERVAL_SECONDS: float = 300.0
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_ENCODINGS: str = "br,zstd,gzip"
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_CONTENT_TYPES: str = "application/json,application/x-ndjson,text/csv,text/plain"
+    COMPRESSION_GZIP_LEVEL: int = 4
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    CHANGE_FEED_MAX_LIMIT: int = 1000
+    CHANGE_FEED_MAX_WAIT_SECONDS: float = 30.0
+    CHANGE_FEED_POLL_SECONDS: float = 1.0
+    STREAM_QUEUE_SIZE: int = 64
+    STREAM_KEEPALIVE_SECONDS: float = 15.0
+    STREAM_MAX_PRODUCTS: int = 200
+    RESERVATION_DEFAULT_TTL_SECONDS: int = 900
+    RESERVATION_MAX_TTL_SECONDS: int = 86400
+    RESERVATION_SWEEP_INTERVAL_SECONDS: float = 30.0
+    RESERVATION_SWEEP_BATCH_SIZE: int = 500
+    JOBS_ENABLED: bool = True
+    JOB_WORKERS: int = 2
+    JOB_POLL_INTERVAL_SECONDS: float = 5.0
+    JOB_LEASE_SECONDS: float = 60.0
+    JOB_CHUNK_SIZE: int = 500
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_IMPORT_MAX_ITEMS: int = 10000
+    JOB_EXPORT_DIR: str = "exports"
     
     class Config:
         env_file = ".env"
@@ -37,5 +37,61 @@ class InvalidAmountError(ProductServiceError):
         super().__init__(f"Invalid amount {amount}: {reason}")
 
 
+class VersionConflictError(ProductServiceError):
+    def __init__(self, product_id: int, expected_version: int, current_version: int):
+        self.product_id = product_id
+        self.expected_version = expected_version
+        self.current_version = current_version
+        super().__init__(
+            f"Product {product_id} was modified concurrently: "
+            f"expected version {expected_version}, current version {current_version}"
+        )
+
+
+class PreconditionFailedError(VersionConflictError):
+    pass
+
+
+class AllocationShortfallError(ProductServiceError):
+    def __init__(self, shortfalls: list):
+        self.shortfalls = shortfalls
+        super().__init__(
+            f"Insufficient stock for {len(shortfalls)} allocation "
+            f"line{'s' if len(shortfalls) != 1 else ''}"
+        )
+
+
 class ValidationError(ApplicationError):
     pass
+
+
+class ReservationNotFoundError(ProductServiceError):
+    def __init__(self, reservation_id: int):
+        self.reservation_id = reservation_id
+        super().__init__(f"Reservation with ID {reservation_id} not found")
+
+
+class ReservationStateError(ProductServiceError):
+    def __init__(self, reservation_id: int, status: str):
+        self.reservation_id = reservation_id
+        self.status = status
+        super().__init__(f"Reservation {reservation_id} is {status}")
+
+
+class JobNotFoundError(ApplicationError):
+    def __init__(self, job_id: int):
+        self.job_id = job_id
+        super().__init__(f"Job with ID {job_id} not found")
+
+
+class JobStateError(ApplicationError):
+    def __init__(self, job_id: int, status: str):
+        self.job_id = job_id
+        self.status = status
+        super().__init__(f"Job {job_id} is {status}")
+
+
+class JobLeaseLostError(ApplicationError):
+    def __init__(self, job_id: int):
+        self.job_id = job_id
+        super().__init__(f"Lease on job {job_id} was taken over by another worker")
@@ -0,0 +1,96 @@
+import threading
+from typing import Dict
+
+
+class Counter:
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+    
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+    
+    @property
+    def value(self) -> int:
+        return self._value
+    
+    def snapshot(self) -> int:
+        return self._value
+
+
+class Gauge:
+    def __init__(self):
+        self._value = 0.0
+    
+    def set(self, value: float) -> None:
+        self._value = value
+    
+    @property
+    def value(self) -> float:
+        return self._value
+    
+    def snapshot(self) -> float:
+        return self._value
+
+
+class Summary:
+    def __init__(self):
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+        self._last = 0.0
+        self._lock = threading.Lock()
+    
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._count += 1
+            self._total += value
+            self._last = value
+            if value > self._max:
+                self._max = value
+    
+    @property
+    def count(self) -> int:
+        return self._count
+    
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "count": self._count,
+                "avg": self._total / self._count if self._count else 0.0,
+                "max": self._max,
+                "last": self._last
+            }
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+    
+    def counter(self, name: str) -> Counter:
+        return self._get(name, Counter)
+    
+    def gauge(self, name: str) -> Gauge:
+        return self._get(name, Gauge)
+    
+    def summary(self, name: str) -> Summary:
+        return self._get(name, Summary)
+    
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            items = sorted(self._metrics.items())
+        return {name: metric.snapshot() for name, metric in items}
+    
+    def _get(self, name: str, kind: type):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.setdefault(name, kind())
+        if not isinstance(metric, kind):
+            raise TypeError(f"Metric '{name}' is a {type(metric).__name__}")
+        return metric
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,42 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class RequestTimings:
+    def __init__(self):
+        self.db_seconds = 0.0
+        self.db_queries = 0
+        self.auth_seconds = 0.0
+        self.user: Optional[str] = None
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current.get()
+
+
+def begin_request() -> RequestTimings:
+    timings = RequestTimings()
+    _current.set(timings)
+    return timings
+
+
+@contextmanager
+def timed_auth() -> Iterator[None]:
+    timings = _current.get()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings.auth_seconds += time.perf_counter() - started
+
+
+def record_user(username: str) -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.user = username
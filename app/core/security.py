@@ -1,40 +1,173 @@
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+from app.core.metrics import metrics
 
 
 SECRET_KEY = os.getenv("SECRET_KEY", "09d25e094faa6ca2556c818166b7a9563b93f7099f6f0f4caa6cf63b88e8d3e7")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+DEFAULT_KID = "default"
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def parse_signing_keys(value: str) -> Dict[str, str]:
+    keys = {}
+    for item in value.split(","):
+        kid, _, secret = item.strip().partition(":")
+        if kid and secret:
+            keys[kid] = secret
+    return keys
+
+
+class VerifiedTokenCache:
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[dict, float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = metrics.counter("auth.token_cache.hits")
+        self._misses = metrics.counter("auth.token_cache.misses")
+    
+    def get(self, token: str) -> Optional[dict]:
+        digest = self._digest(token)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                claims, expires_at, _ = entry
+                if expires_at > time.time():
+                    self._entries.move_to_end(digest)
+                    self._hits.inc()
+                    return dict(claims)
+                del self._entries[digest]
+        self._misses.inc()
+        return None
+    
+    def put(self, token: str, claims: dict, kid: str) -> None:
+        expires_at = claims.get("exp")
+        if not isinstance(expires_at, (int, float)) or self.max_entries <= 0:
+            return
+        
+        digest = self._digest(token)
+        with self._lock:
+            self._entries.pop(digest, None)
+            self._entries[digest] = (dict(claims), float(expires_at), kid)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def drop_kids(self, kids: Iterable[str]) -> None:
+        kids = set(kids)
+        with self._lock:
+            for digest in [d for d, (_, _, kid) in self._entries.items() if kid in kids]:
+                del self._entries[digest]
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+
+class SigningKeyring:
+    def __init__(self, keys: Dict[str, str], active_kid: str, cache: VerifiedTokenCache):
+        self.cache = cache
+        self._lock = threading.Lock()
+        self.keys: Dict[str, str] = {}
+        self.active_kid = active_kid
+        self.rotate(keys, active_kid)
+    
+    def rotate(self, keys: Dict[str, str], active_kid: str) -> None:
+        if active_kid not in keys:
+            raise ValueError(f"Active signing key '{active_kid}' is not in the keyring")
+        
+        with self._lock:
+            changed = [
+                kid for kid, secret in self.keys.items()
+                if keys.get(kid) != secret
+            ]
+            self.keys = dict(keys)
+            self.active_kid = active_kid
+        self.cache.drop_kids(changed)
+    
+    def active(self) -> Tuple[str, str]:
+        kid = self.active_kid
+        return kid, self.keys[kid]
+    
+    def secret_for(self, kid: Optional[str]) -> Optional[str]:
+        return self.keys.get(kid or self.active_kid)
+
+
+token_cache = VerifiedTokenCache(int(os.getenv("JWT_CACHE_MAX_ENTRIES", "10000")))
+keyring = SigningKeyring(
+    parse_signing_keys(os.getenv("JWT_SIGNING_KEYS", "")) or {DEFAULT_KID: SECRET_KEY},
+    os.getenv("JWT_ACTIVE_KID", DEFAULT_KID),
+    token_cache
+)
+
+
+@lru_cache(maxsize=1)
+def get_pwd_context():
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+    from jose import jwt
+    
     to_encode = data.copy()
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    kid, secret = keyring.active()
+    encoded_jwt = jwt.encode(to_encode, secret, algorithm=ALGORITHM, headers={"kid": kid})
     return encoded_jwt
 
 
-def decode_access_token(token: str) -> Optional[dict]:
+def verify_access_token(token: str) -> Optional[Tuple[dict, str]]:
+    from jose import JWTError, jwt
+    
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        kid = jwt.get_unverified_header(token).get("kid") or keyring.active_kid
+        secret = keyring.secret_for(kid)
+        if secret is None:
+            return None
+        payload = jwt.decode(token, secret, algorithms=[ALGORITHM])
     except JWTError:
         return None
+    
+    if keyring.secret_for(kid) != secret:
+        return None
+    return payload, kid
+
+
+def decode_access_token(token: str) -> Optional[dict]:
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload
+    
+    verified = verify_access_token(token)
+    if verified is None:
+        return None
+    
+    payload, kid = verified
+    token_cache.put(token, payload, kid)
+    return payload
 
@@ -0,0 +1,75 @@
+from typing import List
+from app.domain.models import Product
+
+
+class AllocationLine:
+    def __init__(self, product_id: int, quantity: int):
+        self._product_id = product_id
+        self._quantity = quantity
+    
+    @property
+    def product_id(self) -> int:
+        return self._product_id
+    
+    @property
+    def quantity(self) -> int:
+        return self._quantity
+    
+    def __repr__(self) -> str:
+        return f"AllocationLine(product_id={self._product_id}, quantity={self._quantity})"
+
+
+class Shortfall:
+    def __init__(self, product_id: int, requested: int, available: int):
+        self._product_id = product_id
+        self._requested = requested
+        self._available = available
+    
+    @property
+    def product_id(self) -> int:
+        return self._product_id
+    
+    @property
+    def requested(self) -> int:
+        return self._requested
+    
+    @property
+    def available(self) -> int:
+        return self._available
+    
+    @property
+    def missing(self) -> int:
+        return self._requested - self._available
+    
+    def __repr__(self) -> str:
+        return (
+            f"Shortfall(product_id={self._product_id}, "
+            f"requested={self._requested}, available={self._available})"
+        )
+
+
+class AllocatedLine:
+    def __init__(self, line: AllocationLine, product: Product):
+        self._line = line
+        self._product = product
+    
+    @property
+    def product_id(self) -> int:
+        return self._line.product_id
+    
+    @property
+    def quantity(self) -> int:
+        return self._line.quantity
+    
+    @property
+    def product(self) -> Product:
+        return self._product
+
+
+class Allocation:
+    def __init__(self, lines: List[AllocatedLine]):
+        self._lines = lines
+    
+    @property
+    def lines(self) -> List[AllocatedLine]:
+        return self._lines
@@ -0,0 +1,41 @@
+from typing import Dict, Optional, Sequence, Tuple
+from app.domain.interfaces import IAllocationRepository, IStockEventPublisher
+from app.domain.allocation_models import Allocation, AllocatedLine, AllocationLine
+from app.core.exceptions import InvalidAmountError
+
+
+class AllocationService:
+    def __init__(
+        self,
+        repository: IAllocationRepository,
+        events: Optional[IStockEventPublisher] = None,
+        max_lines: int = 100
+    ):
+        self.repository = repository
+        self.events = events
+        self.max_lines = max_lines
+    
+    def allocate(self, lines: Sequence[Tuple[int, int]]) -> Allocation:
+        if not lines:
+            raise InvalidAmountError(0, "An allocation needs at least one line")
+        
+        quantities: Dict[int, int] = {}
+        for product_id, quantity in lines:
+            if quantity <= 0:
+                raise InvalidAmountError(quantity, "Allocation quantity must be positive")
+            quantities[product_id] = quantities.get(product_id, 0) + quantity
+        
+        if len(quantities) > self.max_lines:
+            raise InvalidAmountError(
+                len(quantities),
+                f"An allocation can include at most {self.max_lines} products"
+            )
+        
+        merged = [AllocationLine(product_id, quantity) for product_id, quantity in quantities.items()]
+        products = {product.id: product for product in self.repository.allocate(merged)}
+        
+        allocated = [AllocatedLine(line, products[line.product_id]) for line in merged]
+        if self.events is not None:
+            for line in allocated:
+                self.events.publish(line.product, -line.quantity)
+        return Allocation(allocated)
@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from app.domain.models import Product
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from app.domain.models import Product, ProductChange
 from app.domain.user_models import User
+from app.domain.reservation_models import Reservation
+from app.domain.location_models import LocationStock, StockBreakdown
+from app.domain.allocation_models import AllocationLine
+from app.domain.inventory_models import InventorySummary
+from app.domain.job_models import Job
 
 
 class IProductRepository(ABC):
@@ -17,17 +23,43 @@ class IProductRepository(ABC):
     def get_by_sku(self, sku: str) -> Optional[Product]:
         pass
     
+    @abstractmethod
+    def get_many_by_ids(self, product_ids: Sequence[int]) -> List[Product]:
+        pass
+    
+    @abstractmethod
+    def get_many_by_skus(self, skus: Sequence[str]) -> List[Product]:
+        pass
+    
     @abstractmethod
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Product]:
         pass
     
+    @abstractmethod
+    def get_page(self, after_id: int = 0, limit: int = 100) -> List[Product]:
+        pass
+    
     @abstractmethod
     def update(self, product: Product) -> Product:
         pass
     
+    @abstractmethod
+    def adjust_stock(self, product_id: int, delta: int) -> Product:
+        pass
+    
     @abstractmethod
     def delete(self, product_id: int) -> bool:
         pass
+    
+    @abstractmethod
+    def get_changes(self, since: int, limit: int = 100) -> List[ProductChange]:
+        pass
+
+class IStockEventPublisher(ABC):
+    @abstractmethod
+    def publish(self, product: Product, delta: Optional[int] = None) -> None:
+        pass
+
 
 class IUserRepository(ABC):
     @abstractmethod
@@ -42,3 +74,65 @@ class IUserRepository(ABC):
     @abstractmethod
     def create(self, user: User) -> User:
         pass
+
+
+class IReservationRepository(ABC):
+    @abstractmethod
+    def create(self, reservation: Reservation) -> Reservation:
+        pass
+    
+    @abstractmethod
+    def get_by_id(self, reservation_id: int) -> Optional[Reservation]:
+        pass
+    
+    @abstractmethod
+    def get_available_stock(self, product_id: int) -> Optional[int]:
+        pass
+    
+    @abstractmethod
+    def commit(self, reservation: Reservation) -> Reservation:
+        pass
+    
+    @abstractmethod
+    def release(self, reservation: Reservation) -> Reservation:
+        pass
+    
+    @abstractmethod
+    def release_expired(self, now: datetime, batch_size: int) -> int:
+        pass
+
+
+class ILocationRepository(ABC):
+    @abstractmethod
+    def get_breakdown(self, product_id: int) -> Optional[StockBreakdown]:
+        pass
+    
+    @abstractmethod
+    def adjust(self, product_id: int, location: str, delta: int) -> Tuple[LocationStock, Product]:
+        pass
+
+
+class IAllocationRepository(ABC):
+    @abstractmethod
+    def allocate(self, lines: Sequence[AllocationLine]) -> List[Product]:
+        pass
+
+
+class IInventoryRepository(ABC):
+    @abstractmethod
+    def get_summary(self) -> InventorySummary:
+        pass
+    
+    @abstractmethod
+    def reconcile(self) -> InventorySummary:
+        pass
+
+
+class IJobRepository(ABC):
+    @abstractmethod
+    def create(self, job: Job) -> Job:
+        pass
+    
+    @abstractmethod
+    def get_by_id(self, job_id: int) -> Optional[Job]:
+        pass
@@ -0,0 +1,43 @@
+class InventorySummary:
+    def __init__(
+        self,
+        total_skus: int = 0,
+        total_units: int = 0,
+        out_of_stock: int = 0,
+        low_stock: int = 0,
+        low_stock_threshold: int = 10
+    ):
+        self._total_skus = total_skus
+        self._total_units = total_units
+        self._out_of_stock = out_of_stock
+        self._low_stock = low_stock
+        self._low_stock_threshold = low_stock_threshold
+    
+    @property
+    def total_skus(self) -> int:
+        return self._total_skus
+    
+    @property
+    def total_units(self) -> int:
+        return self._total_units
+    
+    @property
+    def out_of_stock(self) -> int:
+        return self._out_of_stock
+    
+    @property
+    def low_stock(self) -> int:
+        return self._low_stock
+    
+    @property
+    def low_stock_threshold(self) -> int:
+        return self._low_stock_threshold
+    
+    def is_zero(self) -> bool:
+        return not (self._total_skus or self._total_units or self._out_of_stock or self._low_stock)
+    
+    def __repr__(self) -> str:
+        return (
+            f"InventorySummary(total_skus={self._total_skus}, total_units={self._total_units}, "
+            f"out_of_stock={self._out_of_stock}, low_stock={self._low_stock})"
+        )
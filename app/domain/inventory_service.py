@@ -0,0 +1,10 @@
+from app.domain.interfaces import IInventoryRepository
+from app.domain.inventory_models import InventorySummary
+
+
+class InventoryService:
+    def __init__(self, repository: IInventoryRepository):
+        self.repository = repository
+    
+    def get_summary(self) -> InventorySummary:
+        return self.repository.get_summary()
@@ -0,0 +1,107 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+class Job:
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    
+    PRODUCT_IMPORT = "products.import"
+    PRODUCT_EXPORT = "products.export"
+    INVENTORY_RECONCILE = "inventory.reconcile"
+    
+    def __init__(
+        self,
+        id: Optional[int],
+        kind: str,
+        params: Optional[Dict[str, Any]] = None,
+        status: str = QUEUED,
+        cursor: Optional[Dict[str, Any]] = None,
+        progress_done: int = 0,
+        progress_total: Optional[int] = None,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+        attempts: int = 0,
+        created_by: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+        started_at: Optional[datetime] = None,
+        finished_at: Optional[datetime] = None
+    ):
+        self._id = id
+        self._kind = kind
+        self._params = params or {}
+        self._status = status
+        self._cursor = cursor
+        self._progress_done = progress_done
+        self._progress_total = progress_total
+        self._result = result
+        self._error = error
+        self._attempts = attempts
+        self._created_by = created_by
+        self._created_at = created_at or datetime.utcnow()
+        self._started_at = started_at
+        self._finished_at = finished_at
+    
+    @property
+    def id(self) -> Optional[int]:
+        return self._id
+    
+    @property
+    def kind(self) -> str:
+        return self._kind
+    
+    @property
+    def params(self) -> Dict[str, Any]:
+        return self._params
+    
+    @property
+    def status(self) -> str:
+        return self._status
+    
+    @property
+    def cursor(self) -> Optional[Dict[str, Any]]:
+        return self._cursor
+    
+    @property
+    def progress_done(self) -> int:
+        return self._progress_done
+    
+    @property
+    def progress_total(self) -> Optional[int]:
+        return self._progress_total
+    
+    @property
+    def result(self) -> Optional[Dict[str, Any]]:
+        return self._result
+    
+    @property
+    def error(self) -> Optional[str]:
+        return self._error
+    
+    @property
+    def attempts(self) -> int:
+        return self._attempts
+    
+    @property
+    def created_by(self) -> Optional[str]:
+        return self._created_by
+    
+    @property
+    def created_at(self) -> datetime:
+        return self._created_at
+    
+    @property
+    def started_at(self) -> Optional[datetime]:
+        return self._started_at
+    
+    @property
+    def finished_at(self) -> Optional[datetime]:
+        return self._finished_at
+    
+    def is_finished(self) -> bool:
+        return self._status in (self.SUCCEEDED, self.FAILED)
+    
+    def __repr__(self) -> str:
+        return f"Job(id={self._id}, kind='{self._kind}', status='{self._status}')"
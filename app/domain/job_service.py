@@ -0,0 +1,60 @@
+from typing import Any, Callable, Dict, Optional, Sequence
+from app.domain.job_models import Job
+from app.domain.interfaces import IJobRepository
+from app.core.exceptions import InvalidAmountError, JobNotFoundError, JobStateError
+
+
+class JobService:
+    def __init__(
+        self,
+        repository: IJobRepository,
+        notify: Optional[Callable[[], None]] = None,
+        import_max_items: int = 10000
+    ):
+        self.repository = repository
+        self.notify = notify
+        self.import_max_items = import_max_items
+    
+    def submit_product_import(
+        self,
+        products: Sequence[Dict[str, Any]],
+        created_by: Optional[str] = None
+    ) -> Job:
+        if not products:
+            raise InvalidAmountError(0, "An import needs at least one product")
+        
+        if len(products) > self.import_max_items:
+            raise InvalidAmountError(
+                len(products),
+                f"An import can include at most {self.import_max_items} products"
+            )
+        
+        return self._submit(Job.PRODUCT_IMPORT, {"products": list(products)}, created_by)
+    
+    def submit_product_export(self, created_by: Optional[str] = None) -> Job:
+        return self._submit(Job.PRODUCT_EXPORT, {}, created_by)
+    
+    def submit_inventory_reconcile(self, created_by: Optional[str] = None) -> Job:
+        return self._submit(Job.INVENTORY_RECONCILE, {}, created_by)
+    
+    def get_job(self, job_id: int) -> Job:
+        job = self.repository.get_by_id(job_id)
+        
+        if job is None:
+            raise JobNotFoundError(job_id)
+        
+        return job
+    
+    def get_result(self, job_id: int) -> Job:
+        job = self.get_job(job_id)
+        
+        if job.status != Job.SUCCEEDED:
+            raise JobStateError(job.id, job.status)
+        
+        return job
+    
+    def _submit(self, kind: str, params: Dict[str, Any], created_by: Optional[str]) -> Job:
+        job = self.repository.create(Job(id=None, kind=kind, params=params, created_by=created_by))
+        if self.notify is not None:
+            self.notify()
+        return job
@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import List, Optional
+
+
+class LocationStock:
+    def __init__(
+        self,
+        product_id: int,
+        location: str,
+        stock: int = 0,
+        updated_at: Optional[datetime] = None
+    ):
+        self._product_id = product_id
+        self._location = location
+        self._stock = stock
+        self._updated_at = updated_at or datetime.utcnow()
+    
+    @property
+    def product_id(self) -> int:
+        return self._product_id
+    
+    @property
+    def location(self) -> str:
+        return self._location
+    
+    @property
+    def stock(self) -> int:
+        return self._stock
+    
+    @property
+    def updated_at(self) -> datetime:
+        return self._updated_at
+    
+    def __repr__(self) -> str:
+        return (
+            f"LocationStock(product_id={self._product_id}, "
+            f"location='{self._location}', stock={self._stock})"
+        )
+
+
+class StockBreakdown:
+    def __init__(self, product_id: int, total: int, locations: List[LocationStock]):
+        self._product_id = product_id
+        self._total = total
+        self._locations = locations
+    
+    @property
+    def product_id(self) -> int:
+        return self._product_id
+    
+    @property
+    def total(self) -> int:
+        return self._total
+    
+    @property
+    def locations(self) -> List[LocationStock]:
+        return self._locations
+    
+    @property
+    def unassigned(self) -> int:
+        return self._total - sum(location.stock for location in self._locations)
@@ -0,0 +1,57 @@
+from typing import Optional, Tuple
+from app.domain.interfaces import ILocationRepository, IStockEventPublisher
+from app.domain.location_models import LocationStock, StockBreakdown
+from app.domain.models import Product
+from app.core.exceptions import ProductNotFoundError, InvalidAmountError
+
+
+class LocationService:
+    MAX_LOCATION_LENGTH = 64
+    
+    def __init__(
+        self,
+        repository: ILocationRepository,
+        events: Optional[IStockEventPublisher] = None
+    ):
+        self.repository = repository
+        self.events = events
+    
+    def get_breakdown(self, product_id: int) -> StockBreakdown:
+        breakdown = self.repository.get_breakdown(product_id)
+        
+        if breakdown is None:
+            raise ProductNotFoundError(product_id)
+        
+        return breakdown
+    
+    def increment_stock(
+        self,
+        product_id: int,
+        location: str,
+        amount: int = 1
+    ) -> Tuple[LocationStock, Product]:
+        if amount <= 0:
+            raise InvalidAmountError(amount, "Increment amount must be positive")
+        
+        return self._adjust(product_id, location, amount)
+    
+    def decrement_stock(
+        self,
+        product_id: int,
+        location: str,
+        amount: int = 1
+    ) -> Tuple[LocationStock, Product]:
+        if amount <= 0:
+            raise InvalidAmountError(amount, "Decrement amount must be positive")
+        
+        return self._adjust(product_id, location, -amount)
+    
+    def _adjust(self, product_id: int, location: str, delta: int) -> Tuple[LocationStock, Product]:
+        location = (location or "").strip().upper()
+        if not location or len(location) > self.MAX_LOCATION_LENGTH:
+            raise InvalidAmountError(0, f"Location must be 1-{self.MAX_LOCATION_LENGTH} characters")
+        
+        location_stock, product = self.repository.adjust(product_id, location, delta)
+        if self.events is not None:
+            self.events.publish(product, delta)
+        return location_stock, product
@@ -11,14 +11,17 @@ class Product:
         sku: str,
         stock: int = 0,
         created_at: Optional[datetime] = None,
-        updated_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None,
+        version: Optional[int] = None
     ):
         self._id = id
         self._name = name
         self._sku = sku
         self._stock = stock
+        self._persisted_stock = stock
         self._created_at = created_at or datetime.utcnow()
         self._updated_at = updated_at or datetime.utcnow()
+        self._version = version
     
     @property
     def id(self) -> Optional[int]:
@@ -36,6 +39,10 @@ class Product:
     def stock(self) -> int:
         return self._stock
     
+    @property
+    def persisted_stock(self) -> int:
+        return self._persisted_stock
+    
     @property
     def created_at(self) -> datetime:
         return self._created_at
@@ -44,6 +51,10 @@ class Product:
     def updated_at(self) -> datetime:
         return self._updated_at
     
+    @property
+    def version(self) -> Optional[int]:
+        return self._version
+    
     def increment_stock(self, amount: int) -> None:
         if amount <= 0:
             raise InvalidAmountError(
@@ -94,3 +105,41 @@ class Product:
         if not isinstance(other, Product):
             return False
         return self._id == other._id and self._sku == other._sku
+
+
+class ProductChange:
+    def __init__(
+        self,
+        seq: int,
+        product_id: int,
+        sku: str,
+        product: Optional[Product] = None
+    ):
+        self._seq = seq
+        self._product_id = product_id
+        self._sku = sku
+        self._product = product
+    
+    @property
+    def seq(self) -> int:
+        return self._seq
+    
+    @property
+    def product_id(self) -> int:
+        return self._product_id
+    
+    @property
+    def sku(self) -> str:
+        return self._sku
+    
+    @property
+    def product(self) -> Optional[Product]:
+        return self._product
+    
+    @property
+    def deleted(self) -> bool:
+        return self._product is None
+    
+    def __repr__(self) -> str:
+        operation = "delete" if self.deleted else "upsert"
+        return f"ProductChange(seq={self._seq}, product_id={self._product_id}, op={operation})"
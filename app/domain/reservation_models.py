@@ -0,0 +1,67 @@
+from datetime import datetime
+from typing import Optional
+
+
+class Reservation:
+    ACTIVE = "active"
+    COMMITTED = "committed"
+    RELEASED = "released"
+    EXPIRED = "expired"
+    
+    def __init__(
+        self,
+        id: Optional[int],
+        product_id: int,
+        quantity: int,
+        expires_at: datetime,
+        status: str = ACTIVE,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None
+    ):
+        self._id = id
+        self._product_id = product_id
+        self._quantity = quantity
+        self._expires_at = expires_at
+        self._status = status
+        self._created_at = created_at or datetime.utcnow()
+        self._updated_at = updated_at or datetime.utcnow()
+    
+    @property
+    def id(self) -> Optional[int]:
+        return self._id
+    
+    @property
+    def product_id(self) -> int:
+        return self._product_id
+    
+    @property
+    def quantity(self) -> int:
+        return self._quantity
+    
+    @property
+    def expires_at(self) -> datetime:
+        return self._expires_at
+    
+    @property
+    def status(self) -> str:
+        return self._status
+    
+    @property
+    def created_at(self) -> datetime:
+        return self._created_at
+    
+    @property
+    def updated_at(self) -> datetime:
+        return self._updated_at
+    
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        return self._expires_at <= (now or datetime.utcnow())
+    
+    def is_active(self, now: Optional[datetime] = None) -> bool:
+        return self._status == self.ACTIVE and not self.is_expired(now)
+    
+    def __repr__(self) -> str:
+        return (
+            f"Reservation(id={self._id}, product_id={self._product_id}, "
+            f"quantity={self._quantity}, status='{self._status}')"
+        )
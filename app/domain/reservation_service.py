@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from app.domain.reservation_models import Reservation
+from app.domain.interfaces import IReservationRepository
+from app.core.exceptions import (
+    ProductNotFoundError,
+    InvalidAmountError,
+    ReservationNotFoundError,
+    ReservationStateError
+)
+
+
+class ReservationService:
+    def __init__(
+        self,
+        repository: IReservationRepository,
+        default_ttl_seconds: int = 900,
+        max_ttl_seconds: int = 86400
+    ):
+        self.repository = repository
+        self.default_ttl_seconds = default_ttl_seconds
+        self.max_ttl_seconds = max_ttl_seconds
+    
+    def reserve(
+        self,
+        product_id: int,
+        quantity: int = 1,
+        ttl_seconds: Optional[int] = None
+    ) -> Reservation:
+        if quantity <= 0:
+            raise InvalidAmountError(quantity, "Reservation quantity must be positive")
+        
+        ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl_seconds
+        if ttl <= 0 or ttl > self.max_ttl_seconds:
+            raise InvalidAmountError(
+                ttl,
+                f"Reservation TTL must be between 1 and {self.max_ttl_seconds} seconds"
+            )
+        
+        reservation = Reservation(
+            id=None,
+            product_id=product_id,
+            quantity=quantity,
+            expires_at=datetime.utcnow() + timedelta(seconds=ttl)
+        )
+        
+        return self.repository.create(reservation)
+    
+    def get_reservation(self, product_id: int, reservation_id: int) -> Reservation:
+        reservation = self.repository.get_by_id(reservation_id)
+        
+        if not reservation or reservation.product_id != product_id:
+            raise ReservationNotFoundError(reservation_id)
+        
+        return reservation
+    
+    def get_available_stock(self, product_id: int) -> int:
+        available = self.repository.get_available_stock(product_id)
+        
+        if available is None:
+            raise ProductNotFoundError(product_id)
+        
+        return available
+    
+    def commit(self, product_id: int, reservation_id: int) -> Reservation:
+        reservation = self._get_active(product_id, reservation_id)
+        return self.repository.commit(reservation)
+    
+    def release(self, product_id: int, reservation_id: int) -> Reservation:
+        reservation = self._get_active(product_id, reservation_id)
+        return self.repository.release(reservation)
+    
+    def _get_active(self, product_id: int, reservation_id: int) -> Reservation:
+        reservation = self.get_reservation(product_id, reservation_id)
+        
+        if reservation.status != Reservation.ACTIVE:
+            raise ReservationStateError(reservation.id, reservation.status)
+        
+        if reservation.is_expired():
+            raise ReservationStateError(reservation.id, Reservation.EXPIRED)
+        
+        return reservation
@@ -1,17 +1,24 @@
-from typing import List, Optional
-from app.domain.models import Product
-from app.domain.interfaces import IProductRepository
+from typing import Iterator, List, Optional, Sequence, Tuple
+from app.domain.models import Product, ProductChange
+from app.domain.interfaces import IProductRepository, IStockEventPublisher
 from app.core.exceptions import (
     ProductNotFoundError,
     DuplicateSKUError,
     InvalidAmountError,
-    InsufficientStockError
+    InsufficientStockError,
+    VersionConflictError,
+    PreconditionFailedError
 )
 
 
 class ProductService:
-    def __init__(self, repository: IProductRepository):
+    def __init__(
+        self,
+        repository: IProductRepository,
+        events: Optional[IStockEventPublisher] = None
+    ):
         self.repository = repository
+        self.events = events
     
     def create_product(
         self, 
@@ -49,20 +56,77 @@ class ProductService:
         
         return product
     
+    def get_products_by_ids(self, product_ids: Sequence[int]) -> Tuple[List[Product], List[int]]:
+        keys = list(dict.fromkeys(product_ids))
+        found = {p.id: p for p in self.repository.get_many_by_ids(keys)}
+        
+        return (
+            [found[key] for key in keys if key in found],
+            [key for key in keys if key not in found]
+        )
+    
+    def get_products_by_skus(self, skus: Sequence[str]) -> Tuple[List[Product], List[str]]:
+        keys = list(dict.fromkeys(skus))
+        normalized = {key: key.strip().upper() for key in keys}
+        found = {
+            p.sku: p
+            for p in self.repository.get_many_by_skus(list(set(normalized.values())))
+        }
+        
+        return (
+            [found[normalized[key]] for key in keys if normalized[key] in found],
+            [key for key in keys if normalized[key] not in found]
+        )
+    
+    def find_products(
+        self,
+        product_ids: Sequence[int] = (),
+        skus: Sequence[str] = ()
+    ) -> Tuple[List[Product], List[str]]:
+        by_id, missing_ids = self.get_products_by_ids(product_ids)
+        by_sku, missing_skus = self.get_products_by_skus(skus)
+        products = {p.id: p for p in by_id + by_sku}
+        
+        return list(products.values()), [str(key) for key in missing_ids] + missing_skus
+    
     def get_all_products(
         self, 
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        after_id: Optional[int] = None
     ) -> List[Product]:
+        if after_id is not None:
+            return self.repository.get_page(after_id=after_id, limit=limit)
         return self.repository.get_all(skip=skip, limit=limit)
     
+    def iter_product_batches(self, batch_size: int = 500) -> Iterator[List[Product]]:
+        after_id = 0
+        while True:
+            batch = self.repository.get_page(after_id=after_id, limit=batch_size)
+            if batch:
+                yield batch
+            if len(batch) < batch_size:
+                return
+            after_id = batch[-1].id
+    
+    def get_changes(self, since: int = 0, limit: int = 100) -> List[ProductChange]:
+        if since < 0:
+            raise InvalidAmountError(since, "Change cursor cannot be negative")
+        
+        return self.repository.get_changes(since=since, limit=limit)
+    
     def update_product(
         self,
         product_id: int,
         name: Optional[str] = None,
-        stock: Optional[int] = None
+        stock: Optional[int] = None,
+        expected_version: Optional[int] = None
     ) -> Product:
         product = self.get_product_by_id(product_id)
+        previous_stock = product.stock
+        
+        if expected_version is not None and product.version != expected_version:
+            raise PreconditionFailedError(product_id, expected_version, product.version)
         
         if name is not None and (not name or not name.strip()):
             raise InvalidAmountError(0, "Product name cannot be empty")
@@ -75,7 +139,12 @@ class ProductService:
             stock=stock
         )
         
-        return self.repository.update(product)
+        try:
+            return self._save(product, previous_stock)
+        except VersionConflictError as e:
+            if expected_version is None:
+                raise
+            raise PreconditionFailedError(product_id, expected_version, e.current_version)
     
     def delete_product(self, product_id: int) -> None:
         product = self.get_product_by_id(product_id)
@@ -86,15 +155,29 @@ class ProductService:
         product_id: int, 
         amount: int = 1
     ) -> Product:
-        product = self.get_product_by_id(product_id)
-        product.increment_stock(amount)
-        return self.repository.update(product)
+        if amount <= 0:
+            raise InvalidAmountError(amount, "Increment amount must be positive")
+        
+        return self._adjust_stock(product_id, amount)
     
     def decrement_stock(
         self, 
         product_id: int, 
         amount: int = 1
     ) -> Product:
-        product = self.get_product_by_id(product_id)
-        product.decrement_stock(amount)
-        return self.repository.update(product)
+        if amount <= 0:
+            raise InvalidAmountError(amount, "Decrement amount must be positive")
+        
+        return self._adjust_stock(product_id, -amount)
+    
+    def _adjust_stock(self, product_id: int, delta: int) -> Product:
+        updated = self.repository.adjust_stock(product_id, delta)
+        if self.events is not None:
+            self.events.publish(updated, delta)
+        return updated
+    
+    def _save(self, product: Product, previous_stock: int) -> Product:
+        updated = self.repository.update(product)
+        if self.events is not None:
+            self.events.publish(updated, updated.stock - previous_stock)
+        return updated
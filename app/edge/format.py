@@ -0,0 +1,82 @@
+import os
+import struct
+import sys
+from array import array
+from typing import Callable, Iterable, Optional, Tuple
+
+
+SNAPSHOT_MAGIC = b"STKSNAP\x01"
+DELTA_MAGIC = b"STKDELT\x01"
+FORMAT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<8sHHIQQ")
+DELTA_HEADER = struct.Struct("<8sHHIQQ")
+DELTA_ENTRY = struct.Struct("<Hi")
+STOCK = struct.Struct("<i")
+DELETED = -1
+
+
+def encode_sku(sku: str) -> bytes:
+    return sku.strip().upper().encode("utf-8")
+
+
+def key_width_for(max_length: int) -> int:
+    return max(4, (max_length + 3) // 4 * 4)
+
+
+def write_snapshot(
+    path: str,
+    rows: Callable[[], Iterable[Tuple[str, int]]],
+    generation: int
+) -> int:
+    width = key_width_for(max((len(encode_sku(sku)) for sku, _ in rows()), default=0))
+    temporary = f"{path}.tmp"
+    
+    while True:
+        stocks = array("i")
+        previous = b""
+        with open(temporary, "wb") as output:
+            output.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, FORMAT_VERSION, width, 0, generation, 0))
+            for sku, stock in rows():
+                key = encode_sku(sku)
+                if len(key) > width:
+                    width = key_width_for(len(key))
+                    break
+                if key <= previous:
+                    raise ValueError(f"Snapshot rows must be sorted by unique SKU bytes, got {sku!r} after {previous!r}")
+                output.write(key.ljust(width, b"\0"))
+                stocks.append(stock)
+                previous = key
+            else:
+                if sys.byteorder != "little":
+                    stocks.byteswap()
+                stocks.tofile(output)
+                output.seek(0)
+                output.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, FORMAT_VERSION, width, 0, generation, len(stocks)))
+                output.flush()
+                os.fsync(output.fileno())
+                break
+    
+    os.replace(temporary, path)
+    return len(stocks)
+
+
+def write_delta(
+    path: str,
+    changes: Iterable[Tuple[str, Optional[int]]],
+    base_generation: int,
+    generation: int
+) -> int:
+    temporary = f"{path}.tmp"
+    count = 0
+    with open(temporary, "wb") as output:
+        output.write(DELTA_HEADER.pack(DELTA_MAGIC, FORMAT_VERSION, 0, 0, base_generation, generation))
+        for sku, stock in changes:
+            key = encode_sku(sku)
+            output.write(DELTA_ENTRY.pack(len(key), DELETED if stock is None else stock))
+            output.write(key)
+            count += 1
+        output.flush()
+        os.fsync(output.fileno())
+    
+    os.replace(temporary, path)
+    return count
@@ -0,0 +1,156 @@
+"""Look up stock levels from an edge snapshot without a database.
+
+Usage:
+    python -m app.edge.lookup stock.snap SKU-001 SKU-002
+    python -m app.edge.lookup stock.snap --delta stock.delta.000042 --delta stock.delta.000057 SKU-001
+
+The snapshot is memory-mapped and binary-searched in place, so opening it is
+constant time and resident memory only grows with the pages a lookup touches.
+Deltas written by ``python -m app.edge.export delta`` are applied in order on
+top; a delta whose base generation is newer than the current generation is a
+gap and is rejected, one that is already covered is skipped.
+"""
+import argparse
+import mmap
+import sys
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+from app.edge.format import (
+    DELETED,
+    DELTA_ENTRY,
+    DELTA_HEADER,
+    DELTA_MAGIC,
+    FORMAT_VERSION,
+    SNAPSHOT_HEADER,
+    SNAPSHOT_MAGIC,
+    STOCK,
+    encode_sku,
+)
+
+
+class StockSnapshot:
+    def __init__(self, path: str):
+        with open(path, "rb") as snapshot:
+            self._map = mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        magic, version, self.key_width, _, self.generation, self.count = SNAPSHOT_HEADER.unpack_from(self._map)
+        if magic != SNAPSHOT_MAGIC or version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} stock snapshot")
+        
+        self._keys = SNAPSHOT_HEADER.size
+        self._stocks = self._keys + self.count * self.key_width
+        if len(self._map) < self._stocks + self.count * STOCK.size:
+            self._map.close()
+            raise ValueError(f"{path} is truncated")
+    
+    def get(self, sku: str) -> Optional[int]:
+        key = encode_sku(sku)
+        if len(key) > self.key_width:
+            return None
+        key = key.ljust(self.key_width, b"\0")
+        
+        data, width, keys = self._map, self.key_width, self._keys
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            offset = keys + middle * width
+            candidate = data[offset:offset + width]
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return STOCK.unpack_from(data, self._stocks + middle * STOCK.size)[0]
+        return None
+    
+    def close(self) -> None:
+        self._map.close()
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __enter__(self) -> "StockSnapshot":
+        return self
+    
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def read_delta(path: str) -> Tuple[int, int, Iterator[Tuple[str, int]]]:
+    with open(path, "rb") as delta:
+        data = delta.read()
+    
+    magic, version, _, _, base_generation, generation = DELTA_HEADER.unpack_from(data)
+    if magic != DELTA_MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} stock delta")
+    
+    def entries() -> Iterator[Tuple[str, int]]:
+        offset = DELTA_HEADER.size
+        while offset < len(data):
+            length, stock = DELTA_ENTRY.unpack_from(data, offset)
+            offset += DELTA_ENTRY.size
+            yield data[offset:offset + length].decode("utf-8"), stock
+            offset += length
+    
+    return base_generation, generation, entries()
+
+
+class EdgeStockReader:
+    def __init__(self, snapshot_path: str, delta_paths: Sequence[str] = ()):
+        self.snapshot = StockSnapshot(snapshot_path)
+        self.generation = self.snapshot.generation
+        self._overlay: Dict[str, int] = {}
+        for path in delta_paths:
+            self.apply_delta(path)
+    
+    def apply_delta(self, path: str) -> bool:
+        base_generation, generation, entries = read_delta(path)
+        if generation <= self.generation:
+            return False
+        if base_generation > self.generation:
+            raise ValueError(
+                f"Delta {path} starts at generation {base_generation}, reader is at {self.generation}"
+            )
+        
+        for sku, stock in entries:
+            self._overlay[sku] = stock
+        self.generation = generation
+        return True
+    
+    def get(self, sku: str) -> Optional[int]:
+        key = sku.strip().upper()
+        stock = self._overlay.get(key)
+        if stock is None:
+            return self.snapshot.get(key)
+        return None if stock == DELETED else stock
+    
+    def close(self) -> None:
+        self.snapshot.close()
+    
+    def __enter__(self) -> "EdgeStockReader":
+        return self
+    
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("snapshot", help="snapshot file written by app.edge.export")
+    parser.add_argument("skus", nargs="+", help="SKUs to look up")
+    parser.add_argument("--delta", action="append", default=[], help="delta file to apply (repeatable, in order)")
+    args = parser.parse_args(argv)
+    
+    with EdgeStockReader(args.snapshot, args.delta) as reader:
+        print(f"generation {reader.generation}")
+        for sku in args.skus:
+            stock = reader.get(sku)
+            print(f"{sku}\t{'-' if stock is None else stock}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import json
+import logging
+import queue
+import sys
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.core.metrics import metrics
+from app.core.request_timing import current_timings
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "logger": record.name
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            payload.update(fields)
+        else:
+            payload["message"] = record.getMessage()
+        return json.dumps(payload, separators=(",", ":"), default=str)
+
+
+class DroppingQueueHandler(QueueHandler):
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self._dropped = metrics.counter("access_log.dropped")
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._dropped.inc()
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class AccessLogWriter:
+    def __init__(self, logger_name: str = "app.access", queue_size: int = 10000):
+        self.logger = logging.getLogger(logger_name)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self._queue: queue.Queue = queue.Queue(queue_size)
+        self._handler = DroppingQueueHandler(self._queue)
+        self._listener: Optional[QueueListener] = None
+    
+    def start(self, stream=None) -> None:
+        if self._listener is not None:
+            return
+        
+        output = logging.StreamHandler(stream or sys.stdout)
+        output.setFormatter(JSONFormatter())
+        self._listener = QueueListener(self._queue, output)
+        self._listener.start()
+        self.logger.addHandler(self._handler)
+    
+    def write(self, fields: dict) -> None:
+        self.logger.info("access", extra={"fields": fields})
+    
+    def stop(self) -> None:
+        if self._listener is None:
+            return
+        
+        self.logger.removeHandler(self._handler)
+        self._listener.stop()
+        self._listener = None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info.get("query_started")
+    if not started:
+        return
+    
+    elapsed = time.perf_counter() - started.pop()
+    timings = current_timings()
+    if timings is not None:
+        timings.db_seconds += elapsed
+        timings.db_queries += 1
+
+
+def instrument_query_timing() -> None:
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,115 @@
+from typing import Dict, List, Optional, Sequence
+from sqlalchemy import case, select, update
+from sqlalchemy.orm import Session
+from app.domain.interfaces import IAllocationRepository
+from app.domain.allocation_models import AllocationLine, Shortfall
+from app.domain.models import Product
+from app.infrastructure.db_models import ProductModel
+from app.infrastructure.change_feed import next_change_seq
+from app.infrastructure.inventory_summary import record_stock_changes
+from app.infrastructure.repositories import held_stock, located_stock
+from app.infrastructure.invalidation import InvalidationBus, PRODUCT_CHANGED
+from app.core.exceptions import AllocationShortfallError, ProductNotFoundError
+
+
+class SQLAlchemyAllocationRepository(IAllocationRepository):
+    def __init__(self, db: Session, bus: Optional[InvalidationBus] = None):
+        self.db = db
+        self.bus = bus
+    
+    def allocate(self, lines: Sequence[AllocationLine]) -> List[Product]:
+        quantities = {line.product_id: line.quantity for line in lines}
+        product_ids = sorted(quantities)
+        
+        try:
+            available = self._available(product_ids, for_update=True)
+            for product_id in product_ids:
+                if product_id not in available:
+                    raise ProductNotFoundError(product_id)
+            
+            shortfalls = self._shortfalls(quantities, available)
+            if shortfalls:
+                raise AllocationShortfallError(shortfalls)
+            
+            requested = case(quantities, value=ProductModel.id)
+            rows = self.db.execute(
+                update(ProductModel)
+                .where(
+                    ProductModel.id.in_(product_ids),
+                    ProductModel.stock - located_stock(ProductModel.id) - held_stock(ProductModel.id) >= requested
+                )
+                .values(
+                    stock=ProductModel.stock - requested,
+                    version=ProductModel.version + 1
+                )
+                .returning(ProductModel)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            ).scalars().all()
+            if len(rows) != len(product_ids):
+                allocated = {row.id for row in rows}
+                failed = [product_id for product_id in product_ids if product_id not in allocated]
+                self.db.rollback()
+                current = self._available(failed)
+                raise AllocationShortfallError([
+                    Shortfall(product_id, quantities[product_id], current.get(product_id, 0))
+                    for product_id in failed
+                ])
+            
+            products = sorted((self._to_domain(row) for row in rows), key=lambda p: p.id)
+            record_stock_changes(
+                self.db,
+                [(p.id, p.stock + quantities[p.id], p.stock) for p in products]
+            )
+            
+            if self.bus is not None:
+                for product_id in product_ids:
+                    self.bus.publish(self.db, PRODUCT_CHANGED, product_id)
+            last_seq = next_change_seq(self.db, count=len(product_ids))
+            first_seq = last_seq - len(product_ids) + 1
+            self.db.execute(
+                update(ProductModel)
+                .where(ProductModel.id.in_(product_ids))
+                .values(change_seq=case(
+                    {product_id: first_seq + i for i, product_id in enumerate(product_ids)},
+                    value=ProductModel.id
+                ))
+                .execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+        
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        return products
+    
+    def _available(self, product_ids: List[int], for_update: bool = False) -> Dict[int, int]:
+        statement = (
+            select(
+                ProductModel.id,
+                ProductModel.stock - located_stock(ProductModel.id) - held_stock(ProductModel.id)
+            )
+            .where(ProductModel.id.in_(product_ids))
+            .order_by(ProductModel.id)
+        )
+        if for_update:
+            statement = statement.with_for_update()
+        return {product_id: available for product_id, available in self.db.execute(statement).all()}
+    
+    def _shortfalls(self, quantities: Dict[int, int], available: Dict[int, int]) -> List[Shortfall]:
+        return [
+            Shortfall(product_id, quantity, available.get(product_id, 0))
+            for product_id, quantity in sorted(quantities.items())
+            if available.get(product_id, 0) < quantity
+        ]
+    
+    def _to_domain(self, db_product: ProductModel) -> Product:
+        return Product(
+            id=db_product.id,
+            name=db_product.name,
+            sku=db_product.sku,
+            stock=db_product.stock,
+            created_at=db_product.created_at,
+            updated_at=db_product.updated_at,
+            version=db_product.version
+        )
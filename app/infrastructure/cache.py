@@ -0,0 +1,108 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+from app.core.metrics import metrics
+
+
+_MISSING = object()
+
+
+class LocalCache:
+    def __init__(self, name: str, max_entries: int = 10000, ttl_seconds: float = 30.0):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[Hashable]] = {}
+        self._generation = 0
+        self._evicted_tags: "OrderedDict[str, int]" = OrderedDict()
+        self._forgotten_before = 0
+        self._lock = threading.Lock()
+        self._hits = metrics.counter(f"cache.{name}.hits")
+        self._misses = metrics.counter(f"cache.{name}.misses")
+        self._evictions = metrics.counter(f"cache.{name}.evictions")
+        self._stale_fills = metrics.counter(f"cache.{name}.stale_fills")
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                value, expires_at, tags = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._hits.inc()
+                    return value
+                self._remove(key)
+        self._misses.inc()
+        return default
+    
+    def generation(self) -> int:
+        return self._generation
+    
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        tags: Iterable[str] = (),
+        since: Optional[int] = None
+    ) -> None:
+        tags = tuple(tags)
+        with self._lock:
+            if since is not None and self._evicted_since(since, tags):
+                self._stale_fills.inc()
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic() + self.ttl_seconds, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+    
+    def evict(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+                self._evictions.inc()
+    
+    def evict_tag(self, tag: str) -> None:
+        with self._lock:
+            self._generation += 1
+            self._evicted_tags[tag] = self._generation
+            self._evicted_tags.move_to_end(tag)
+            while len(self._evicted_tags) > self.max_entries:
+                _, generation = self._evicted_tags.popitem(last=False)
+                self._forgotten_before = generation
+            keys = self._tags.pop(tag, ())
+            for key in list(keys):
+                if key in self._entries:
+                    self._remove(key)
+                    self._evictions.inc()
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._forgotten_before = self._generation
+            self._evicted_tags.clear()
+            self._entries.clear()
+            self._tags.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _evicted_since(self, generation: int, tags: Tuple[str, ...]) -> bool:
+        if self._forgotten_before > generation:
+            return True
+        return any(self._evicted_tags.get(tag, 0) > generation for tag in tags)
+    
+    def _remove(self, key: Hashable) -> Optional[Any]:
+        value, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        return value
@@ -0,0 +1,195 @@
+from typing import Callable, Hashable, List, Optional, Sequence
+from app.domain.interfaces import IProductRepository, IUserRepository
+from app.domain.models import Product, ProductChange
+from app.domain.user_models import User
+from app.core.singleflight import SingleFlight
+from app.infrastructure.cache import LocalCache
+from app.infrastructure.invalidation import InvalidationBus, InvalidationMessage
+
+
+class CachedProductRepository(IProductRepository):
+    def __init__(self, inner: IProductRepository, cache: LocalCache, bus: InvalidationBus):
+        self.inner = inner
+        self.cache = cache
+        self.bus = bus
+    
+    def create(self, product: Product) -> Product:
+        return self.inner.create(product)
+    
+    def get_by_id(self, product_id: int) -> Optional[Product]:
+        return self._read(("id", product_id), lambda: self.inner.get_by_id(product_id))
+    
+    def get_by_sku(self, sku: str) -> Optional[Product]:
+        return self._read(("sku", sku), lambda: self.inner.get_by_sku(sku))
+    
+    def get_many_by_ids(self, product_ids: Sequence[int]) -> List[Product]:
+        return self._read_many(
+            product_ids,
+            lambda product_id: ("id", product_id),
+            lambda product: product.id,
+            self.inner.get_many_by_ids
+        )
+    
+    def get_many_by_skus(self, skus: Sequence[str]) -> List[Product]:
+        return self._read_many(
+            skus,
+            lambda sku: ("sku", sku),
+            lambda product: product.sku,
+            self.inner.get_many_by_skus
+        )
+    
+    def get_all(self, skip: int = 0, limit: int = 100) -> List[Product]:
+        return self.inner.get_all(skip=skip, limit=limit)
+    
+    def get_page(self, after_id: int = 0, limit: int = 100) -> List[Product]:
+        return self.inner.get_page(after_id=after_id, limit=limit)
+    
+    def update(self, product: Product) -> Product:
+        return self.inner.update(product)
+    
+    def adjust_stock(self, product_id: int, delta: int) -> Product:
+        return self.inner.adjust_stock(product_id, delta)
+    
+    def delete(self, product_id: int) -> bool:
+        return self.inner.delete(product_id)
+    
+    def get_changes(self, since: int, limit: int = 100) -> List[ProductChange]:
+        return self.inner.get_changes(since, limit)
+    
+    def _read(self, key, load) -> Optional[Product]:
+        if not self.bus.is_live():
+            return load()
+        
+        product = self.cache.get(key)
+        if product is None:
+            generation = self.cache.generation()
+            product = load()
+            if product is not None:
+                self.cache.set(key, product, tags=(str(product.id),), since=generation)
+        return product
+    
+    def _read_many(
+        self,
+        keys: Sequence,
+        cache_key: Callable[[Hashable], Hashable],
+        product_key: Callable[[Product], Hashable],
+        load: Callable[[Sequence], List[Product]]
+    ) -> List[Product]:
+        if not self.bus.is_live():
+            return load(keys)
+        
+        products = []
+        misses = []
+        for key in keys:
+            product = self.cache.get(cache_key(key))
+            if product is None:
+                misses.append(key)
+            else:
+                products.append(product)
+        
+        if misses:
+            generation = self.cache.generation()
+            for product in load(misses):
+                self.cache.set(
+                    cache_key(product_key(product)),
+                    product,
+                    tags=(str(product.id),),
+                    since=generation
+                )
+                products.append(product)
+        return products
+
+
+class CoalescingProductRepository(IProductRepository):
+    def __init__(self, inner: IProductRepository, flight: SingleFlight, scope: str = "primary"):
+        self.inner = inner
+        self.flight = flight
+        self.scope = scope
+    
+    def create(self, product: Product) -> Product:
+        return self.inner.create(product)
+    
+    def get_by_id(self, product_id: int) -> Optional[Product]:
+        return self.flight.do(
+            (self.scope, "id", product_id),
+            lambda: self.inner.get_by_id(product_id)
+        )
+    
+    def get_by_sku(self, sku: str) -> Optional[Product]:
+        return self.flight.do(
+            (self.scope, "sku", sku),
+            lambda: self.inner.get_by_sku(sku)
+        )
+    
+    def get_many_by_ids(self, product_ids: Sequence[int]) -> List[Product]:
+        return self.flight.do(
+            (self.scope, "ids", tuple(product_ids)),
+            lambda: self.inner.get_many_by_ids(product_ids)
+        )
+    
+    def get_many_by_skus(self, skus: Sequence[str]) -> List[Product]:
+        return self.flight.do(
+            (self.scope, "skus", tuple(skus)),
+            lambda: self.inner.get_many_by_skus(skus)
+        )
+    
+    def get_all(self, skip: int = 0, limit: int = 100) -> List[Product]:
+        return self.flight.do(
+            (self.scope, "all", skip, limit),
+            lambda: self.inner.get_all(skip=skip, limit=limit)
+        )
+    
+    def get_page(self, after_id: int = 0, limit: int = 100) -> List[Product]:
+        return self.flight.do(
+            (self.scope, "page", after_id, limit),
+            lambda: self.inner.get_page(after_id=after_id, limit=limit)
+        )
+    
+    def update(self, product: Product) -> Product:
+        return self.inner.update(product)
+    
+    def adjust_stock(self, product_id: int, delta: int) -> Product:
+        return self.inner.adjust_stock(product_id, delta)
+    
+    def delete(self, product_id: int) -> bool:
+        return self.inner.delete(product_id)
+    
+    def get_changes(self, since: int, limit: int = 100) -> List[ProductChange]:
+        return self.inner.get_changes(since, limit)
+
+
+class CachedUserRepository(IUserRepository):
+    def __init__(self, inner: IUserRepository, cache: LocalCache, bus: InvalidationBus):
+        self.inner = inner
+        self.cache = cache
+        self.bus = bus
+    
+    def get_by_id(self, user_id: int) -> Optional[User]:
+        return self.inner.get_by_id(user_id)
+    
+    def get_by_username(self, username: str) -> Optional[User]:
+        if not self.bus.is_live():
+            return self.inner.get_by_username(username)
+        
+        user = self.cache.get(username)
+        if user is None:
+            generation = self.cache.generation()
+            user = self.inner.get_by_username(username)
+            if user is not None:
+                self.cache.set(username, user, tags=(username,), since=generation)
+        return user
+    
+    def get_by_email(self, email: str) -> Optional[User]:
+        return self.inner.get_by_email(email)
+    
+    def create(self, user: User) -> User:
+        return self.inner.create(user)
+
+
+def evict_on(cache: LocalCache):
+    def evict(message: InvalidationMessage) -> None:
+        if message.key is None:
+            cache.clear()
+        else:
+            cache.evict_tag(message.key)
+    return evict
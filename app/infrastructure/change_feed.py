@@ -0,0 +1,56 @@
+import asyncio
+import threading
+from typing import Set, Tuple
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+from app.infrastructure.db_models import ChangeCounterModel
+
+
+PRODUCT_SEQUENCE = "products"
+
+
+def next_change_seq(db: Session, count: int = 1, name: str = PRODUCT_SEQUENCE) -> int:
+    last = db.execute(
+        update(ChangeCounterModel)
+        .where(ChangeCounterModel.name == name)
+        .values(value=ChangeCounterModel.value + count)
+        .returning(ChangeCounterModel.value)
+    ).scalar_one_or_none()
+    
+    if last is None:
+        db.execute(insert(ChangeCounterModel).values(name=name, value=count))
+        last = count
+    
+    return last
+
+
+class ChangeSignal:
+    def __init__(self):
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = set()
+        self._lock = threading.Lock()
+    
+    def notify(self, *_) -> None:
+        with self._lock:
+            waiters, self._waiters = self._waiters, set()
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_resolve, future)
+    
+    async def wait(self, timeout: float) -> bool:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = (loop, future)
+        with self._lock:
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
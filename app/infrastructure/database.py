@@ -1,27 +1,132 @@
+import threading
+import time
+from fastapi import Depends
+from fastapi.requests import HTTPConnection
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from starlette.concurrency import run_in_threadpool
+from typing import AsyncGenerator, Optional
 from app.core.config import settings
+from app.infrastructure.pool import InstrumentedQueuePool
+from app.infrastructure.replicas import ReplicaRouter
+from app.infrastructure.sqlite import create_sqlite_engines, is_sqlite_file, parse_pragmas, profile_pragmas
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+Base = declarative_base()
+
+_engine: Optional[Engine] = None
+_read_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+replica_router = ReplicaRouter(
+    settings.READ_DATABASE_URLS.split(","),
+    eject_seconds=settings.READ_REPLICA_EJECT_SECONDS,
     echo=settings.DEBUG
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
+def get_engine() -> Engine:
+    global _engine, _read_engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                if settings.SQLITE_PROFILE_ENABLED and is_sqlite_file(settings.DATABASE_URL):
+                    _engine, _read_engine = create_sqlite_engines(
+                        make_url(settings.DATABASE_URL),
+                        profile_pragmas(
+                            journal_mode=settings.SQLITE_JOURNAL_MODE,
+                            synchronous=settings.SQLITE_SYNCHRONOUS,
+                            busy_timeout_ms=settings.SQLITE_BUSY_TIMEOUT_MS,
+                            mmap_size=settings.SQLITE_MMAP_SIZE,
+                            extra=parse_pragmas(settings.SQLITE_PRAGMAS)
+                        ),
+                        read_pool_size=settings.SQLITE_READ_POOL_SIZE,
+                        write_timeout_seconds=settings.SQLITE_WRITE_TIMEOUT_SECONDS,
+                        echo=settings.DEBUG
+                    )
+                    ReadSessionLocal.configure(bind=_read_engine)
+                else:
+                    options = {}
+                    if make_url(settings.DATABASE_URL).get_backend_name() != "sqlite":
+                        options["poolclass"] = InstrumentedQueuePool
+                    _engine = create_engine(
+                        settings.DATABASE_URL,
+                        pool_pre_ping=True,
+                        echo=settings.DEBUG,
+                        **options
+                    )
+                SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+def current_engine() -> Optional[Engine]:
+    return _engine
+
+
+def get_session() -> Session:
+    get_engine()
+    return SessionLocal()
+
+
+async def close_session(db: Session) -> None:
+    if db.in_transaction():
+        await run_in_threadpool(db.close)
+    else:
+        db.close()
 
 
-def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
+async def get_db() -> AsyncGenerator[Session, None]:
+    db = get_session()
     try:
         yield db
     finally:
-        db.close()
+        await close_session(db)
+
+
+def is_pinned_to_primary(request: HTTPConnection) -> bool:
+    if request.headers.get("x-read-consistency", "").lower() == "primary":
+        return True
+    
+    pinned_until = request.cookies.get(settings.READ_YOUR_WRITES_COOKIE)
+    try:
+        return pinned_until is not None and float(pinned_until) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_read_db(
+    request: HTTPConnection,
+    db: Session = Depends(get_db)
+) -> AsyncGenerator[Session, None]:
+    replica = None
+    if replica_router.enabled:
+        if is_pinned_to_primary(request):
+            replica_router.record_primary_read()
+        else:
+            replica = await run_in_threadpool(replica_router.open_session)
+    
+    if replica is None and _read_engine is not None and db.get_bind() is _engine:
+        replica = ReadSessionLocal()
+    
+    if replica is None:
+        yield db
+        return
+    
+    try:
+        yield replica
+    finally:
+        await close_session(replica)
 
 
 def create_tables() -> None:
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
+
+
+def __getattr__(name: str):
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
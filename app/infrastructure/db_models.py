@@ -1,4 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean
+from sqlalchemy import (
+    Column, Integer, BigInteger, String, DateTime, Boolean, ForeignKey, Index, DDL, event, text,
+    CheckConstraint, JSON
+)
 from sqlalchemy.sql import func
 from app.infrastructure.database import Base
 
@@ -10,6 +13,8 @@ class ProductModel(Base):
     name = Column(String, nullable=False, index=True)
     sku = Column(String, unique=True, nullable=False, index=True)
     stock = Column(Integer, default=0, nullable=False)
+    change_seq = Column(BigInteger, nullable=False, default=0, server_default="0", index=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), 
@@ -38,3 +43,158 @@ class UserModel(Base):
     
     def __repr__(self) -> str:
         return f"<UserModel(id={self.id}, username='{self.username}', email='{self.email}')>"
+
+
+class StockReservationModel(Base):
+    __tablename__ = "stock_reservations"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    product_id = Column(
+        Integer,
+        ForeignKey("products.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    quantity = Column(Integer, nullable=False)
+    status = Column(String(16), nullable=False, default="active")
+    expires_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), 
+        server_default=func.now(), 
+        onupdate=func.now()
+    )
+    
+    __table_args__ = (
+        Index(
+            "ix_stock_reservations_active_product",
+            "product_id",
+            "expires_at",
+            "quantity",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'")
+        ),
+        Index(
+            "ix_stock_reservations_active_expiry",
+            "expires_at",
+            postgresql_where=text("status = 'active'"),
+            sqlite_where=text("status = 'active'")
+        ),
+    )
+    
+    def __repr__(self) -> str:
+        return (
+            f"<StockReservationModel(id={self.id}, product_id={self.product_id}, "
+            f"quantity={self.quantity}, status='{self.status}')>"
+        )
+
+
+class ProductLocationModel(Base):
+    __tablename__ = "product_locations"
+    
+    product_id = Column(
+        Integer,
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    location = Column(String(64), primary_key=True)
+    stock = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now()
+    )
+    
+    __table_args__ = (
+        CheckConstraint("stock >= 0", name="ck_product_locations_stock_non_negative"),
+    )
+    
+    def __repr__(self) -> str:
+        return (
+            f"<ProductLocationModel(product_id={self.product_id}, "
+            f"location='{self.location}', stock={self.stock})>"
+        )
+
+
+class ProductTombstoneModel(Base):
+    __tablename__ = "product_tombstones"
+    
+    id = Column(Integer, primary_key=True)
+    product_id = Column(Integer, nullable=False)
+    sku = Column(String, nullable=False)
+    change_seq = Column(BigInteger, nullable=False, index=True)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def __repr__(self) -> str:
+        return f"<ProductTombstoneModel(product_id={self.product_id}, change_seq={self.change_seq})>"
+
+
+class ChangeCounterModel(Base):
+    __tablename__ = "change_counters"
+    
+    name = Column(String(64), primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
+    
+    def __repr__(self) -> str:
+        return f"<ChangeCounterModel(name='{self.name}', value={self.value})>"
+
+
+event.listen(
+    ChangeCounterModel.__table__,
+    "after_create",
+    DDL("INSERT INTO change_counters (name, value) VALUES ('products', 0)")
+)
+
+
+class InventorySummaryModel(Base):
+    __tablename__ = "inventory_summary"
+    
+    shard = Column(Integer, primary_key=True, autoincrement=False)
+    total_skus = Column(BigInteger, nullable=False, default=0)
+    total_units = Column(BigInteger, nullable=False, default=0)
+    out_of_stock = Column(BigInteger, nullable=False, default=0)
+    low_stock = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now()
+    )
+    
+    def __repr__(self) -> str:
+        return (
+            f"<InventorySummaryModel(shard={self.shard}, total_skus={self.total_skus}, "
+            f"total_units={self.total_units})>"
+        )
+
+
+class JobModel(Base):
+    __tablename__ = "jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(64), nullable=False)
+    status = Column(String(16), nullable=False, default="queued")
+    params = Column(JSON, nullable=False)
+    cursor = Column(JSON, nullable=True)
+    progress_done = Column(BigInteger, nullable=False, default=0)
+    progress_total = Column(BigInteger, nullable=True)
+    result = Column(JSON, nullable=True)
+    error = Column(String, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    lease_owner = Column(String(64), nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    created_by = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now()
+    )
+    
+    __table_args__ = (
+        Index("ix_jobs_status_id", "status", "id"),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<JobModel(id={self.id}, kind='{self.kind}', status='{self.status}')>"
@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Deque, List, Optional
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import NullPool
+from app.core.metrics import metrics
+from app.infrastructure.migrations import SCHEMA_REVISION, get_current_revision
+
+
+logger = logging.getLogger(__name__)
+
+
+class ErrorRateTracker:
+    def __init__(self, window_seconds: float = 60.0):
+        self.window_seconds = window_seconds
+        self._buckets: Deque[List[int]] = deque()
+    
+    def record(self, status_code: int) -> None:
+        second = int(time.monotonic())
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append([second, 0, 0])
+            self._trim(second)
+        bucket = self._buckets[-1]
+        bucket[1] += 1
+        if status_code >= 500:
+            bucket[2] += 1
+    
+    def snapshot(self) -> dict:
+        self._trim(int(time.monotonic()))
+        total = sum(bucket[1] for bucket in self._buckets)
+        errors = sum(bucket[2] for bucket in self._buckets)
+        return {
+            "window_seconds": self.window_seconds,
+            "total": total,
+            "errors": errors,
+            "error_rate": round(errors / total, 4) if total else 0.0
+        }
+    
+    def _trim(self, now: int) -> None:
+        while self._buckets and self._buckets[0][0] <= now - self.window_seconds:
+            self._buckets.popleft()
+
+
+class DatabaseHealthMonitor:
+    def __init__(
+        self,
+        url: str,
+        interval_seconds: float = 5.0,
+        timeout_seconds: float = 2.0,
+        check_schema: bool = True,
+        require_schema: bool = False
+    ):
+        self.url = url
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.check_schema = check_schema
+        self.require_schema = require_schema
+        self.ok = False
+        self.schema_ok = not check_schema
+        self.error: Optional[str] = None
+        self.latency_ms: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self._engine: Optional[Engine] = None
+        self._pending: Optional[asyncio.Future] = None
+        self._task: Optional[asyncio.Task] = None
+        self._failures = metrics.counter("health.db.failures")
+        self._latency = metrics.summary("health.db.ping_seconds")
+    
+    def ping(self) -> None:
+        started = time.perf_counter()
+        with self._get_engine().connect() as connection:
+            connection.execute(text("SELECT 1"))
+            revision = get_current_revision(connection) if self.check_schema else SCHEMA_REVISION
+        elapsed = time.perf_counter() - started
+        
+        schema_ok = revision == SCHEMA_REVISION
+        if schema_ok != self.schema_ok and not schema_ok:
+            logger.warning(
+                "Database schema revision is %s, expected %s; run `alembic upgrade head`",
+                revision or "missing",
+                SCHEMA_REVISION
+            )
+        self.schema_ok = schema_ok
+        self.latency_ms = round(elapsed * 1000, 3)
+        self._latency.observe(elapsed)
+    
+    async def check_once(self) -> None:
+        if self._pending is not None and not self._pending.done():
+            self._mark_failed("previous ping still running")
+            return
+        
+        self._pending = asyncio.get_running_loop().run_in_executor(None, self.ping)
+        try:
+            await asyncio.wait_for(asyncio.shield(self._pending), self.timeout_seconds)
+        except asyncio.TimeoutError:
+            self._mark_failed(f"ping timed out after {self.timeout_seconds}s")
+        except Exception as e:
+            self._mark_failed(f"{type(e).__name__}: {e}")
+        else:
+            self.ok = True
+            self.error = None
+        self.checked_at = time.monotonic()
+    
+    def status(self) -> dict:
+        age = None if self.checked_at is None else time.monotonic() - self.checked_at
+        if age is None:
+            state = "starting"
+        elif (
+            self.ok
+            and (self.schema_ok or not self.require_schema)
+            and age <= 3 * self.interval_seconds
+        ):
+            state = "ready"
+        else:
+            state = "unavailable"
+        
+        return {
+            "status": state,
+            "ok": self.ok,
+            "schema_ok": self.schema_ok,
+            "latency_ms": self.latency_ms,
+            "checked_seconds_ago": None if age is None else round(age, 3),
+            "error": self.error
+        }
+    
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+    
+    async def _run(self) -> None:
+        while True:
+            await self.check_once()
+            await asyncio.sleep(self.interval_seconds)
+    
+    def _mark_failed(self, error: str) -> None:
+        self.ok = False
+        self.error = error
+        self._failures.inc()
+    
+    def _get_engine(self) -> Engine:
+        if self._engine is None:
+            connect_args = {}
+            if make_url(self.url).get_backend_name() == "postgresql":
+                connect_args["connect_timeout"] = max(1, math.ceil(self.timeout_seconds))
+            self._engine = create_engine(self.url, poolclass=NullPool, connect_args=connect_args)
+        return self._engine
@@ -0,0 +1,198 @@
+import logging
+import os
+import select
+import threading
+import time
+import uuid
+from abc import ABC
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from app.core.metrics import metrics
+
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_CHANGED = "product_changed"
+USER_CHANGED = "user_changed"
+
+_PENDING_KEY = "pending_invalidations"
+
+
+class InvalidationMessage(NamedTuple):
+    channel: str
+    key: Optional[str]
+    sent_at: float
+    origin: str
+    
+    def encode(self) -> str:
+        return f"{self.key}|{self.sent_at:.6f}|{self.origin}"
+    
+    @classmethod
+    def decode(cls, channel: str, payload: str) -> "InvalidationMessage":
+        key, _, rest = payload.partition("|")
+        sent_at, _, origin = rest.partition("|")
+        try:
+            sent = float(sent_at)
+        except ValueError:
+            sent = time.time()
+        return cls(channel, key, sent, origin)
+
+
+Subscriber = Callable[[InvalidationMessage], None]
+
+
+class InvalidationBus(ABC):
+    def __init__(self):
+        self.origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._subscribers: Dict[str, List[Subscriber]] = {}
+        self._lag = metrics.summary("invalidation.lag_seconds")
+        self._delivered = metrics.counter("invalidation.delivered")
+    
+    def subscribe(self, channel: str, callback: Subscriber) -> None:
+        self._subscribers.setdefault(channel, []).append(callback)
+    
+    def publish(self, db: Session, channel: str, key) -> None:
+        message = InvalidationMessage(channel, str(key), time.time(), self.origin)
+        db.info.setdefault(_PENDING_KEY, []).append((self, message))
+        self._emit(db, message)
+    
+    def is_live(self) -> bool:
+        return True
+    
+    def start(self) -> None:
+        pass
+    
+    def stop(self) -> None:
+        pass
+    
+    def reset(self) -> None:
+        for channel in list(self._subscribers):
+            self._deliver(InvalidationMessage(channel, None, time.time(), self.origin))
+    
+    def _emit(self, db: Session, message: InvalidationMessage) -> None:
+        pass
+    
+    def _deliver(self, message: InvalidationMessage) -> None:
+        self._lag.observe(max(0.0, time.time() - message.sent_at))
+        self._delivered.inc()
+        for callback in self._subscribers.get(message.channel, ()):
+            try:
+                callback(message)
+            except Exception:
+                logger.exception("Invalidation subscriber failed for %s", message.channel)
+
+
+class InMemoryInvalidationBus(InvalidationBus):
+    pass
+
+
+class PostgresInvalidationBus(InvalidationBus):
+    def __init__(
+        self,
+        connect: Callable[[], object],
+        channels: Sequence[str] = (PRODUCT_CHANGED, USER_CHANGED),
+        reconnect_delay: float = 1.0
+    ):
+        super().__init__()
+        self.connect = connect
+        self.channels = tuple(channels)
+        self.reconnect_delay = reconnect_delay
+        self._live = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def is_live(self) -> bool:
+        return self._live.is_set()
+    
+    def start(self) -> None:
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._listen_forever,
+                name="invalidation-listener",
+                daemon=True
+            )
+            self._thread.start()
+    
+    def stop(self) -> None:
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._live.clear()
+    
+    def _emit(self, db: Session, message: InvalidationMessage) -> None:
+        db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": message.channel, "payload": message.encode()}
+        )
+    
+    def _listen_forever(self) -> None:
+        while not self._stopping.is_set():
+            connection = None
+            try:
+                connection = self.connect()
+                connection.autocommit = True
+                with connection.cursor() as cursor:
+                    for channel in self.channels:
+                        cursor.execute(f"LISTEN {channel}")
+                self._live.set()
+                self.reset()
+                self._poll(connection)
+            except Exception:
+                logger.exception("Invalidation listener disconnected")
+            finally:
+                self._live.clear()
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+            self._stopping.wait(self.reconnect_delay)
+    
+    def _poll(self, connection) -> None:
+        while not self._stopping.is_set():
+            if select.select([connection], [], [], 1.0) == ([], [], []):
+                continue
+            connection.poll()
+            while connection.notifies:
+                notify = connection.notifies.pop(0)
+                message = InvalidationMessage.decode(notify.channel, notify.payload)
+                if message.origin != self.origin:
+                    self._deliver(message)
+
+
+def _deliver_pending(session: Session) -> None:
+    for bus, message in session.info.pop(_PENDING_KEY, ()):
+        bus._deliver(message)
+
+
+def _discard_pending(session: Session, previous_transaction) -> None:
+    if not previous_transaction.nested:
+        session.info.pop(_PENDING_KEY, None)
+
+
+event.listen(Session, "after_commit", _deliver_pending)
+event.listen(Session, "after_soft_rollback", _discard_pending)
+
+
+def create_invalidation_bus(kind: str, database_url: str) -> InvalidationBus:
+    if kind == "postgres":
+        from sqlalchemy.engine import make_url
+        
+        connect_args = make_url(database_url).translate_connect_args(
+            username="user",
+            database="dbname"
+        )
+        
+        def connect():
+            import psycopg2
+            return psycopg2.connect(**connect_args)
+        
+        return PostgresInvalidationBus(connect)
+    
+    if kind == "memory":
+        return InMemoryInvalidationBus()
+    
+    raise ValueError(f"Unknown invalidation bus '{kind}'")
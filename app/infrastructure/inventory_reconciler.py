@@ -0,0 +1,54 @@
+import asyncio
+import logging
+from typing import Callable, Optional
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from app.core.metrics import metrics
+from app.domain.inventory_models import InventorySummary
+from app.infrastructure.inventory_repository import SQLAlchemyInventoryRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class InventoryReconciler:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        interval_seconds: float = 300.0
+    ):
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+        self._repairs = metrics.counter("inventory.summary.repairs")
+    
+    def reconcile_once(self) -> InventorySummary:
+        with self.session_factory() as db:
+            drift = SQLAlchemyInventoryRepository(db).reconcile()
+        
+        if not drift.is_zero():
+            self._repairs.inc()
+        return drift
+    
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                drift = await run_in_threadpool(self.reconcile_once)
+                if not drift.is_zero():
+                    logger.warning("Repaired inventory summary drift: %r", drift)
+            except Exception:
+                logger.exception("Inventory summary reconciliation failed")
@@ -0,0 +1,56 @@
+from sqlalchemy import case, func, select, true
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.domain.interfaces import IInventoryRepository
+from app.domain.inventory_models import InventorySummary
+from app.infrastructure.db_models import InventorySummaryModel, ProductModel
+from app.infrastructure.inventory_summary import apply_summary_delta
+
+
+class SQLAlchemyInventoryRepository(IInventoryRepository):
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_summary(self) -> InventorySummary:
+        row = self.db.execute(self._summary_totals()).one()
+        return InventorySummary(*row, low_stock_threshold=settings.LOW_STOCK_THRESHOLD)
+    
+    def reconcile(self) -> InventorySummary:
+        threshold = settings.LOW_STOCK_THRESHOLD
+        actual = (
+            select(
+                func.count(ProductModel.id).label("total_skus"),
+                func.coalesce(func.sum(ProductModel.stock), 0).label("total_units"),
+                func.coalesce(func.sum(case((ProductModel.stock <= 0, 1), else_=0)), 0).label("out_of_stock"),
+                func.coalesce(func.sum(case(
+                    ((ProductModel.stock > 0) & (ProductModel.stock < threshold), 1),
+                    else_=0
+                )), 0).label("low_stock")
+            )
+            .subquery()
+        )
+        recorded = self._summary_totals().subquery()
+        
+        try:
+            drift = self.db.execute(
+                select(*(actual.c[name] - recorded.c[name] for name in actual.c.keys()))
+                .select_from(actual.join(recorded, true()))
+            ).one()
+            summary = InventorySummary(*drift, low_stock_threshold=threshold)
+            if not summary.is_zero():
+                apply_summary_delta(self.db, 0, *drift)
+            self.db.commit()
+        
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        return summary
+    
+    def _summary_totals(self):
+        return select(
+            func.coalesce(func.sum(InventorySummaryModel.total_skus), 0).label("total_skus"),
+            func.coalesce(func.sum(InventorySummaryModel.total_units), 0).label("total_units"),
+            func.coalesce(func.sum(InventorySummaryModel.out_of_stock), 0).label("out_of_stock"),
+            func.coalesce(func.sum(InventorySummaryModel.low_stock), 0).label("low_stock")
+        )
@@ -0,0 +1,59 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.infrastructure.db_models import InventorySummaryModel
+
+
+StockChange = Tuple[int, Optional[int], Optional[int]]
+
+
+def stock_counts(stock: int, threshold: int) -> List[int]:
+    return [1, stock, int(stock <= 0), int(0 < stock < threshold)]
+
+
+def record_stock_changes(db: Session, changes: Iterable[StockChange]) -> None:
+    threshold = settings.LOW_STOCK_THRESHOLD
+    shards = max(1, settings.INVENTORY_SUMMARY_SHARDS)
+    deltas: Dict[int, List[int]] = {}
+    
+    for product_id, old_stock, new_stock in changes:
+        delta = deltas.setdefault(product_id % shards, [0, 0, 0, 0])
+        for sign, stock in ((-1, old_stock), (1, new_stock)):
+            if stock is not None:
+                for i, count in enumerate(stock_counts(stock, threshold)):
+                    delta[i] += sign * count
+    
+    for shard in sorted(deltas):
+        if any(deltas[shard]):
+            apply_summary_delta(db, shard, *deltas[shard])
+
+
+def apply_summary_delta(
+    db: Session,
+    shard: int,
+    total_skus: int,
+    total_units: int,
+    out_of_stock: int,
+    low_stock: int
+) -> None:
+    result = db.execute(
+        update(InventorySummaryModel)
+        .where(InventorySummaryModel.shard == shard)
+        .values(
+            total_skus=InventorySummaryModel.total_skus + total_skus,
+            total_units=InventorySummaryModel.total_units + total_units,
+            out_of_stock=InventorySummaryModel.out_of_stock + out_of_stock,
+            low_stock=InventorySummaryModel.low_stock + low_stock
+        )
+        .execution_options(synchronize_session=False)
+    )
+    
+    if result.rowcount == 0:
+        db.execute(insert(InventorySummaryModel).values(
+            shard=shard,
+            total_skus=total_skus,
+            total_units=total_units,
+            out_of_stock=out_of_stock,
+            low_stock=low_stock
+        ))
@@ -0,0 +1,122 @@
+import os
+from typing import Any, Callable, Dict, NamedTuple, Optional
+from sqlalchemy import case, func, insert, select, update
+from sqlalchemy.orm import Session
+from app.domain.job_models import Job
+from app.domain.models import Product
+from app.infrastructure.db_models import ProductModel
+from app.infrastructure.change_feed import next_change_seq
+from app.infrastructure.inventory_repository import SQLAlchemyInventoryRepository
+from app.infrastructure.inventory_summary import record_stock_changes
+from app.infrastructure.invalidation import InvalidationBus, PRODUCT_CHANGED
+from app.infrastructure.repositories import SQLAlchemyProductRepository
+
+
+class JobStep(NamedTuple):
+    cursor: Optional[Dict[str, Any]]
+    done: int
+    total: Optional[int]
+    result: Optional[Dict[str, Any]]
+    finished: bool
+
+
+class ProductImportHandler:
+    kind = Job.PRODUCT_IMPORT
+    
+    def __init__(self, bus: Optional[InvalidationBus] = None):
+        self.bus = bus
+    
+    def run_chunk(self, db: Session, job: Job, chunk_size: int) -> JobStep:
+        items = job.params["products"]
+        start = (job.cursor or {}).get("index", 0)
+        chunk = items[start:start + chunk_size]
+        
+        rows: Dict[str, dict] = {}
+        for item in chunk:
+            sku = item["sku"].strip().upper()
+            rows.setdefault(sku, {"name": item["name"], "sku": sku, "stock": item.get("stock", 0)})
+        existing = set(db.execute(
+            select(ProductModel.sku).where(ProductModel.sku.in_(list(rows)))
+        ).scalars()) if rows else set()
+        new_rows = [row for sku, row in rows.items() if sku not in existing]
+        
+        if new_rows:
+            created = sorted(db.execute(
+                insert(ProductModel).returning(ProductModel.id, ProductModel.stock),
+                new_rows
+            ).all())
+            record_stock_changes(db, [(product_id, None, stock) for product_id, stock in created])
+            if self.bus is not None:
+                for product_id, _ in created:
+                    self.bus.publish(db, PRODUCT_CHANGED, product_id)
+            last_seq = next_change_seq(db, count=len(created))
+            first_seq = last_seq - len(created) + 1
+            db.execute(
+                update(ProductModel)
+                .where(ProductModel.id.in_([product_id for product_id, _ in created]))
+                .values(change_seq=case(
+                    {product_id: first_seq + i for i, (product_id, _) in enumerate(created)},
+                    value=ProductModel.id
+                ))
+                .execution_options(synchronize_session=False)
+            )
+        
+        end = start + len(chunk)
+        previous = job.result or {"created": 0, "skipped": 0}
+        result = {
+            "created": previous["created"] + len(new_rows),
+            "skipped": previous["skipped"] + len(chunk) - len(new_rows)
+        }
+        return JobStep({"index": end}, end, len(items), result, end >= len(items))
+
+
+class ProductExportHandler:
+    kind = Job.PRODUCT_EXPORT
+    
+    def __init__(self, directory: str, serialize: Callable[[Product], str]):
+        self.directory = directory
+        self.serialize = serialize
+    
+    def path_for(self, job_id: int) -> str:
+        return os.path.join(self.directory, f"products-{job_id}.ndjson")
+    
+    def run_chunk(self, db: Session, job: Job, chunk_size: int) -> JobStep:
+        cursor = job.cursor or {"after_id": 0, "offset": 0}
+        total = job.progress_total
+        if total is None:
+            total = db.execute(select(func.count(ProductModel.id))).scalar_one()
+        batch = SQLAlchemyProductRepository(db).get_page(after_id=cursor["after_id"], limit=chunk_size)
+        
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_for(job.id)
+        with open(path, "r+b" if cursor["offset"] else "wb") as output:
+            output.truncate(cursor["offset"])
+            output.seek(cursor["offset"])
+            output.write("".join(self.serialize(product) + "\n" for product in batch).encode("utf-8"))
+            output.flush()
+            os.fsync(output.fileno())
+            offset = output.tell()
+        
+        done = job.progress_done + len(batch)
+        finished = len(batch) < chunk_size
+        return JobStep(
+            {"after_id": batch[-1].id if batch else cursor["after_id"], "offset": offset},
+            done,
+            max(total, done),
+            {"rows": done, "bytes": offset, "file": os.path.basename(path)} if finished else None,
+            finished
+        )
+
+
+class InventoryReconcileHandler:
+    kind = Job.INVENTORY_RECONCILE
+    
+    def run_chunk(self, db: Session, job: Job, chunk_size: int) -> JobStep:
+        repository = SQLAlchemyInventoryRepository(db)
+        drift = repository.reconcile()
+        summary = repository.get_summary()
+        fields = ("total_skus", "total_units", "out_of_stock", "low_stock")
+        return JobStep(None, 1, 1, {
+            "drift": {name: getattr(drift, name) for name in fields},
+            "summary": {name: getattr(summary, name) for name in fields}
+        }, True)
@@ -0,0 +1,178 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import Session
+from app.domain.interfaces import IJobRepository
+from app.domain.job_models import Job
+from app.infrastructure.db_models import JobModel
+from app.core.exceptions import JobLeaseLostError
+
+
+class SQLAlchemyJobRepository(IJobRepository):
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def create(self, job: Job) -> Job:
+        try:
+            row = JobModel(
+                kind=job.kind,
+                status=Job.QUEUED,
+                params=job.params,
+                progress_done=0,
+                attempts=0,
+                created_by=job.created_by
+            )
+            self.db.add(row)
+            self.db.commit()
+            self.db.refresh(row)
+        
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        return self._to_domain(row)
+    
+    def get_by_id(self, job_id: int) -> Optional[Job]:
+        row = self.db.execute(
+            select(JobModel).where(JobModel.id == job_id)
+        ).scalar_one_or_none()
+        
+        return self._to_domain(row) if row else None
+    
+    def claim(self, owner: str, lease_seconds: float, now: Optional[datetime] = None) -> Optional[Job]:
+        now = now or datetime.utcnow()
+        claimable = or_(
+            JobModel.status == Job.QUEUED,
+            and_(JobModel.status == Job.RUNNING, JobModel.lease_expires_at < now)
+        )
+        
+        try:
+            candidates = self.db.execute(
+                select(JobModel.id).where(claimable).order_by(JobModel.id).limit(10)
+            ).scalars().all()
+            for job_id in candidates:
+                row = self.db.execute(
+                    update(JobModel)
+                    .where(JobModel.id == job_id, claimable)
+                    .values(
+                        status=Job.RUNNING,
+                        lease_owner=owner,
+                        lease_expires_at=now + timedelta(seconds=lease_seconds),
+                        attempts=JobModel.attempts + 1,
+                        started_at=func.coalesce(JobModel.started_at, func.now())
+                    )
+                    .returning(JobModel)
+                    .execution_options(synchronize_session=False, populate_existing=True)
+                ).scalar_one_or_none()
+                if row is not None:
+                    job = self._to_domain(row)
+                    self.db.commit()
+                    return job
+            self.db.commit()
+        
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        return None
+    
+    def checkpoint(
+        self,
+        job_id: int,
+        owner: str,
+        cursor: Optional[Dict[str, Any]],
+        done: int,
+        total: Optional[int],
+        result: Optional[Dict[str, Any]],
+        finished: bool,
+        lease_seconds: float
+    ) -> Job:
+        values = dict(
+            cursor=cursor,
+            progress_done=done,
+            progress_total=total,
+            result=result,
+            lease_expires_at=datetime.utcnow() + timedelta(seconds=lease_seconds)
+        )
+        if finished:
+            values.update(
+                status=Job.SUCCEEDED,
+                error=None,
+                lease_owner=None,
+                lease_expires_at=None,
+                finished_at=func.now()
+            )
+        
+        try:
+            row = self.db.execute(
+                self._owned(job_id, owner)
+                .values(**values)
+                .returning(JobModel)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            ).scalar_one_or_none()
+            if row is None:
+                raise JobLeaseLostError(job_id)
+            job = self._to_domain(row)
+            self.db.commit()
+        
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        return job
+    
+    def fail(self, job_id: int, owner: str, error: str, retry: bool) -> bool:
+        values = dict(error=error, lease_owner=None, lease_expires_at=None)
+        if retry:
+            values.update(status=Job.QUEUED)
+        else:
+            values.update(status=Job.FAILED, finished_at=func.now())
+        return self._release(job_id, owner, values)
+    
+    def release(self, job_id: int, owner: str) -> bool:
+        return self._release(job_id, owner, dict(
+            status=Job.QUEUED,
+            lease_owner=None,
+            lease_expires_at=None,
+            attempts=JobModel.attempts - 1
+        ))
+    
+    def _release(self, job_id: int, owner: str, values: dict) -> bool:
+        try:
+            released = self.db.execute(
+                self._owned(job_id, owner)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            ).rowcount == 1
+            self.db.commit()
+        
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        return released
+    
+    def _owned(self, job_id: int, owner: str):
+        return update(JobModel).where(
+            JobModel.id == job_id,
+            JobModel.lease_owner == owner,
+            JobModel.status == Job.RUNNING
+        )
+    
+    def _to_domain(self, row: JobModel) -> Job:
+        return Job(
+            id=row.id,
+            kind=row.kind,
+            params=row.params,
+            status=row.status,
+            cursor=row.cursor,
+            progress_done=row.progress_done,
+            progress_total=row.progress_total,
+            result=row.result,
+            error=row.error,
+            attempts=row.attempts,
+            created_by=row.created_by,
+            created_at=row.created_at,
+            started_at=row.started_at,
+            finished_at=row.finished_at
+        )
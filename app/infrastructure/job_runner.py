@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence
+from sqlalchemy.orm import Session
+from app.core.exceptions import JobLeaseLostError
+from app.core.metrics import metrics
+from app.domain.job_models import Job
+from app.infrastructure.change_feed import ChangeSignal
+from app.infrastructure.job_repository import SQLAlchemyJobRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class JobRunner:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        handlers: Sequence,
+        signal: Optional[ChangeSignal] = None,
+        workers: int = 2,
+        poll_interval_seconds: float = 5.0,
+        lease_seconds: float = 60.0,
+        chunk_size: int = 500,
+        max_attempts: int = 3
+    ):
+        self.session_factory = session_factory
+        self.handlers = {handler.kind: handler for handler in handlers}
+        self.signal = signal
+        self.workers = workers
+        self.poll_interval_seconds = poll_interval_seconds
+        self.lease_seconds = lease_seconds
+        self.chunk_size = chunk_size
+        self.max_attempts = max_attempts
+        self._stopping = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._tasks: List[asyncio.Task] = []
+        self._chunks = metrics.counter("jobs.chunks")
+        self._succeeded = metrics.counter("jobs.succeeded")
+        self._failed = metrics.counter("jobs.failed")
+        self._retried = metrics.counter("jobs.retried")
+    
+    def run_once(self) -> Optional[Job]:
+        owner = f"{os.getpid()}-{uuid.uuid4().hex[:12]}"
+        with self.session_factory() as db:
+            repository = SQLAlchemyJobRepository(db)
+            job = repository.claim(owner, self.lease_seconds)
+            if job is None:
+                return None
+            
+            handler = self.handlers.get(job.kind)
+            if handler is None or job.attempts > self.max_attempts:
+                reason = (
+                    f"Unknown job kind '{job.kind}'" if handler is None
+                    else f"Gave up after {self.max_attempts} attempts"
+                )
+                repository.fail(job.id, owner, reason, retry=False)
+                self._failed.inc()
+                return repository.get_by_id(job.id)
+            
+            try:
+                while not job.is_finished():
+                    if self._stopping.is_set():
+                        repository.release(job.id, owner)
+                        return repository.get_by_id(job.id)
+                    step = handler.run_chunk(db, job, self.chunk_size)
+                    job = repository.checkpoint(
+                        job.id, owner, step.cursor, step.done, step.total, step.result,
+                        step.finished, self.lease_seconds
+                    )
+                    self._chunks.inc()
+            
+            except JobLeaseLostError:
+                db.rollback()
+                logger.warning("Job %d was taken over by another worker", job.id)
+                return job
+            
+            except Exception as e:
+                db.rollback()
+                retry = job.attempts < self.max_attempts
+                logger.exception("Job %d (%s) failed on attempt %d", job.id, job.kind, job.attempts)
+                repository.fail(job.id, owner, str(e) or type(e).__name__, retry=retry)
+                (self._retried if retry else self._failed).inc()
+                return repository.get_by_id(job.id)
+            
+            self._succeeded.inc()
+            return job
+    
+    def start(self) -> None:
+        if not self._tasks:
+            self._stopping.clear()
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job-worker")
+            loop = asyncio.get_running_loop()
+            self._tasks = [loop.create_task(self._run()) for _ in range(self.workers)]
+    
+    async def stop(self) -> None:
+        self._stopping.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._executor is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+            self._executor = None
+    
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        job = None
+        while True:
+            if job is None:
+                if self.signal is not None:
+                    await self.signal.wait(self.poll_interval_seconds)
+                else:
+                    await asyncio.sleep(self.poll_interval_seconds)
+            
+            try:
+                job = await loop.run_in_executor(self._executor, self.run_once)
+            except Exception:
+                logger.exception("Job worker failed")
+                job = None
+            
+            if job is not None and job.is_finished():
+                logger.info("Job %d (%s) %s", job.id, job.kind, job.status)
@@ -0,0 +1,137 @@
+from typing import Optional, Tuple
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from app.domain.interfaces import ILocationRepository
+from app.domain.location_models import LocationStock, StockBreakdown
+from app.domain.models import Product
+from app.infrastructure.db_models import ProductModel, ProductLocationModel
+from app.infrastructure.change_feed import next_change_seq
+from app.infrastructure.inventory_summary import record_stock_changes
+from app.infrastructure.invalidation import InvalidationBus, PRODUCT_CHANGED
+from app.core.exceptions import ProductNotFoundError, InsufficientStockError
+
+
+class SQLAlchemyLocationRepository(ILocationRepository):
+    def __init__(self, db: Session, bus: Optional[InvalidationBus] = None):
+        self.db = db
+        self.bus = bus
+    
+    def get_breakdown(self, product_id: int) -> Optional[StockBreakdown]:
+        total = self.db.execute(
+            select(ProductModel.stock).where(ProductModel.id == product_id)
+        ).scalar_one_or_none()
+        
+        if total is None:
+            return None
+        
+        rows = self.db.execute(
+            select(ProductLocationModel)
+            .where(ProductLocationModel.product_id == product_id)
+            .order_by(ProductLocationModel.location)
+        ).scalars().all()
+        
+        return StockBreakdown(product_id, total, [self._to_domain(row) for row in rows])
+    
+    def adjust(self, product_id: int, location: str, delta: int) -> Tuple[LocationStock, Product]:
+        try:
+            exists = self.db.execute(
+                select(ProductModel.id).where(ProductModel.id == product_id)
+            ).first()
+            if exists is None:
+                raise ProductNotFoundError(product_id)
+            
+            if delta > 0:
+                row = self.db.execute(
+                    self._upsert(product_id, location, delta)
+                    .returning(ProductLocationModel)
+                    .execution_options(populate_existing=True)
+                ).scalar_one()
+            else:
+                row = self.db.execute(
+                    update(ProductLocationModel)
+                    .where(
+                        ProductLocationModel.product_id == product_id,
+                        ProductLocationModel.location == location,
+                        ProductLocationModel.stock >= -delta
+                    )
+                    .values(stock=ProductLocationModel.stock + delta, updated_at=func.now())
+                    .returning(ProductLocationModel)
+                    .execution_options(synchronize_session=False, populate_existing=True)
+                ).scalar_one_or_none()
+                if row is None:
+                    current = self.db.execute(
+                        select(ProductLocationModel.stock).where(
+                            ProductLocationModel.product_id == product_id,
+                            ProductLocationModel.location == location
+                        )
+                    ).scalar_one_or_none()
+                    raise InsufficientStockError(current or 0, -delta)
+            location_stock = self._to_domain(row)
+            
+            db_product = self.db.execute(
+                update(ProductModel)
+                .where(ProductModel.id == product_id)
+                .values(
+                    stock=ProductModel.stock + delta,
+                    version=ProductModel.version + 1,
+                    updated_at=func.now()
+                )
+                .returning(ProductModel)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            ).scalar_one()
+            product = self._to_product(db_product)
+            record_stock_changes(self.db, [(product_id, product.stock - delta, product.stock)])
+            if self.bus is not None:
+                self.bus.publish(self.db, PRODUCT_CHANGED, product_id)
+            self.db.execute(
+                update(ProductModel)
+                .where(ProductModel.id == product_id)
+                .values(change_seq=next_change_seq(self.db))
+                .execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+        
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        return location_stock, product
+    
+    def _upsert(self, product_id: int, location: str, delta: int):
+        dialect_insert = (
+            postgresql.insert
+            if self.db.get_bind().dialect.name == "postgresql"
+            else sqlite.insert
+        )
+        statement = dialect_insert(ProductLocationModel).values(
+            product_id=product_id,
+            location=location,
+            stock=delta
+        )
+        return statement.on_conflict_do_update(
+            index_elements=[ProductLocationModel.product_id, ProductLocationModel.location],
+            set_={
+                "stock": ProductLocationModel.stock + delta,
+                "updated_at": func.now()
+            }
+        )
+    
+    def _to_domain(self, row: ProductLocationModel) -> LocationStock:
+        return LocationStock(
+            product_id=row.product_id,
+            location=row.location,
+            stock=row.stock,
+            updated_at=row.updated_at
+        )
+    
+    def _to_product(self, db_product: ProductModel) -> Product:
+        return Product(
+            id=db_product.id,
+            name=db_product.name,
+            sku=db_product.sku,
+            stock=db_product.stock,
+            created_at=db_product.created_at,
+            updated_at=db_product.updated_at,
+            version=db_product.version
+        )
@@ -0,0 +1,71 @@
+import logging
+from typing import Optional, Sequence
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_REVISION = "0007"
+
+
+def get_current_revision(connection: Connection) -> Optional[str]:
+    try:
+        return connection.execute(
+            text("SELECT version_num FROM alembic_version")
+        ).scalar()
+    except DBAPIError:
+        connection.rollback()
+        return None
+
+
+def check_schema_revision(engine: Engine, strict: bool = False) -> bool:
+    with engine.connect() as connection:
+        current = get_current_revision(connection)
+    
+    if current == SCHEMA_REVISION:
+        return True
+    
+    message = (
+        f"Database schema revision is {current or 'missing'}, "
+        f"expected {SCHEMA_REVISION}; run `alembic upgrade head`"
+    )
+    if strict:
+        raise RuntimeError(message)
+    logger.warning(message)
+    return False
+
+
+def create_index_concurrently(
+    op,
+    index_name: str,
+    table_name: str,
+    columns: Sequence[str],
+    **kwargs
+) -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **kwargs
+            )
+    else:
+        op.create_index(index_name, table_name, columns, **kwargs)
+
+
+def drop_index_concurrently(op, index_name: str, table_name: str) -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+                if_exists=True
+            )
+    else:
+        op.drop_index(index_name, table_name=table_name)
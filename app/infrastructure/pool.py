@@ -0,0 +1,63 @@
+import threading
+import time
+from typing import Optional
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+from app.core.metrics import metrics
+
+
+class PoolWaitTracker:
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self._average = 0.0
+        self._last_observed = 0.0
+        self._lock = threading.Lock()
+        self._summary = metrics.summary("db.pool.checkout_wait_seconds")
+    
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._average = self.alpha * seconds + (1 - self.alpha) * self._average
+            self._last_observed = time.monotonic()
+        self._summary.observe(seconds)
+    
+    def recent_wait(self, window_seconds: float) -> float:
+        if time.monotonic() - self._last_observed > window_seconds:
+            return 0.0
+        return self._average
+    
+    def reset(self) -> None:
+        with self._lock:
+            self._average = 0.0
+            self._last_observed = 0.0
+
+
+pool_wait = PoolWaitTracker()
+
+
+class InstrumentedQueuePool(QueuePool):
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_wait.observe(time.perf_counter() - started)
+
+
+def pool_usage(engine: Optional[Engine], wait_window_seconds: float = 5.0) -> dict:
+    if engine is None:
+        return {"initialized": False}
+    
+    pool = engine.pool
+    usage = {"initialized": True, "class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        capacity = pool.size() + max(0, pool._max_overflow)
+        usage.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(0, pool.overflow()),
+            capacity=capacity,
+            saturation=round(pool.checkedout() / capacity, 4) if capacity else None
+        )
+    usage["checkout_wait_seconds"] = round(pool_wait.recent_wait(wait_window_seconds), 6)
+    return usage
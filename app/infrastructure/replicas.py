@@ -0,0 +1,88 @@
+import itertools
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from app.core.metrics import metrics
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaRouter:
+    def __init__(self, urls: Sequence[str], eject_seconds: float = 30.0, echo: bool = False):
+        self.urls = [url for url in urls if url]
+        self.eject_seconds = eject_seconds
+        self.echo = echo
+        self._engines: Dict[str, Engine] = {}
+        self._ejected_until: Dict[str, float] = {}
+        self._cursor = itertools.count()
+        self._lock = threading.Lock()
+        self._replica_reads = metrics.counter("db.read.replica")
+        self._primary_reads = metrics.counter("db.read.primary")
+        self._ejections = metrics.counter("db.replica.ejections")
+    
+    @property
+    def enabled(self) -> bool:
+        return bool(self.urls)
+    
+    def healthy_urls(self) -> List[str]:
+        now = time.monotonic()
+        return [url for url in self.urls if self._ejected_until.get(url, 0.0) <= now]
+    
+    def candidates(self) -> List[str]:
+        healthy = self.healthy_urls()
+        if not healthy:
+            return []
+        start = next(self._cursor) % len(healthy)
+        return healthy[start:] + healthy[:start]
+    
+    def open_session(self) -> Optional[Session]:
+        for url in self.candidates():
+            session = Session(bind=self._engine(url), autoflush=False, info={"replica": True})
+            try:
+                session.connection()
+            except DBAPIError:
+                session.close()
+                self.eject(url)
+                continue
+            self._replica_reads.inc()
+            return session
+        
+        self._primary_reads.inc()
+        return None
+    
+    def record_primary_read(self) -> None:
+        self._primary_reads.inc()
+    
+    def eject(self, url: str) -> None:
+        self._ejected_until[url] = time.monotonic() + self.eject_seconds
+        self._ejections.inc()
+        logger.warning("Read replica ejected for %.0fs", self.eject_seconds)
+    
+    def dispose(self) -> None:
+        with self._lock:
+            engines, self._engines = self._engines, {}
+        for engine in engines.values():
+            engine.dispose()
+    
+    def _engine(self, url: str) -> Engine:
+        engine = self._engines.get(url)
+        if engine is None:
+            with self._lock:
+                engine = self._engines.get(url)
+                if engine is None:
+                    engine = create_engine(url, pool_pre_ping=True, echo=self.echo)
+                    self._watch(engine, url)
+                    self._engines[url] = engine
+        return engine
+    
+    def _watch(self, engine: Engine, url: str) -> None:
+        @event.listens_for(engine, "handle_error")
+        def eject_on_disconnect(context) -> None:
+            if context.is_disconnect:
+                self.eject(url)
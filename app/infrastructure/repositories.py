@@ -1,15 +1,48 @@
-from typing import List, Optional, Dict
+from datetime import datetime
+from typing import List, Optional, Dict, Sequence
+from sqlalchemy import func, literal, null, select, union_all, update
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from app.domain.interfaces import IProductRepository
-from app.domain.models import Product
-from app.infrastructure.db_models import ProductModel
-from app.core.exceptions import DuplicateSKUError
+from app.domain.models import Product, ProductChange
+from app.domain.reservation_models import Reservation
+from app.infrastructure.db_models import (
+    ProductModel,
+    ProductLocationModel,
+    ProductTombstoneModel,
+    StockReservationModel
+)
+from app.infrastructure.change_feed import next_change_seq
+from app.infrastructure.inventory_summary import record_stock_changes
+from app.infrastructure.invalidation import InvalidationBus, PRODUCT_CHANGED
+from app.core.exceptions import DuplicateSKUError, InsufficientStockError, ProductNotFoundError, VersionConflictError
+
+
+def located_stock(product_id) -> ColumnElement:
+    return (
+        select(func.coalesce(func.sum(ProductLocationModel.stock), 0))
+        .where(ProductLocationModel.product_id == product_id)
+        .scalar_subquery()
+    )
+
+
+def held_stock(product_id) -> ColumnElement:
+    return (
+        select(func.coalesce(func.sum(StockReservationModel.quantity), 0))
+        .where(
+            StockReservationModel.product_id == product_id,
+            StockReservationModel.status == Reservation.ACTIVE,
+            StockReservationModel.expires_at > datetime.utcnow()
+        )
+        .scalar_subquery()
+    )
 
 
 class SQLAlchemyProductRepository(IProductRepository):
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, bus: Optional[InvalidationBus] = None):
         self.db = db
+        self.bus = bus
     
     def create(self, product: Product) -> Product:
         try:
@@ -20,11 +53,17 @@ class SQLAlchemyProductRepository(IProductRepository):
             )
             
             self.db.add(db_product)
-            self.db.commit()
+            self.db.flush()
+            record_stock_changes(self.db, [(db_product.id, None, db_product.stock)])
+            self._publish(db_product.id)
+            db_product.change_seq = next_change_seq(self.db)
+            self.db.flush()
             self.db.refresh(db_product)
+            created = self._to_domain(db_product)
+            self.db.commit()
             
-            return self._to_domain(db_product)
-            
+            return created
+        
         except IntegrityError:
             self.db.rollback()
             raise DuplicateSKUError(product.sku)
@@ -43,29 +82,124 @@ class SQLAlchemyProductRepository(IProductRepository):
         
         return self._to_domain(db_product) if db_product else None
     
+    def get_many_by_ids(self, product_ids: Sequence[int]) -> List[Product]:
+        if not product_ids:
+            return []
+        
+        db_products = self.db.execute(
+            select(ProductModel).where(ProductModel.id.in_(set(product_ids)))
+        ).scalars().all()
+        
+        return [self._to_domain(p) for p in db_products]
+    
+    def get_many_by_skus(self, skus: Sequence[str]) -> List[Product]:
+        if not skus:
+            return []
+        
+        db_products = self.db.execute(
+            select(ProductModel).where(ProductModel.sku.in_(set(skus)))
+        ).scalars().all()
+        
+        return [self._to_domain(p) for p in db_products]
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Product]:
         db_products = self.db.query(ProductModel)\
+            .order_by(ProductModel.id)\
             .offset(skip)\
             .limit(limit)\
             .all()
         
         return [self._to_domain(p) for p in db_products]
     
+    def get_page(self, after_id: int = 0, limit: int = 100) -> List[Product]:
+        db_products = self.db.execute(
+            select(ProductModel)
+            .where(ProductModel.id > after_id)
+            .order_by(ProductModel.id)
+            .limit(limit)
+        ).scalars().all()
+        
+        return [self._to_domain(p) for p in db_products]
+    
     def update(self, product: Product) -> Product:
-        db_product = self.db.query(ProductModel).filter(
-            ProductModel.id == product.id
-        ).first()
+        conditions = [
+            ProductModel.id == product.id,
+            located_stock(ProductModel.id) + held_stock(ProductModel.id) <= product.stock
+        ]
+        if product.version is not None:
+            conditions.append(ProductModel.version == product.version)
         
-        if db_product:
-            db_product.name = product.name
-            db_product.stock = product.stock
+        try:
+            previous_stock = (
+                product.persisted_stock
+                if product.version is not None
+                else self._locked_stock(product.id)
+            )
+            db_product = self.db.execute(
+                update(ProductModel)
+                .where(*conditions)
+                .values(
+                    name=product.name,
+                    stock=product.stock,
+                    version=ProductModel.version + 1
+                )
+                .returning(ProductModel)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            ).scalar_one_or_none()
+            if db_product is None:
+                raise self._update_failure(product)
             
+            updated = self._to_domain(db_product)
+            record_stock_changes(self.db, [(product.id, previous_stock, updated.stock)])
+            self._publish(product.id)
+            self.db.execute(
+                update(ProductModel)
+                .where(ProductModel.id == product.id)
+                .values(change_seq=next_change_seq(self.db))
+                .execution_options(synchronize_session=False)
+            )
             self.db.commit()
-            self.db.refresh(db_product)
+        
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        return updated
+    
+    def adjust_stock(self, product_id: int, delta: int) -> Product:
+        try:
+            db_product = self.db.execute(
+                update(ProductModel)
+                .where(
+                    ProductModel.id == product_id,
+                    located_stock(ProductModel.id) + held_stock(ProductModel.id) <= ProductModel.stock + delta
+                )
+                .values(
+                    stock=ProductModel.stock + delta,
+                    version=ProductModel.version + 1
+                )
+                .returning(ProductModel)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            ).scalar_one_or_none()
+            if db_product is None:
+                raise self._adjust_failure(product_id, delta)
             
-            return self._to_domain(db_product)
+            updated = self._to_domain(db_product)
+            record_stock_changes(self.db, [(product_id, updated.stock - delta, updated.stock)])
+            self._publish(product_id)
+            self.db.execute(
+                update(ProductModel)
+                .where(ProductModel.id == product_id)
+                .values(change_seq=next_change_seq(self.db))
+                .execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+        
+        except Exception:
+            self.db.rollback()
+            raise
         
-        return product
+        return updated
     
     def delete(self, product_id: int) -> bool:
         db_product = self.db.query(ProductModel).filter(
@@ -74,11 +208,104 @@ class SQLAlchemyProductRepository(IProductRepository):
         
         if db_product:
             self.db.delete(db_product)
+            self.db.flush()
+            record_stock_changes(self.db, [(product_id, db_product.stock, None)])
+            self._publish(product_id)
+            self.db.add(ProductTombstoneModel(
+                product_id=db_product.id,
+                sku=db_product.sku,
+                change_seq=next_change_seq(self.db)
+            ))
             self.db.commit()
             return True
         
         return False
     
+    def get_changes(self, since: int, limit: int = 100) -> List[ProductChange]:
+        upserts = select(
+            ProductModel.change_seq.label("seq"),
+            ProductModel.id.label("product_id"),
+            ProductModel.sku.label("sku"),
+            ProductModel.name.label("name"),
+            ProductModel.stock.label("stock"),
+            ProductModel.created_at.label("created_at"),
+            ProductModel.updated_at.label("updated_at"),
+            ProductModel.version.label("version"),
+            literal(False).label("deleted")
+        ).where(ProductModel.change_seq > since).order_by(ProductModel.change_seq).limit(limit)
+        
+        deletes = select(
+            ProductTombstoneModel.change_seq,
+            ProductTombstoneModel.product_id,
+            ProductTombstoneModel.sku,
+            null(),
+            null(),
+            null(),
+            null(),
+            null(),
+            literal(True)
+        ).where(ProductTombstoneModel.change_seq > since).order_by(ProductTombstoneModel.change_seq).limit(limit)
+        
+        feed = union_all(upserts.subquery().select(), deletes.subquery().select()).subquery()
+        rows = self.db.execute(
+            select(feed).order_by(feed.c.seq).limit(limit)
+        ).all()
+        
+        return [
+            ProductChange(
+                seq=row.seq,
+                product_id=row.product_id,
+                sku=row.sku,
+                product=None if row.deleted else Product(
+                    id=row.product_id,
+                    name=row.name,
+                    sku=row.sku,
+                    stock=row.stock,
+                    created_at=row.created_at,
+                    updated_at=row.updated_at,
+                    version=row.version
+                )
+            )
+            for row in rows
+        ]
+    
+    def _locked_stock(self, product_id: int) -> Optional[int]:
+        return self.db.execute(
+            select(ProductModel.stock)
+            .where(ProductModel.id == product_id)
+            .with_for_update()
+        ).scalar_one_or_none()
+    
+    def _update_failure(self, product: Product) -> Exception:
+        current = self.db.execute(
+            select(
+                ProductModel.version,
+                ProductModel.stock,
+                located_stock(ProductModel.id) + held_stock(ProductModel.id)
+            )
+            .where(ProductModel.id == product.id)
+        ).first()
+        if current is None:
+            return ProductNotFoundError(product.id)
+        
+        version, stock, unavailable = current
+        if product.version is not None and version != product.version:
+            return VersionConflictError(product.id, product.version, version)
+        return InsufficientStockError(stock - unavailable, stock - product.stock)
+    
+    def _adjust_failure(self, product_id: int, delta: int) -> Exception:
+        available = self.db.execute(
+            select(ProductModel.stock - located_stock(ProductModel.id) - held_stock(ProductModel.id))
+            .where(ProductModel.id == product_id)
+        ).scalar_one_or_none()
+        if available is None:
+            return ProductNotFoundError(product_id)
+        return InsufficientStockError(available, -delta)
+    
+    def _publish(self, product_id: int) -> None:
+        if self.bus is not None:
+            self.bus.publish(self.db, PRODUCT_CHANGED, product_id)
+    
     def _to_domain(self, db_product: ProductModel) -> Product:
         return Product(
             id=db_product.id,
@@ -86,5 +313,6 @@ class SQLAlchemyProductRepository(IProductRepository):
             sku=db_product.sku,
             stock=db_product.stock,
             created_at=db_product.created_at,
-            updated_at=db_product.updated_at
+            updated_at=db_product.updated_at,
+            version=db_product.version
         )
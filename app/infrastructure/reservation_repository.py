@@ -0,0 +1,194 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+from app.domain.interfaces import IReservationRepository
+from app.domain.reservation_models import Reservation
+from app.infrastructure.db_models import ProductModel, StockReservationModel
+from app.infrastructure.change_feed import next_change_seq
+from app.infrastructure.inventory_summary import record_stock_changes
+from app.infrastructure.repositories import held_stock, located_stock
+from app.infrastructure.invalidation import InvalidationBus, PRODUCT_CHANGED
+from app.core.exceptions import (
+    ProductNotFoundError,
+    InsufficientStockError,
+    ReservationStateError
+)
+
+
+class SQLAlchemyReservationRepository(IReservationRepository):
+    def __init__(self, db: Session, bus: Optional[InvalidationBus] = None):
+        self.db = db
+        self.bus = bus
+    
+    def create(self, reservation: Reservation) -> Reservation:
+        try:
+            stock = self.db.execute(
+                select(ProductModel.stock)
+                .where(ProductModel.id == reservation.product_id)
+                .with_for_update()
+            ).scalar_one_or_none()
+            
+            if stock is None:
+                raise ProductNotFoundError(reservation.product_id)
+            
+            available = (
+                stock
+                - self.db.execute(select(located_stock(reservation.product_id))).scalar_one()
+                - self._reserved_quantity(reservation.product_id)
+            )
+            if available < reservation.quantity:
+                raise InsufficientStockError(available, reservation.quantity)
+            
+            db_reservation = StockReservationModel(
+                product_id=reservation.product_id,
+                quantity=reservation.quantity,
+                status=Reservation.ACTIVE,
+                expires_at=reservation.expires_at
+            )
+            
+            self.db.add(db_reservation)
+            self.db.flush()
+            self.db.refresh(db_reservation)
+            created = self._to_domain(db_reservation)
+            self.db.commit()
+            
+            return created
+        
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    def get_by_id(self, reservation_id: int) -> Optional[Reservation]:
+        db_reservation = self.db.query(StockReservationModel).filter(
+            StockReservationModel.id == reservation_id
+        ).first()
+        
+        return self._to_domain(db_reservation) if db_reservation else None
+    
+    def get_available_stock(self, product_id: int) -> Optional[int]:
+        return self.db.execute(
+            select(ProductModel.stock - located_stock(ProductModel.id) - held_stock(ProductModel.id))
+            .where(ProductModel.id == product_id)
+        ).scalar_one_or_none()
+    
+    def commit(self, reservation: Reservation) -> Reservation:
+        try:
+            self._transition(reservation, Reservation.COMMITTED)
+            
+            remaining = self.db.execute(
+                update(ProductModel)
+                .where(
+                    ProductModel.id == reservation.product_id,
+                    ProductModel.stock
+                    - located_stock(ProductModel.id)
+                    - held_stock(ProductModel.id) >= reservation.quantity
+                )
+                .values(
+                    stock=ProductModel.stock - reservation.quantity,
+                    version=ProductModel.version + 1
+                )
+                .returning(ProductModel.stock)
+            ).scalar_one_or_none()
+            if remaining is None:
+                stock = self.db.execute(
+                    select(ProductModel.stock - located_stock(ProductModel.id) - held_stock(ProductModel.id))
+                    .where(ProductModel.id == reservation.product_id)
+                ).scalar_one_or_none()
+                raise InsufficientStockError(stock or 0, reservation.quantity)
+            record_stock_changes(
+                self.db,
+                [(reservation.product_id, remaining + reservation.quantity, remaining)]
+            )
+            
+            if self.bus is not None:
+                self.bus.publish(self.db, PRODUCT_CHANGED, reservation.product_id)
+            self.db.execute(
+                update(ProductModel)
+                .where(ProductModel.id == reservation.product_id)
+                .values(change_seq=next_change_seq(self.db))
+            )
+            committed = self._reload(reservation.id)
+            self.db.commit()
+        
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        return committed
+    
+    def release(self, reservation: Reservation) -> Reservation:
+        try:
+            self._transition(reservation, Reservation.RELEASED)
+            released = self._reload(reservation.id)
+            self.db.commit()
+        
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        return released
+    
+    def release_expired(self, now: datetime, batch_size: int) -> int:
+        expired_ids = (
+            select(StockReservationModel.id)
+            .where(
+                StockReservationModel.status == Reservation.ACTIVE,
+                StockReservationModel.expires_at <= now
+            )
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        
+        result = self.db.execute(
+            update(StockReservationModel)
+            .where(StockReservationModel.id.in_(expired_ids))
+            .values(status=Reservation.EXPIRED, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        
+        return result.rowcount
+    
+    def _reserved_quantity(self, product_id: int) -> int:
+        return self.db.execute(select(held_stock(product_id))).scalar_one()
+    
+    def _transition(self, reservation: Reservation, status: str) -> None:
+        result = self.db.execute(
+            update(StockReservationModel)
+            .where(
+                StockReservationModel.id == reservation.id,
+                StockReservationModel.status == Reservation.ACTIVE,
+                StockReservationModel.expires_at > datetime.utcnow()
+            )
+            .values(status=status, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            raise ReservationStateError(reservation.id, self._current_status(reservation.id))
+    
+    def _reload(self, reservation_id: int) -> Reservation:
+        return self._to_domain(self.db.get(
+            StockReservationModel, reservation_id, populate_existing=True
+        ))
+    
+    def _current_status(self, reservation_id: int) -> str:
+        db_reservation = self.db.get(
+            StockReservationModel, reservation_id, populate_existing=True
+        )
+        if db_reservation is None:
+            return "missing"
+        if db_reservation.status == Reservation.ACTIVE:
+            return Reservation.EXPIRED
+        return db_reservation.status
+    
+    def _to_domain(self, db_reservation: StockReservationModel) -> Reservation:
+        return Reservation(
+            id=db_reservation.id,
+            product_id=db_reservation.product_id,
+            quantity=db_reservation.quantity,
+            expires_at=db_reservation.expires_at,
+            status=db_reservation.status,
+            created_at=db_reservation.created_at,
+            updated_at=db_reservation.updated_at
+        )
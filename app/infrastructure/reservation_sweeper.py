@@ -0,0 +1,60 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Callable, Optional
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from app.infrastructure.reservation_repository import SQLAlchemyReservationRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReservationSweeper:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        interval_seconds: float = 30.0,
+        batch_size: int = 500
+    ):
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+    
+    def sweep_once(self, now: Optional[datetime] = None) -> int:
+        now = now or datetime.utcnow()
+        released = 0
+        
+        with self.session_factory() as db:
+            repository = SQLAlchemyReservationRepository(db)
+            while True:
+                count = repository.release_expired(now, self.batch_size)
+                released += count
+                if count < self.batch_size:
+                    break
+        
+        return released
+    
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                released = await run_in_threadpool(self.sweep_once)
+                if released:
+                    logger.info("Released %d expired stock reservations", released)
+            except Exception:
+                logger.exception("Reservation sweep failed")
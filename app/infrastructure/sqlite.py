@@ -0,0 +1,93 @@
+import sqlite3
+from typing import Dict, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, URL, make_url
+from app.infrastructure.pool import InstrumentedQueuePool
+
+
+MIN_SQLITE_VERSION = (3, 35, 0)
+
+
+def is_sqlite_file(url) -> bool:
+    url = make_url(url)
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+def parse_pragmas(value: str) -> Dict[str, str]:
+    pragmas = {}
+    for item in value.split(","):
+        name, _, setting = item.partition("=")
+        if name.strip() and setting.strip():
+            pragmas[name.strip()] = setting.strip()
+    return pragmas
+
+
+def profile_pragmas(
+    journal_mode: str = "WAL",
+    synchronous: str = "NORMAL",
+    busy_timeout_ms: int = 5000,
+    mmap_size: int = 256 * 1024 * 1024,
+    extra: Optional[Dict[str, str]] = None
+) -> Dict[str, str]:
+    pragmas = {
+        "busy_timeout": str(busy_timeout_ms),
+        "journal_mode": journal_mode,
+        "synchronous": synchronous,
+        "mmap_size": str(mmap_size),
+        "foreign_keys": "ON"
+    }
+    pragmas.update(extra or {})
+    return pragmas
+
+
+def install_pragma_hook(engine: Engine, pragmas: Dict[str, str], begin: str = "DEFERRED") -> None:
+    @event.listens_for(engine, "connect")
+    def apply_pragmas(dbapi_connection, _) -> None:
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+    
+    @event.listens_for(engine, "begin")
+    def begin_transaction(connection) -> None:
+        connection.exec_driver_sql(f"BEGIN {begin}")
+
+
+def create_sqlite_engines(
+    url: URL,
+    pragmas: Dict[str, str],
+    read_pool_size: int = 8,
+    write_timeout_seconds: float = 30.0,
+    echo: bool = False
+):
+    if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+        raise RuntimeError(
+            f"SQLite {sqlite3.sqlite_version} is too old; "
+            f"{'.'.join(map(str, MIN_SQLITE_VERSION))} or newer is needed for UPDATE ... RETURNING"
+        )
+    
+    connect_args = {"check_same_thread": False, "timeout": int(pragmas.get("busy_timeout", 5000)) / 1000}
+    writer = create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=write_timeout_seconds,
+        connect_args=connect_args,
+        echo=echo
+    )
+    install_pragma_hook(writer, pragmas, begin="IMMEDIATE")
+    
+    reader = create_engine(
+        url,
+        pool_size=read_pool_size,
+        max_overflow=0,
+        connect_args=connect_args,
+        echo=echo
+    )
+    read_pragmas = {name: value for name, value in pragmas.items() if name != "journal_mode"}
+    install_pragma_hook(reader, {**read_pragmas, "query_only": "ON"})
+    return writer, reader
@@ -0,0 +1,137 @@
+import asyncio
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from sqlalchemy.orm import Session
+from app.core.metrics import metrics
+from app.domain.interfaces import IStockEventPublisher
+from app.domain.models import Product
+from app.infrastructure.invalidation import InvalidationMessage
+from app.infrastructure.repositories import SQLAlchemyProductRepository
+
+
+def stock_event(product: Product, delta: Optional[int], kind: str = "stock") -> dict:
+    return {
+        "type": kind,
+        "product_id": product.id,
+        "sku": product.sku,
+        "stock": product.stock,
+        "delta": delta,
+        "updated_at": product.updated_at.isoformat() if product.updated_at else None
+    }
+
+
+class StockSubscription:
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue_size: int):
+        self.loop = loop
+        self.queue: "asyncio.Queue[Optional[dict]]" = asyncio.Queue(queue_size)
+        self.product_ids: Set[int] = set()
+        self.dropped = False
+    
+    async def next_event(self, timeout: Optional[float] = None) -> Optional[dict]:
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+
+class StockBroadcaster(IStockEventPublisher):
+    def __init__(self, queue_size: int = 64):
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[StockSubscription]] = {}
+        self._last_stock: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._connections = metrics.gauge("stream.subscribers")
+        self._sent = metrics.counter("stream.events_sent")
+        self._dropped = metrics.counter("stream.dropped")
+        self._count = 0
+    
+    def subscribe(self, products: Iterable[Product]) -> StockSubscription:
+        subscription = StockSubscription(asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            for product in products:
+                subscription.product_ids.add(product.id)
+                self._subscribers.setdefault(product.id, set()).add(subscription)
+                self._last_stock.setdefault(product.id, product.stock)
+            self._count += 1
+            self._connections.set(self._count)
+        return subscription
+    
+    def unsubscribe(self, subscription: StockSubscription) -> None:
+        with self._lock:
+            if subscription.product_ids is None:
+                return
+            for product_id in subscription.product_ids:
+                subscribers = self._subscribers.get(product_id)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[product_id]
+                        self._last_stock.pop(product_id, None)
+            subscription.product_ids = None
+            self._count -= 1
+            self._connections.set(self._count)
+    
+    def is_watched(self, product_id: int) -> bool:
+        return product_id in self._subscribers
+    
+    def publish(self, product: Product, delta: Optional[int] = None) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(product.id)
+            if not subscribers:
+                return
+            previous = self._last_stock.get(product.id)
+            self._last_stock[product.id] = product.stock
+            by_loop: Dict[asyncio.AbstractEventLoop, List[StockSubscription]] = {}
+            for subscription in subscribers:
+                by_loop.setdefault(subscription.loop, []).append(subscription)
+        
+        if delta is None and previous is not None:
+            delta = product.stock - previous
+        if delta == 0:
+            return
+        
+        event = stock_event(product, delta)
+        for loop, targets in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(self._fan_out, targets, event)
+            except RuntimeError:
+                for subscription in targets:
+                    self.unsubscribe(subscription)
+    
+    def _fan_out(self, targets: List[StockSubscription], event: dict) -> None:
+        for subscription in targets:
+            if subscription.dropped:
+                continue
+            try:
+                subscription.queue.put_nowait(event)
+                self._sent.inc()
+            except asyncio.QueueFull:
+                self._drop(subscription)
+    
+    def _drop(self, subscription: StockSubscription) -> None:
+        subscription.dropped = True
+        self.unsubscribe(subscription)
+        self._dropped.inc()
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+
+
+def refresh_on(
+    broadcaster: StockBroadcaster,
+    origin: str,
+    session_factory: Callable[[], Session]
+) -> Callable[[InvalidationMessage], None]:
+    def refresh(message: InvalidationMessage) -> None:
+        if message.origin == origin or message.key is None:
+            return
+        try:
+            product_id = int(message.key)
+        except ValueError:
+            return
+        if not broadcaster.is_watched(product_id):
+            return
+        
+        with session_factory() as db:
+            product = SQLAlchemyProductRepository(db).get_by_id(product_id)
+        if product is not None:
+            broadcaster.publish(product)
+    
+    return refresh
@@ -0,0 +1,52 @@
+import json
+import logging
+import queue
+from logging.handlers import QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Optional
+from app.core.metrics import metrics
+
+
+class NDJSONFileWriter:
+    def __init__(self, path: str, max_bytes: int, backup_count: int, queue_size: int = 10000):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._queue: "queue.Queue[logging.LogRecord]" = queue.Queue(queue_size)
+        self._listener: Optional[QueueListener] = None
+        self._handler: Optional[RotatingFileHandler] = None
+        self._written = metrics.counter(f"capture.{self.path.stem}.records")
+        self._dropped = metrics.counter(f"capture.{self.path.stem}.dropped")
+    
+    def start(self) -> None:
+        if self._listener is not None:
+            return
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handler = RotatingFileHandler(
+            self.path,
+            maxBytes=self.max_bytes,
+            backupCount=self.backup_count,
+            encoding="utf-8"
+        )
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+        self._listener = QueueListener(self._queue, self._handler)
+        self._listener.start()
+    
+    def write(self, record: dict) -> None:
+        line = json.dumps(record, separators=(",", ":"), default=str)
+        try:
+            self._queue.put_nowait(logging.makeLogRecord({"msg": line}))
+        except queue.Full:
+            self._dropped.inc()
+            return
+        self._written.inc()
+    
+    def stop(self) -> None:
+        if self._listener is None:
+            return
+        
+        self._listener.stop()
+        self._handler.close()
+        self._listener = None
+        self._handler = None
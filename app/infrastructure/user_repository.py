@@ -3,11 +3,13 @@ from sqlalchemy.orm import Session
 from app.domain.user_models import User
 from app.domain.interfaces import IUserRepository
 from app.infrastructure.db_models import UserModel
+from app.infrastructure.invalidation import InvalidationBus, USER_CHANGED
 
 
 class UserRepository(IUserRepository):
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, bus: Optional[InvalidationBus] = None):
         self.db = db
+        self.bus = bus
     
     def _to_domain(self, db_user: UserModel) -> User:
         return User(
@@ -57,7 +59,11 @@ class UserRepository(IUserRepository):
             is_active=user.is_active
         )
         self.db.add(db_user)
-        self.db.commit()
+        if self.bus is not None:
+            self.bus.publish(self.db, USER_CHANGED, user.username)
+        self.db.flush()
         self.db.refresh(db_user)
-        return self._to_domain(db_user)
+        created = self._to_domain(db_user)
+        self.db.commit()
+        return created
 
@@ -1,8 +1,42 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.core.config import settings
-from app.infrastructure.database import create_tables
-from app.api.routers import products_router, auth_router
+from app.core.metrics import metrics
+from app.infrastructure.database import create_tables, current_engine, get_session, replica_router
+from app.infrastructure.health import DatabaseHealthMonitor, ErrorRateTracker
+from app.infrastructure.reservation_sweeper import ReservationSweeper
+from app.infrastructure.inventory_reconciler import InventoryReconciler
+from app.infrastructure.job_runner import JobRunner
+from app.infrastructure.job_handlers import (
+    InventoryReconcileHandler,
+    ProductExportHandler,
+    ProductImportHandler
+)
+from app.api.routers import (
+    products_router,
+    auth_router,
+    reservations_router,
+    subscriptions_router,
+    locations_router,
+    allocations_router,
+    inventory_router,
+    jobs_router
+)
+from app.api.dependency_factories import invalidation_bus, job_signal
+from app.api.schemas import ProductResponse
+from app.api.middleware import (
+    AccessLogMiddleware,
+    AdmissionControlMiddleware,
+    AdmissionController,
+    CompressionMiddleware,
+    ErrorRateMiddleware,
+    ReadYourWritesMiddleware,
+    TrafficCaptureMiddleware
+)
+from app.infrastructure.pool import pool_usage, pool_wait
+from app.infrastructure.traffic_capture import NDJSONFileWriter
+from app.infrastructure.access_log import AccessLogWriter, instrument_query_timing
 
 
 app = FastAPI(
@@ -13,6 +47,78 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
+db_health = DatabaseHealthMonitor(
+    settings.DATABASE_URL,
+    interval_seconds=settings.HEALTH_CHECK_INTERVAL_SECONDS,
+    timeout_seconds=settings.HEALTH_CHECK_TIMEOUT_SECONDS,
+    check_schema=not settings.DB_AUTO_CREATE_TABLES,
+    require_schema=settings.DB_SCHEMA_CHECK_STRICT
+)
+
+error_rate = ErrorRateTracker(settings.HEALTH_ERROR_WINDOW_SECONDS)
+
+access_log = AccessLogWriter(queue_size=settings.ACCESS_LOG_QUEUE_SIZE)
+
+capture_writer = NDJSONFileWriter(
+    settings.CAPTURE_PATH,
+    max_bytes=settings.CAPTURE_MAX_BYTES,
+    backup_count=settings.CAPTURE_BACKUP_COUNT
+)
+
+reservation_sweeper = ReservationSweeper(
+    get_session,
+    interval_seconds=settings.RESERVATION_SWEEP_INTERVAL_SECONDS,
+    batch_size=settings.RESERVATION_SWEEP_BATCH_SIZE
+)
+
+inventory_reconciler = InventoryReconciler(
+    get_session,
+    interval_seconds=settings.INVENTORY_RECONCILE_INTERVAL_SECONDS
+)
+
+job_runner = JobRunner(
+    get_session,
+    handlers=[
+        ProductImportHandler(invalidation_bus),
+        ProductExportHandler(
+            settings.JOB_EXPORT_DIR,
+            lambda product: ProductResponse.model_validate(product).model_dump_json()
+        ),
+        InventoryReconcileHandler()
+    ],
+    signal=job_signal,
+    workers=settings.JOB_WORKERS,
+    poll_interval_seconds=settings.JOB_POLL_INTERVAL_SECONDS,
+    lease_seconds=settings.JOB_LEASE_SECONDS,
+    chunk_size=settings.JOB_CHUNK_SIZE,
+    max_attempts=settings.JOB_MAX_ATTEMPTS
+)
+
+if settings.ADMISSION_ENABLED:
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        controller=AdmissionController(
+            settings.ADMISSION_MAX_CONCURRENCY,
+            reserved={
+                "health": settings.ADMISSION_HEALTH_RESERVED,
+                "auth": settings.ADMISSION_AUTH_RESERVED
+            },
+            max_queue=settings.ADMISSION_MAX_QUEUE,
+            queue_timeout_seconds=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS
+        ),
+        lanes={
+            "health": ("/health", "/metrics"),
+            "auth": (f"{settings.API_V1_PREFIX}/auth",)
+        },
+        exempt_prefixes=(
+            f"{settings.API_V1_PREFIX}/subscriptions",
+            f"{settings.API_V1_PREFIX}/products/changes"
+        ),
+        pool_wait=lambda: pool_wait.recent_wait(settings.ADMISSION_POOL_WAIT_WINDOW_SECONDS),
+        pool_wait_threshold_seconds=settings.ADMISSION_POOL_WAIT_THRESHOLD_SECONDS,
+        retry_after_seconds=settings.ADMISSION_RETRY_AFTER_SECONDS
+    )
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -21,21 +127,101 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=settings.COMPRESSION_ENCODINGS.split(","),
+        levels={
+            "gzip": settings.COMPRESSION_GZIP_LEVEL,
+            "br": settings.COMPRESSION_BROTLI_QUALITY,
+            "zstd": settings.COMPRESSION_ZSTD_LEVEL
+        },
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        content_types=settings.COMPRESSION_CONTENT_TYPES.split(",")
+    )
+
+if replica_router.enabled and settings.READ_YOUR_WRITES_SECONDS > 0:
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        cookie_name=settings.READ_YOUR_WRITES_COOKIE,
+        window_seconds=settings.READ_YOUR_WRITES_SECONDS,
+        exempt_paths={f"{settings.API_V1_PREFIX}/products/lookup"}
+    )
+
+if settings.CAPTURE_ENABLED:
+    app.add_middleware(
+        TrafficCaptureMiddleware,
+        writer=capture_writer.write,
+        sample_rate=settings.CAPTURE_SAMPLE_RATE,
+        capture_bodies=settings.CAPTURE_BODIES,
+        max_body_bytes=settings.CAPTURE_MAX_BODY_BYTES,
+        exclude_prefixes=(
+            "/health",
+            "/metrics",
+            f"{settings.API_V1_PREFIX}/subscriptions",
+            f"{settings.API_V1_PREFIX}/products/changes"
+        )
+    )
+
+app.add_middleware(
+    ErrorRateMiddleware,
+    tracker=error_rate,
+    exclude_prefixes=("/health", "/metrics")
+)
+
+if settings.ACCESS_LOG_ENABLED:
+    instrument_query_timing()
+    app.add_middleware(
+        AccessLogMiddleware,
+        writer=access_log.write,
+        sample_rate=settings.ACCESS_LOG_SAMPLE_RATE,
+        slow_threshold_ms=settings.ACCESS_LOG_SLOW_MS,
+        exclude_prefixes=(
+            f"{settings.API_V1_PREFIX}/subscriptions",
+            f"{settings.API_V1_PREFIX}/products/changes"
+        )
+    )
+
 
 @app.on_event("startup")
 async def startup_event():
-    create_tables()
+    if settings.DB_AUTO_CREATE_TABLES:
+        create_tables()
+    invalidation_bus.start()
+    reservation_sweeper.start()
+    inventory_reconciler.start()
+    if settings.JOBS_ENABLED:
+        job_runner.start()
+    db_health.start()
+    if settings.CAPTURE_ENABLED:
+        capture_writer.start()
+    if settings.ACCESS_LOG_ENABLED:
+        access_log.start()
     print(f"🚀 {settings.APP_NAME} v{settings.APP_VERSION} started")
     print(f"📚 API Documentation: http://localhost:8000/docs")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    await reservation_sweeper.stop()
+    await inventory_reconciler.stop()
+    await job_runner.stop()
+    await db_health.stop()
+    invalidation_bus.stop()
+    replica_router.dispose()
+    capture_writer.stop()
+    access_log.stop()
     print(f"👋 {settings.APP_NAME} shutting down")
 
 
 app.include_router(auth_router, prefix=settings.API_V1_PREFIX)
 app.include_router(products_router, prefix=settings.API_V1_PREFIX)
+app.include_router(reservations_router, prefix=settings.API_V1_PREFIX)
+app.include_router(subscriptions_router, prefix=settings.API_V1_PREFIX)
+app.include_router(locations_router, prefix=settings.API_V1_PREFIX)
+app.include_router(allocations_router, prefix=settings.API_V1_PREFIX)
+app.include_router(inventory_router, prefix=settings.API_V1_PREFIX)
+app.include_router(jobs_router, prefix=settings.API_V1_PREFIX)
 
 
 @app.get("/", tags=["Health"])
@@ -48,9 +234,31 @@ async def root():
 
 
 @app.get("/health", tags=["Health"])
+@app.get("/health/live", tags=["Health"])
 async def health_check():
     return {
         "status": "healthy",
         "service": settings.APP_NAME,
         "version": settings.APP_VERSION
     }
+
+
+@app.get("/metrics", tags=["Health"])
+async def metrics_snapshot():
+    return metrics.snapshot()
+
+
+@app.get("/health/ready", tags=["Health"])
+async def readiness_check():
+    database = db_health.status()
+    content = {
+        "status": database.pop("status"),
+        "service": settings.APP_NAME,
+        "version": settings.APP_VERSION,
+        "database": database,
+        "pool": pool_usage(current_engine(), settings.ADMISSION_POOL_WAIT_WINDOW_SECONDS),
+        "requests": error_rate.snapshot()
+    }
+    if content["status"] != "ready":
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=content)
+    return content
@@ -0,0 +1,233 @@
+"""Replay a traffic capture against a local instance and report latency per route.
+
+Usage:
+    python -m app.tools.replay captures/traffic.ndjson* --target http://localhost:8000
+    python -m app.tools.replay captures/traffic.ndjson --asgi app.main:app --speedup 10 --concurrency 32
+
+Captures are written by ``TrafficCaptureMiddleware`` (``CAPTURE_ENABLED=true``).
+Requests are re-issued in capture order, spaced by their original offsets
+divided by ``--speedup`` (``0`` sends as fast as ``--concurrency`` allows).
+``--target`` uses a real HTTP client; ``--asgi`` imports the app and drives it
+in-process. With ``--username``/``--password`` the tool logs in (lazily, so a
+captured registration can run first) and sends that token on requests that
+were authenticated when captured; the same password fills redacted fields and
+login forms. Captured IDs are replayed
+verbatim, so seed the target with matching data or expect 404s in the error
+breakdown.
+"""
+import argparse
+import asyncio
+import glob
+import importlib
+import json
+import math
+import sys
+import time
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence
+import httpx
+from app.api.middleware.capture import REDACTED
+
+
+def load_capture(patterns: Sequence[str]) -> List[dict]:
+    records = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)) or [pattern]:
+            with open(path, encoding="utf-8") as capture:
+                records.extend(json.loads(line) for line in capture if line.strip())
+    return sorted(records, key=lambda record: record["ts"])
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = math.ceil(fraction * len(sorted_values)) - 1
+    return sorted_values[max(0, min(len(sorted_values) - 1, index))]
+
+
+def _fill_redacted(value, password: Optional[str]):
+    if isinstance(value, dict):
+        return {key: _fill_redacted(item, password) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_fill_redacted(item, password) for item in value]
+    if value == REDACTED and password is not None:
+        return password
+    return value
+
+
+class Replayer:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        speedup: float = 1.0,
+        concurrency: int = 16,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        login_path: str = "/api/v1/auth/login"
+    ):
+        self.client = client
+        self.speedup = speedup
+        self.concurrency = concurrency
+        self.username = username
+        self.password = password
+        self.login_path = login_path
+        self.token: Optional[str] = None
+        self._login_lock = asyncio.Lock()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+    
+    async def login(self) -> Optional[str]:
+        if self.username is None or self.password is None:
+            return None
+        
+        async with self._login_lock:
+            if self.token is None:
+                response = await self.client.post(self.login_path, data=self._credentials())
+                if response.status_code == 200:
+                    self.token = response.json()["access_token"]
+        return self.token
+    
+    async def run(self, records: Iterable[dict]) -> None:
+        records = list(records)
+        if not records:
+            return
+        semaphore = asyncio.Semaphore(self.concurrency)
+        first_ts = records[0]["ts"]
+        started = time.perf_counter()
+        
+        async def fire(record: dict) -> None:
+            if self.speedup > 0:
+                delay = (record["ts"] - first_ts) / self.speedup - (time.perf_counter() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            async with semaphore:
+                await self.send(record)
+        
+        await asyncio.gather(*(fire(record) for record in records))
+    
+    async def send(self, record: dict) -> None:
+        route = f"{record['method']} {record['route']}"
+        if record.get("authenticated") and self.token is None:
+            await self.login()
+        request = self._build(record)
+        sent = time.perf_counter()
+        try:
+            response = await self.client.request(**request)
+        except httpx.HTTPError as e:
+            self.errors[(route, type(e).__name__)] += 1
+            return
+        self.latencies[route].append((time.perf_counter() - sent) * 1000)
+        if record["path"] == self.login_path and response.status_code == 200 and self.token is None:
+            self.token = response.json().get("access_token")
+        if response.status_code >= 400:
+            self.errors[(route, str(response.status_code))] += 1
+    
+    def report(self) -> dict:
+        routes = {}
+        for route, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            routes[route] = {
+                "count": len(values),
+                "p50_ms": round(percentile(values, 0.50), 3),
+                "p90_ms": round(percentile(values, 0.90), 3),
+                "p99_ms": round(percentile(values, 0.99), 3),
+                "max_ms": round(values[-1], 3),
+            }
+        errors = [
+            {"route": route, "error": error, "count": count}
+            for (route, error), count in self.errors.most_common()
+        ]
+        return {"routes": routes, "errors": errors}
+    
+    def _build(self, record: dict) -> dict:
+        request = {
+            "method": record["method"],
+            "url": record["path"] + (f"?{record['query']}" if record.get("query") else ""),
+            "headers": {},
+        }
+        if record.get("authenticated") and self.token:
+            request["headers"]["Authorization"] = f"Bearer {self.token}"
+        if record["path"] == self.login_path and self.username is not None:
+            request["data"] = self._credentials()
+        elif "body" in record:
+            request["json"] = _fill_redacted(record["body"], self.password)
+        return request
+    
+    def _credentials(self) -> dict:
+        return {"username": self.username, "password": self.password}
+
+
+def format_report(report: dict) -> str:
+    lines = [f"{'route':<50} {'count':>7} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}"]
+    for route, stats in report["routes"].items():
+        lines.append(
+            f"{route:<50} {stats['count']:>7} {stats['p50_ms']:>9.2f} {stats['p90_ms']:>9.2f} "
+            f"{stats['p99_ms']:>9.2f} {stats['max_ms']:>9.2f}"
+        )
+    if report["errors"]:
+        lines.append("")
+        lines.append("errors:")
+        for error in report["errors"]:
+            lines.append(f"  {error['count']:>7}  {error['error']:<20} {error['route']}")
+    return "\n".join(lines)
+
+
+def _import_app(target: str):
+    module_name, _, attribute = target.partition(":")
+    return getattr(importlib.import_module(module_name), attribute or "app")
+
+
+async def replay(args: argparse.Namespace) -> dict:
+    records = load_capture(args.capture)
+    if args.limit:
+        records = records[:args.limit]
+    
+    app = None
+    if args.asgi:
+        app = _import_app(args.asgi)
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://replay")
+        await app.router.startup()
+    else:
+        client = httpx.AsyncClient(base_url=args.target, timeout=args.timeout)
+    
+    try:
+        replayer = Replayer(
+            client,
+            speedup=args.speedup,
+            concurrency=args.concurrency,
+            username=args.username,
+            password=args.password
+        )
+        await replayer.run(records)
+        return replayer.report()
+    finally:
+        await client.aclose()
+        if app is not None:
+            await app.router.shutdown()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("capture", nargs="+", help="capture files or glob patterns (rotated files included)")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--target", help="base URL of a running instance")
+    target.add_argument("--asgi", help="module:attribute of an ASGI app to drive in-process")
+    parser.add_argument("--speedup", type=float, default=1.0, help="time compression factor; 0 = no pacing")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--limit", type=int, default=0, help="replay only the first N records")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--username")
+    parser.add_argument("--password")
+    parser.add_argument("--json", dest="json_path", help="also write the report as JSON")
+    args = parser.parse_args(argv)
+    
+    report = asyncio.run(replay(args))
+    print(format_report(report))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
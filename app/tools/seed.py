@@ -0,0 +1,274 @@
+"""Generate a synthetic catalog and user base for scale testing.
+
+Usage:
+    python -m app.tools.seed --products 2000000 --users 5000 --seed 7
+    python -m app.tools.seed --products 100000 --hot-keys hot_skus.txt --hot-key-samples 500000
+
+Writes straight to ``DATABASE_URL``, which must already be migrated
+(``alembic upgrade head``). Every column is sampled up front with NumPy from
+generators seeded by ``--seed``, so the same seed and counts give the same
+rows on an empty database, and changing ``--users`` does not change the
+products. SKUs mix three formats: ``CAT-0001234``, ``CAT-0001234-XL`` and
+EAN-13 codes with the GS1 in-store prefix 20. Categories are skewed. About
+``--out-of-stock`` of products have no stock, and the rest follow a log-normal
+distribution with a median of ``--stock-median`` units. ``--hot-keys`` writes
+``--hot-key-samples`` SKUs drawn from a Zipf distribution (exponent
+``--zipf-exponent``) over a seeded popularity order, one per line, for load
+generators that need a realistic hot set.
+
+Rows are bulk-loaded in ``--batch-size`` transactions, with COPY on
+PostgreSQL and executemany elsewhere. Each batch stamps ``change_seq`` from
+the change counter and applies the inventory summary deltas, as the API
+does. Users share ``--password``, hashed ``--password-hashes`` times with
+seeded salts before loading, so no bcrypt work happens per user. The
+invalidation bus is not used, so running workers may serve cached misses
+for new SKUs until their TTL expires.
+"""
+import argparse
+import csv
+import io
+import sys
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+from sqlalchemy import Table, func, insert, select, text
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.security import get_pwd_context
+from app.infrastructure.change_feed import next_change_seq
+from app.infrastructure.database import get_session
+from app.infrastructure.db_models import ProductModel, UserModel
+from app.infrastructure.inventory_summary import apply_summary_delta
+
+
+CATEGORIES = ("ELC", "HOM", "APP", "TOY", "FOD", "GRD", "SPT", "BTY", "OFF", "AUT")
+CATEGORY_WEIGHTS = (0.18, 0.16, 0.14, 0.10, 0.09, 0.08, 0.08, 0.07, 0.06, 0.04)
+SIZES = ("XS", "S", "M", "L", "XL", "XXL")
+SKU_FORMAT_WEIGHTS = (0.60, 0.25, 0.15)
+EAN_PREFIX = 200_000_000_000
+ADJECTIVES = (
+    "Classic", "Compact", "Deluxe", "Eco", "Essential", "Heavy-Duty", "Lightweight", "Modern",
+    "Portable", "Premium", "Pro", "Rugged", "Smart", "Soft", "Ultra", "Vintage", "Wireless"
+)
+NOUNS = (
+    "Backpack", "Blender", "Bottle", "Cable", "Chair", "Charger", "Desk Lamp", "Drill", "Headphones",
+    "Jacket", "Kettle", "Keyboard", "Mug", "Notebook", "Pan", "Pillow", "Sneakers", "Speaker",
+    "Tent", "Toaster", "Towel", "Umbrella", "Watch"
+)
+SALT_ALPHABET = np.array(list("./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"))
+SALT_LAST = np.array(list(".Oeu"))
+
+
+class Catalog(NamedTuple):
+    serials: np.ndarray
+    categories: np.ndarray
+    formats: np.ndarray
+    sizes: np.ndarray
+    adjectives: np.ndarray
+    nouns: np.ndarray
+    stock: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.serials)
+    
+    def skus(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        window = slice(start, stop)
+        return format_skus(self.serials[window], self.categories[window], self.formats[window], self.sizes[window])
+    
+    def names(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        return [
+            f"{ADJECTIVES[adjective]} {NOUNS[noun]}"
+            for adjective, noun in zip(self.adjectives[start:stop].tolist(), self.nouns[start:stop].tolist())
+        ]
+
+
+def ean13(codes: np.ndarray) -> np.ndarray:
+    digits = (codes[:, None] // 10 ** np.arange(11, -1, -1)) % 10
+    weighted = (digits * np.tile([1, 3], 6)).sum(axis=1)
+    return codes * 10 + (10 - weighted % 10) % 10
+
+
+def format_skus(serials: np.ndarray, categories: np.ndarray, formats: np.ndarray, sizes: np.ndarray) -> List[str]:
+    eans = ean13(EAN_PREFIX + serials).tolist()
+    skus = []
+    for serial, category, sku_format, size, ean in zip(
+        serials.tolist(), categories.tolist(), formats.tolist(), sizes.tolist(), eans
+    ):
+        if sku_format == 0:
+            skus.append(f"{CATEGORIES[category]}-{serial:07d}")
+        elif sku_format == 1:
+            skus.append(f"{CATEGORIES[category]}-{serial:07d}-{SIZES[size]}")
+        else:
+            skus.append(f"{ean:013d}")
+    return skus
+
+
+def generate_catalog(
+    rng: np.random.Generator,
+    count: int,
+    first_serial: int = 1,
+    out_of_stock: float = 0.04,
+    stock_median: float = 20.0,
+    stock_sigma: float = 1.2,
+    max_stock: int = 100_000
+) -> Catalog:
+    stock = np.ceil(rng.lognormal(np.log(stock_median), stock_sigma, count))
+    stock = np.clip(stock, 1, max_stock).astype(np.int64)
+    stock[rng.random(count) < out_of_stock] = 0
+    return Catalog(
+        serials=np.arange(first_serial, first_serial + count, dtype=np.int64),
+        categories=rng.choice(len(CATEGORIES), size=count, p=CATEGORY_WEIGHTS).astype(np.int8),
+        formats=rng.choice(len(SKU_FORMAT_WEIGHTS), size=count, p=SKU_FORMAT_WEIGHTS).astype(np.int8),
+        sizes=rng.integers(0, len(SIZES), count, dtype=np.int8),
+        adjectives=rng.integers(0, len(ADJECTIVES), count, dtype=np.int16),
+        nouns=rng.integers(0, len(NOUNS), count, dtype=np.int16),
+        stock=stock
+    )
+
+
+def zipf_sample(rng: np.random.Generator, count: int, samples: int, exponent: float = 1.1) -> np.ndarray:
+    by_popularity = rng.permutation(count)
+    weights = 1.0 / np.arange(1, count + 1, dtype=np.float64) ** exponent
+    return by_popularity[rng.choice(count, size=samples, p=weights / weights.sum())]
+
+
+def password_hashes(rng: np.random.Generator, password: str, count: int) -> List[str]:
+    handler = get_pwd_context().handler("bcrypt")
+    hashes = []
+    for _ in range(count):
+        salt = "".join(rng.choice(SALT_ALPHABET, 21)) + rng.choice(SALT_LAST)
+        hashes.append(handler.using(salt=salt).hash(password))
+    return hashes
+
+
+def summary_deltas(ids: np.ndarray, stock: np.ndarray, shards: int, threshold: int) -> Dict[int, Tuple[int, int, int, int]]:
+    shard = ids % shards
+    columns = [
+        np.bincount(shard, minlength=shards),
+        np.bincount(shard, weights=stock, minlength=shards),
+        np.bincount(shard, weights=stock <= 0, minlength=shards),
+        np.bincount(shard, weights=(stock > 0) & (stock < threshold), minlength=shards)
+    ]
+    return {
+        index: tuple(int(column[index]) for column in columns)
+        for index in np.flatnonzero(columns[0]).tolist()
+    }
+
+
+def next_serial(db: Session, model) -> int:
+    return db.execute(select(func.coalesce(func.max(model.id), 0))).scalar_one() + 1
+
+
+def reserve_product_ids(db: Session, count: int) -> np.ndarray:
+    if db.get_bind().dialect.name == "postgresql":
+        return np.array(db.execute(
+            text("SELECT nextval(pg_get_serial_sequence('products', 'id')) FROM generate_series(1, :count)"),
+            {"count": count}
+        ).scalars().all(), dtype=np.int64)
+    start = next_serial(db, ProductModel)
+    return np.arange(start, start + count, dtype=np.int64)
+
+
+def bulk_insert(db: Session, table: Table, columns: Sequence[str], rows: Iterable[tuple]) -> None:
+    if db.get_bind().dialect.name == "postgresql":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        cursor = db.connection().connection.driver_connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+        finally:
+            cursor.close()
+    else:
+        db.execute(insert(table), [dict(zip(columns, row)) for row in rows])
+
+
+def load_products(db: Session, catalog: Catalog, batch_size: int = 10_000) -> int:
+    shards = max(1, settings.INVENTORY_SUMMARY_SHARDS)
+    for start in range(0, len(catalog), batch_size):
+        stop = min(start + batch_size, len(catalog))
+        count = stop - start
+        try:
+            ids = reserve_product_ids(db, count)
+            stock = catalog.stock[start:stop]
+            last_seq = next_change_seq(db, count=count)
+            bulk_insert(
+                db,
+                ProductModel.__table__,
+                ("id", "name", "sku", "stock", "change_seq"),
+                zip(ids.tolist(), catalog.names(start, stop), catalog.skus(start, stop), stock.tolist(),
+                    range(last_seq - count + 1, last_seq + 1))
+            )
+            for shard, delta in summary_deltas(ids, stock, shards, settings.LOW_STOCK_THRESHOLD).items():
+                apply_summary_delta(db, shard, *delta)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+    return len(catalog)
+
+
+def load_users(db: Session, count: int, hashes: Sequence[str], first_serial: int = 1, batch_size: int = 10_000) -> int:
+    for start in range(0, count, batch_size):
+        serials = range(first_serial + start, first_serial + min(start + batch_size, count))
+        try:
+            bulk_insert(
+                db,
+                UserModel.__table__,
+                ("username", "email", "hashed_password", "is_active"),
+                ((f"user{serial:07d}", f"user{serial:07d}@example.com", hashes[serial % len(hashes)], True)
+                 for serial in serials)
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+    return count
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--out-of-stock", type=float, default=0.04, help="fraction of products with no stock")
+    parser.add_argument("--stock-median", type=float, default=20.0)
+    parser.add_argument("--password", default="loadtest123", help="login password for every generated user")
+    parser.add_argument("--password-hashes", type=int, default=16, help="distinct bcrypt hashes to spread over users")
+    parser.add_argument("--hot-keys", help="write Zipf-distributed SKUs to this file, one per line")
+    parser.add_argument("--hot-key-samples", type=int, default=100_000)
+    parser.add_argument("--zipf-exponent", type=float, default=1.1)
+    args = parser.parse_args(argv)
+    
+    with get_session() as db:
+        started = time.perf_counter()
+        catalog = generate_catalog(
+            np.random.default_rng([args.seed, 0]),
+            args.products,
+            first_serial=next_serial(db, ProductModel),
+            out_of_stock=args.out_of_stock,
+            stock_median=args.stock_median
+        )
+        load_products(db, catalog, args.batch_size)
+        elapsed = time.perf_counter() - started
+        print(f"products: {len(catalog)} in {elapsed:.1f}s ({len(catalog) / max(elapsed, 1e-9):.0f}/s)")
+        
+        if args.users:
+            started = time.perf_counter()
+            hashes = password_hashes(np.random.default_rng([args.seed, 1]), args.password, max(1, args.password_hashes))
+            load_users(db, args.users, hashes, next_serial(db, UserModel), args.batch_size)
+            elapsed = time.perf_counter() - started
+            print(f"users: {args.users} in {elapsed:.1f}s, password {args.password!r}")
+    
+    if args.hot_keys and len(catalog):
+        picks = zipf_sample(np.random.default_rng([args.seed, 2]), len(catalog), args.hot_key_samples, args.zipf_exponent)
+        skus = format_skus(catalog.serials[picks], catalog.categories[picks], catalog.formats[picks], catalog.sizes[picks])
+        with open(args.hot_keys, "w", encoding="utf-8") as output:
+            output.write("\n".join(skus) + "\n")
+        print(f"hot keys: {len(skus)} samples over {len(np.unique(picks))} SKUs written to {args.hot_keys}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Compression cost versus bytes saved for a large ``GET /api/v1/products`` page.
+
+Usage:
+    python -m benchmarks.compression [--products 1000] [--repeats 20]
+
+Seeds a throwaway SQLite database with ``--products`` products, fetches
+``GET /api/v1/products?limit=N`` through the ASGI app with compression
+disabled to get the exact JSON body clients receive, then compresses that
+body with every codec the compression middleware can use here (gzip always;
+brotli and zstd when their packages are installed) at several levels. Reports
+CPU time per response and the compressed size, so a level can be picked for
+``COMPRESSION_GZIP_LEVEL`` / ``COMPRESSION_BROTLI_QUALITY`` /
+``COMPRESSION_ZSTD_LEVEL``.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+DB_FILE = Path(tempfile.gettempdir()) / "compression_bench.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_FILE}"
+os.environ["COMPRESSION_ENABLED"] = "false"
+os.environ.setdefault("ADMISSION_ENABLED", "false")
+os.environ.setdefault("RATE_LIMIT_PER_SECOND", "0")
+os.environ.setdefault("ACCESS_LOG_ENABLED", "false")
+
+LEVELS = {"gzip": (1, 4, 6, 9), "br": (1, 4, 6, 9), "zstd": (1, 3, 6, 12)}
+
+
+async def fetch_page(products: int) -> bytes:
+    import httpx
+    from app.infrastructure.database import create_tables
+    from app.main import app
+
+    create_tables()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post("/api/v1/auth/register", json={
+            "username": "bench", "email": "bench@example.com", "password": "benchpass123"
+        })
+        token = (await client.post(
+            "/api/v1/auth/login", data={"username": "bench", "password": "benchpass123"}
+        )).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        for i in range(products):
+            await client.post("/api/v1/products", json={
+                "name": f"Product {i} 128GB Midnight", "sku": f"SKU-{i:06d}", "stock": i % 97
+            }, headers=headers)
+        response = await client.get(f"/api/v1/products?limit={products}", headers=headers)
+        assert response.status_code == 200, response.text
+        return response.content
+
+
+def measure(codec, level: int, body: bytes, repeats: int) -> tuple:
+    samples = []
+    for _ in range(repeats):
+        started = time.process_time()
+        stream = codec(level=level)
+        compressed = stream.compress(body) + stream.finish()
+        samples.append(time.process_time() - started)
+    return statistics.median(samples), len(compressed)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    from app.api.middleware.compression import CODECS
+
+    DB_FILE.unlink(missing_ok=True)
+    try:
+        body = asyncio.run(fetch_page(args.products))
+    finally:
+        DB_FILE.unlink(missing_ok=True)
+
+    print(f"GET /products?limit={args.products}: {len(body) / 1024:.1f} KiB uncompressed")
+    print(f"{'codec':<6} {'level':>5} {'size KiB':>9} {'saved':>7} {'CPU ms':>8} {'MiB/s':>8}")
+    for encoding in ("gzip", "br", "zstd"):
+        if encoding not in CODECS:
+            print(f"{encoding:<6} not installed")
+            continue
+        for level in LEVELS[encoding]:
+            seconds, size = measure(CODECS[encoding], level, body, args.repeats)
+            print(
+                f"{encoding:<6} {level:>5} {size / 1024:>9.1f} {1 - size / len(body):>7.1%} "
+                f"{seconds * 1000:>8.2f} {len(body) / seconds / 1048576 if seconds else float('inf'):>8.1f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
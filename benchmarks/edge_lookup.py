@@ -0,0 +1,80 @@
+"""Lookup latency and resident memory of the memory-mapped edge snapshot.
+
+Usage:
+    python -m benchmarks.edge_lookup [--skus 2000000] [--lookups 200000]
+
+Writes a synthetic ``--skus`` snapshot with ``app.edge.format.write_snapshot``
+(the same writer ``python -m app.edge.export snapshot`` uses), opens it with
+``StockSnapshot`` and times ``--lookups`` random hits and misses. Reports the
+file size, the time to open, the median and p99 lookup latency, and the
+private (non file-backed) RSS before opening, after opening and after the
+lookups. Mapped snapshot pages are shared page cache the kernel can drop, so
+private memory should stay flat however many SKUs the file holds.
+"""
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from array import array
+from pathlib import Path
+
+from app.edge.format import write_snapshot
+from app.edge.lookup import StockSnapshot
+
+
+def private_mib() -> float:
+    try:
+        with open("/proc/self/statm") as statm:
+            _, resident, shared = (int(field) for field in statm.read().split()[:3])
+    except OSError:
+        return float("nan")
+    return (resident - shared) * 4096 / 1048576
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skus", type=int, default=2_000_000)
+    parser.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args()
+
+    path = Path(tempfile.gettempdir()) / "edge_lookup_bench.snap"
+    rows = lambda: ((f"SKU-{i:08d}", i % 1000) for i in range(args.skus))
+    started = time.perf_counter()
+    write_snapshot(str(path), rows, generation=1)
+    written = time.perf_counter() - started
+    size = path.stat().st_size
+
+    rng = random.Random(0)
+    keys = [
+        f"SKU-{rng.randrange(args.skus):08d}" + ("" if i % 2 else "X")
+        for i in range(args.lookups)
+    ]
+    samples = array("q", bytes(8 * args.lookups))
+
+    try:
+        before = private_mib()
+        started = time.perf_counter()
+        snapshot = StockSnapshot(str(path))
+        opened = time.perf_counter() - started
+        after_open = private_mib()
+
+        for i, key in enumerate(keys):
+            started = time.perf_counter_ns()
+            snapshot.get(key)
+            samples[i] = time.perf_counter_ns() - started
+        after_lookups = private_mib()
+        snapshot.close()
+    finally:
+        path.unlink(missing_ok=True)
+
+    samples = sorted(samples)
+    print(f"{args.skus} SKUs, {size / 1048576:.1f} MiB file, written in {written:.1f}s, opened in {opened * 1e6:.0f} µs")
+    print(f"lookup median {statistics.median(samples) / 1000:.2f} µs, p99 {samples[int(len(samples) * 0.99)] / 1000:.2f} µs")
+    print(f"private RSS MiB: before open {before:.1f}, after open {after_open:.1f}, after {args.lookups} lookups {after_lookups:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Per-request dependency overhead profile for authenticated product reads.
+
+Usage:
+    python -m benchmarks.request_overhead [--requests 2000]
+
+Drives the ASGI app in-process (no network, no TestClient portal thread)
+against a throwaway SQLite database, warms the product and user caches, then
+issues ``GET /api/v1/products/{id}`` repeatedly. ``solve_dependencies`` and
+the threadpool helpers FastAPI uses for sync dependencies are wrapped to
+report, per request: time spent resolving dependencies, threadpool hops and
+sessions opened, alongside end-to-end latency.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+DB_FILE = Path(tempfile.gettempdir()) / "request_overhead.db"
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_FILE}"
+os.environ.setdefault("ADMISSION_ENABLED", "false")
+os.environ.setdefault("RATE_LIMIT_PER_SECOND", "0")
+
+
+class Probe:
+    def __init__(self):
+        self.resolve_seconds = 0.0
+        self.hops = 0
+        self.sessions = 0
+
+    def install(self):
+        import fastapi.dependencies.utils as dependency_utils
+        import fastapi.routing as routing
+        from sqlalchemy import event
+        from sqlalchemy.orm import Session
+
+        solve = routing.solve_dependencies
+
+        async def timed_solve(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await solve(*args, **kwargs)
+            finally:
+                self.resolve_seconds += time.perf_counter() - started
+
+        routing.solve_dependencies = timed_solve
+
+        for name in ("run_in_threadpool", "contextmanager_in_threadpool"):
+            original = getattr(dependency_utils, name)
+            setattr(dependency_utils, name, self._counting(original))
+
+        @event.listens_for(Session, "after_begin")
+        def count_session(session, transaction, connection):
+            self.sessions += 1
+
+    def _counting(self, fn):
+        def wrapper(*args, **kwargs):
+            self.hops += 1
+            return fn(*args, **kwargs)
+        return wrapper
+
+
+async def run(requests: int, probe: Probe) -> dict:
+    import httpx
+    from app.infrastructure.database import create_tables
+    from app.main import app
+
+    create_tables()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post("/api/v1/auth/register", json={
+            "username": "bench", "email": "bench@example.com", "password": "benchpass123"
+        })
+        token = (await client.post(
+            "/api/v1/auth/login", data={"username": "bench", "password": "benchpass123"}
+        )).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        product = (await client.post(
+            "/api/v1/products", json={"name": "Bench", "sku": "BENCH-1", "stock": 10}, headers=headers
+        )).json()
+        url = f"/api/v1/products/{product['id']}"
+        for _ in range(50):
+            await client.get(url, headers=headers)
+
+        probe.resolve_seconds, probe.hops, probe.sessions = 0.0, 0, 0
+        latencies = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = await client.get(url, headers=headers)
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.text
+
+    return {
+        "latency_us": statistics.median(latencies) * 1_000_000,
+        "resolve_us": probe.resolve_seconds / requests * 1_000_000,
+        "hops": probe.hops / requests,
+        "sessions": probe.sessions / requests,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    DB_FILE.unlink(missing_ok=True)
+    probe = Probe()
+    probe.install()
+    try:
+        report = asyncio.run(run(args.requests, probe))
+    finally:
+        DB_FILE.unlink(missing_ok=True)
+
+    print(f"GET /products/{{id}}, cache warm, {args.requests} requests")
+    print(f"  end-to-end latency (median): {report['latency_us']:8.1f} us")
+    print(f"  dependency resolution:       {report['resolve_us']:8.1f} us/request")
+    print(f"  threadpool hops:             {report['hops']:8.1f} /request")
+    print(f"  DB transactions begun:       {report['sessions']:8.1f} /request")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
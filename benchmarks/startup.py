@@ -0,0 +1,130 @@
+"""Cold-start benchmark: import time of app.main and time to first request.
+
+Usage:
+    python -m benchmarks.startup [--runs 5] [--update-budget]
+
+Import time is measured with ``python -X importtime``; time to first request
+spawns uvicorn and polls ``/health`` until it answers. Results are compared
+against ``benchmarks/startup_budget.json`` and the script exits non-zero when
+the median of either metric is over budget.
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+BUDGET_FILE = Path(__file__).resolve().parent / "startup_budget.json"
+EAGER_MODULES = ("jose", "passlib", "bcrypt", "cryptography", "psycopg2")
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", "postgresql://postgres:postgres@db:5432/storedb")
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return env
+
+
+def measure_import(top: int = 10) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=ROOT,
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        if not self_us.isdigit():
+            continue
+        rows.append((name, int(self_us), int(cumulative_us)))
+
+    total_us = next(c for name, _, c in rows if name == "app.main")
+    loaded = {name for name, _, _ in rows}
+    heaviest = sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+    return {
+        "import_ms": total_us / 1000,
+        "eager_heavy_modules": [m for m in EAGER_MODULES if m in loaded],
+        "heaviest_self_ms": [(name, self_us / 1000) for name, self_us, _ in heaviest],
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_first_request(timeout: float = 30.0) -> float:
+    port = _free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+        env=_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000
+            except OSError:
+                time.sleep(0.01)
+        raise TimeoutError("server did not answer /health in time")
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--update-budget", action="store_true", help="store the measured medians plus 25%% headroom")
+    args = parser.parse_args()
+
+    imports = [measure_import() for _ in range(args.runs)]
+    first_requests = [measure_first_request() for _ in range(args.runs)]
+    report = {
+        "import_app_main_ms": statistics.median(run["import_ms"] for run in imports),
+        "time_to_first_request_ms": statistics.median(first_requests),
+    }
+
+    print(f"import app.main (median of {args.runs}): {report['import_app_main_ms']:.1f} ms")
+    print(f"time to first /health (median of {args.runs}): {report['time_to_first_request_ms']:.1f} ms")
+    print("heaviest modules by self time:")
+    for name, self_ms in imports[-1]["heaviest_self_ms"]:
+        print(f"  {self_ms:8.1f} ms  {name}")
+
+    eager = imports[-1]["eager_heavy_modules"]
+    if eager:
+        print(f"modules that should load lazily were imported eagerly: {', '.join(eager)}")
+
+    if args.update_budget:
+        budget = {key: round(value * 1.25, 1) for key, value in report.items()}
+        BUDGET_FILE.write_text(json.dumps(budget, indent=2) + "\n")
+        print(f"budget written to {BUDGET_FILE}")
+        return 0
+
+    budget = json.loads(BUDGET_FILE.read_text())
+    over = [key for key, value in report.items() if value > budget[key]]
+    for key in over:
+        print(f"OVER BUDGET: {key} = {report[key]:.1f} ms (budget {budget[key]} ms)")
+    return 1 if over or eager else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""product change feed
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-01-27 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.infrastructure.migrations import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'products',
+        sa.Column('change_seq', sa.BigInteger(), server_default='0', nullable=False)
+    )
+    op.execute("UPDATE products SET change_seq = id")
+
+    op.create_table(
+        'product_tombstones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('sku', sa.String(), nullable=False),
+        sa.Column('change_seq', sa.BigInteger(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        op.f('ix_product_tombstones_change_seq'),
+        'product_tombstones',
+        ['change_seq'],
+        unique=False
+    )
+
+    op.create_table(
+        'change_counters',
+        sa.Column('name', sa.String(length=64), nullable=False),
+        sa.Column('value', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+    op.execute(
+        "INSERT INTO change_counters (name, value) "
+        "SELECT 'products', COALESCE(MAX(id), 0) FROM products"
+    )
+
+    create_index_concurrently(op, op.f('ix_products_change_seq'), 'products', ['change_seq'])
+
+
+def downgrade() -> None:
+    drop_index_concurrently(op, op.f('ix_products_change_seq'), 'products')
+    op.drop_table('change_counters')
+    op.drop_index(op.f('ix_product_tombstones_change_seq'), table_name='product_tombstones')
+    op.drop_table('product_tombstones')
+    with op.batch_alter_table('products') as batch_op:
+        batch_op.drop_column('change_seq')
@@ -0,0 +1,35 @@
+"""product locations
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-02-03 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'product_locations',
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('location', sa.String(length=64), nullable=False),
+        sa.Column('stock', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.CheckConstraint('stock >= 0', name='ck_product_locations_stock_non_negative'),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('product_id', 'location')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('product_locations')
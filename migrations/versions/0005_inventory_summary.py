@@ -0,0 +1,44 @@
+"""inventory summary
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-02-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LOW_STOCK_THRESHOLD = 10
+
+
+def upgrade() -> None:
+    op.create_table(
+        'inventory_summary',
+        sa.Column('shard', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('total_skus', sa.BigInteger(), nullable=False),
+        sa.Column('total_units', sa.BigInteger(), nullable=False),
+        sa.Column('out_of_stock', sa.BigInteger(), nullable=False),
+        sa.Column('low_stock', sa.BigInteger(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('shard')
+    )
+    op.execute(
+        "INSERT INTO inventory_summary (shard, total_skus, total_units, out_of_stock, low_stock) "
+        "SELECT 0, COUNT(*), COALESCE(SUM(stock), 0), "
+        "COALESCE(SUM(CASE WHEN stock <= 0 THEN 1 ELSE 0 END), 0), "
+        f"COALESCE(SUM(CASE WHEN stock > 0 AND stock < {LOW_STOCK_THRESHOLD} THEN 1 ELSE 0 END), 0) "
+        "FROM products"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('inventory_summary')
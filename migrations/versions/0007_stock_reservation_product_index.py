@@ -0,0 +1,32 @@
+"""stock reservation product index
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-03-03 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.infrastructure.migrations import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        op,
+        op.f('ix_stock_reservations_product_id'),
+        'stock_reservations',
+        ['product_id']
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently(op, op.f('ix_stock_reservations_product_id'), 'stock_reservations')
@@ -5,6 +5,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from app.main import app
 from app.infrastructure.database import Base, get_db
+from app.api.dependency_factories import product_cache, user_cache, user_rate_limiter
 
 
 SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///./test.db"
@@ -37,6 +38,9 @@ def client(test_db: Session) -> TestClient:
             pass
     
     app.dependency_overrides[get_db] = override_get_db
+    product_cache.clear()
+    user_cache.clear()
+    user_rate_limiter.clear()
     
     with TestClient(app) as test_client:
         yield test_client
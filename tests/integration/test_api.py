@@ -1,3 +1,4 @@
+import json
 import pytest
 from fastapi.testclient import TestClient
 
@@ -51,6 +52,16 @@ class TestAuthAPI:
         assert response.status_code == 200
         data = response.json()
         assert data["username"] == "testuser"
+    
+    def test_get_current_user_rate_limited(self, client: TestClient, auth_headers: dict, monkeypatch):
+        from app.api import dependency_factories
+        from app.api.middleware import TokenBucketLimiter
+        
+        monkeypatch.setattr(dependency_factories, "user_rate_limiter", TokenBucketLimiter(0.5, 1))
+        assert client.get("/api/v1/auth/me", headers=auth_headers).status_code == 200
+        response = client.get("/api/v1/auth/me", headers=auth_headers)
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
 
 
 class TestProductAPI:
@@ -122,6 +133,20 @@ class TestProductAPI:
         data = response.json()
         assert len(data) == 2
     
+    def test_get_all_products_after_cursor(self, client: TestClient, auth_headers: dict):
+        for i in range(5):
+            client.post(
+                "/api/v1/products",
+                json={"name": f"P{i}", "sku": f"P{i}", "stock": 10},
+                headers=auth_headers
+            )
+        first = client.get("/api/v1/products?limit=2", headers=auth_headers).json()
+        response = client.get(f"/api/v1/products?after={first[-1]['id']}&limit=2", headers=auth_headers)
+        assert response.status_code == 200
+        second = response.json()
+        assert [p["sku"] for p in first + second] == ["P0", "P1", "P2", "P3"]
+        assert client.get("/api/v1/products?after=-1", headers=auth_headers).status_code == 422
+    
     def test_get_product_by_id_success(self, client: TestClient, auth_headers: dict):
         create_response = client.post(
             "/api/v1/products",
@@ -157,6 +182,52 @@ class TestProductAPI:
         assert data["stock"] == 15
         assert data["sku"] == "ORIG-001"
     
+    def test_product_version_is_exposed_as_etag(self, client: TestClient, auth_headers: dict):
+        product_id = client.post(
+            "/api/v1/products",
+            json={"name": "Versioned", "sku": "VER-001", "stock": 10},
+            headers=auth_headers
+        ).json()["id"]
+        
+        response = client.get(f"/api/v1/products/{product_id}", headers=auth_headers)
+        assert response.json()["version"] == 1
+        assert response.headers["ETag"] == '"1"'
+        
+        response = client.post(f"/api/v1/products/{product_id}/increment", headers=auth_headers)
+        assert response.json()["version"] == 2
+        assert response.headers["ETag"] == '"2"'
+    
+    def test_update_product_with_if_match(self, client: TestClient, auth_headers: dict):
+        product_id = client.post(
+            "/api/v1/products",
+            json={"name": "Guarded", "sku": "IFM-001", "stock": 10},
+            headers=auth_headers
+        ).json()["id"]
+        etag = client.get(f"/api/v1/products/{product_id}", headers=auth_headers).headers["ETag"]
+        
+        response = client.put(
+            f"/api/v1/products/{product_id}",
+            json={"stock": 12},
+            headers={**auth_headers, "If-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.json()["version"] == 2
+        
+        response = client.put(
+            f"/api/v1/products/{product_id}",
+            json={"stock": 20},
+            headers={**auth_headers, "If-Match": etag}
+        )
+        assert response.status_code == 412
+        assert client.get(f"/api/v1/products/{product_id}", headers=auth_headers).json()["stock"] == 12
+        
+        response = client.put(
+            f"/api/v1/products/{product_id}",
+            json={"stock": 20},
+            headers={**auth_headers, "If-Match": 'W/"2"'}
+        )
+        assert response.status_code == 412
+    
     def test_update_product_not_found(self, client: TestClient, auth_headers: dict):
         response = client.put(
             "/api/v1/products/99999",
@@ -289,3 +360,529 @@ class TestProductAPI:
         assert response.status_code == 200
         data = response.json()
         assert data["stock"] == 0
+    
+    def test_lookup_products_by_ids_and_skus(self, client: TestClient, auth_headers: dict):
+        ids = [
+            client.post("/api/v1/products", json={"name": f"L{i}", "sku": f"LOOK-{i}", "stock": i}, headers=auth_headers).json()["id"]
+            for i in range(3)
+        ]
+        response = client.post(
+            "/api/v1/products/lookup",
+            json={"ids": [ids[2], 99999, ids[0]], "skus": ["look-1", "NOPE"]},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [p["sku"] for p in data["products"]] == ["LOOK-2", "LOOK-0", "LOOK-1"]
+        assert data["missing_ids"] == [99999]
+        assert data["missing_skus"] == ["NOPE"]
+    
+    def test_lookup_returns_a_product_once_when_matched_by_id_and_sku(self, client: TestClient, auth_headers: dict):
+        product_id = client.post(
+            "/api/v1/products",
+            json={"name": "Twice", "sku": "LOOK-DUP", "stock": 4},
+            headers=auth_headers
+        ).json()["id"]
+        response = client.post(
+            "/api/v1/products/lookup",
+            json={"ids": [product_id, product_id], "skus": ["LOOK-DUP", "look-dup"]},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert [p["id"] for p in response.json()["products"]] == [product_id]
+    
+    def test_lookup_rejects_empty_and_oversized_requests(self, client: TestClient, auth_headers: dict):
+        assert client.post("/api/v1/products/lookup", json={}, headers=auth_headers).status_code == 422
+        response = client.post("/api/v1/products/lookup", json={"ids": list(range(501))}, headers=auth_headers)
+        assert response.status_code == 422
+    
+    
+    def test_export_streams_every_product_as_ndjson(self, client: TestClient, auth_headers: dict, monkeypatch):
+        from app.core.config import settings
+        
+        monkeypatch.setattr(settings, "PRODUCT_EXPORT_BATCH_SIZE", 2)
+        for i in range(5):
+            client.post(
+                "/api/v1/products",
+                json={"name": f"Export {i}", "sku": f"EXP-{i}", "stock": i},
+                headers=auth_headers
+            )
+        
+        response = client.get("/api/v1/products/export", headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["sku"] for row in rows] == [f"EXP-{i}" for i in range(5)]
+    
+    def test_large_product_lists_are_compressed(self, client: TestClient, auth_headers: dict):
+        for i in range(20):
+            client.post(
+                "/api/v1/products",
+                json={"name": f"Compressed {i}", "sku": f"GZ-{i}", "stock": i},
+                headers=auth_headers
+            )
+        
+        response = client.get("/api/v1/products?limit=100", headers={**auth_headers, "Accept-Encoding": "gzip"})
+        
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()) == 20
+
+
+class TestReservationAPI:
+    def _create_product(self, client: TestClient, auth_headers: dict, stock: int = 10) -> int:
+        response = client.post(
+            "/api/v1/products",
+            json={"name": "Reserved", "sku": "RES-001", "stock": stock},
+            headers=auth_headers
+        )
+        return response.json()["id"]
+    
+    def test_reservation_reduces_available_not_on_hand(self, client: TestClient, auth_headers: dict):
+        product_id = self._create_product(client, auth_headers)
+        response = client.post(
+            f"/api/v1/products/{product_id}/reservations",
+            json={"quantity": 4},
+            headers=auth_headers
+        )
+        assert response.status_code == 201
+        assert response.json()["status"] == "active"
+        availability = client.get(f"/api/v1/products/{product_id}/availability", headers=auth_headers)
+        assert availability.json()["available"] == 6
+        product = client.get(f"/api/v1/products/{product_id}", headers=auth_headers)
+        assert product.json()["stock"] == 10
+    
+    def test_reservation_exceeding_available_stock(self, client: TestClient, auth_headers: dict):
+        product_id = self._create_product(client, auth_headers, stock=5)
+        client.post(f"/api/v1/products/{product_id}/reservations", json={"quantity": 3}, headers=auth_headers)
+        response = client.post(
+            f"/api/v1/products/{product_id}/reservations",
+            json={"quantity": 3},
+            headers=auth_headers
+        )
+        assert response.status_code == 400
+        assert "Insufficient stock" in response.json()["detail"]
+    
+    def test_commit_reservation_decrements_stock(self, client: TestClient, auth_headers: dict):
+        product_id = self._create_product(client, auth_headers)
+        reservation_id = client.post(
+            f"/api/v1/products/{product_id}/reservations",
+            json={"quantity": 4},
+            headers=auth_headers
+        ).json()["id"]
+        response = client.post(
+            f"/api/v1/products/{product_id}/reservations/{reservation_id}/commit",
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["status"] == "committed"
+        product = client.get(f"/api/v1/products/{product_id}", headers=auth_headers)
+        assert product.json()["stock"] == 6
+        availability = client.get(f"/api/v1/products/{product_id}/availability", headers=auth_headers)
+        assert availability.json()["available"] == 6
+    
+    def test_stock_writes_cannot_consume_held_units(self, client: TestClient, auth_headers: dict):
+        product_id = self._create_product(client, auth_headers, stock=5)
+        reservation_id = client.post(
+            f"/api/v1/products/{product_id}/reservations",
+            json={"quantity": 5},
+            headers=auth_headers
+        ).json()["id"]
+        decrement = client.post(
+            f"/api/v1/products/{product_id}/decrement",
+            json={"quantity": 5},
+            headers=auth_headers
+        )
+        assert decrement.status_code == 400
+        assert "Insufficient stock" in decrement.json()["detail"]
+        update = client.put(f"/api/v1/products/{product_id}", json={"stock": 2}, headers=auth_headers)
+        assert update.status_code == 400
+        assert "Insufficient stock" in update.json()["detail"]
+        response = client.post(
+            f"/api/v1/products/{product_id}/reservations/{reservation_id}/commit",
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        availability = client.get(f"/api/v1/products/{product_id}/availability", headers=auth_headers)
+        assert availability.json()["available"] == 0
+    
+    def test_release_reservation_restores_available(self, client: TestClient, auth_headers: dict):
+        product_id = self._create_product(client, auth_headers)
+        reservation_id = client.post(
+            f"/api/v1/products/{product_id}/reservations",
+            json={"quantity": 4},
+            headers=auth_headers
+        ).json()["id"]
+        response = client.post(
+            f"/api/v1/products/{product_id}/reservations/{reservation_id}/release",
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["status"] == "released"
+        availability = client.get(f"/api/v1/products/{product_id}/availability", headers=auth_headers)
+        assert availability.json()["available"] == 10
+        again = client.post(
+            f"/api/v1/products/{product_id}/reservations/{reservation_id}/commit",
+            headers=auth_headers
+        )
+        assert again.status_code == 409
+    
+    def test_reservation_not_found(self, client: TestClient, auth_headers: dict):
+        product_id = self._create_product(client, auth_headers)
+        response = client.post(
+            f"/api/v1/products/{product_id}/reservations/99999/commit",
+            headers=auth_headers
+        )
+        assert response.status_code == 404
+    
+    def test_sweeper_expires_holds_in_bulk(self, client: TestClient, auth_headers: dict, test_db):
+        from datetime import datetime, timedelta
+        from sqlalchemy.orm import Session
+        from app.infrastructure.reservation_sweeper import ReservationSweeper
+        
+        product_id = self._create_product(client, auth_headers)
+        reservation_ids = [
+            client.post(
+                f"/api/v1/products/{product_id}/reservations",
+                json={"quantity": 1, "ttl_seconds": 60},
+                headers=auth_headers
+            ).json()["id"]
+            for _ in range(5)
+        ]
+        sweeper = ReservationSweeper(lambda: Session(bind=test_db.get_bind()), batch_size=2)
+        released = sweeper.sweep_once(now=datetime.utcnow() + timedelta(seconds=120))
+        assert released == 5
+        response = client.post(
+            f"/api/v1/products/{product_id}/reservations/{reservation_ids[0]}/commit",
+            headers=auth_headers
+        )
+        assert response.status_code == 409
+        assert "expired" in response.json()["detail"]
+
+
+class TestChangeFeedAPI:
+    def test_changes_follow_commit_order(self, client: TestClient, auth_headers: dict):
+        first = client.post("/api/v1/products", json={"name": "A", "sku": "FEED-A", "stock": 1}, headers=auth_headers).json()
+        second = client.post("/api/v1/products", json={"name": "B", "sku": "FEED-B", "stock": 2}, headers=auth_headers).json()
+        client.post(f"/api/v1/products/{first['id']}/increment", json={"amount": 4}, headers=auth_headers)
+        
+        response = client.get("/api/v1/products/changes", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert [c["product_id"] for c in data["changes"]] == [second["id"], first["id"]]
+        assert data["changes"][1]["product"]["stock"] == 5
+        assert data["cursor"] == data["changes"][-1]["seq"]
+        assert data["has_more"] is False
+        
+        follow_up = client.get(f"/api/v1/products/changes?since={data['cursor']}", headers=auth_headers)
+        assert follow_up.json() == {"changes": [], "cursor": data["cursor"], "has_more": False}
+    
+    def test_location_adjustments_appear_in_the_feed(self, client: TestClient, auth_headers: dict):
+        product = client.post("/api/v1/products", json={"name": "Stores", "sku": "FEED-LOC", "stock": 5}, headers=auth_headers).json()
+        client.get(f"/api/v1/products/{product['id']}", headers=auth_headers)
+        cursor = client.get("/api/v1/products/changes", headers=auth_headers).json()["cursor"]
+        client.post(f"/api/v1/products/{product['id']}/locations/STORE1/increment", json={"amount": 10}, headers=auth_headers)
+        
+        changes = client.get(f"/api/v1/products/changes?since={cursor}", headers=auth_headers).json()["changes"]
+        assert [(c["product_id"], c["product"]["stock"]) for c in changes] == [(product["id"], 15)]
+        assert client.get(f"/api/v1/products/{product['id']}", headers=auth_headers).json()["stock"] == 15
+    
+    def test_deletes_appear_as_tombstones(self, client: TestClient, auth_headers: dict):
+        product = client.post("/api/v1/products", json={"name": "Gone", "sku": "FEED-DEL", "stock": 1}, headers=auth_headers).json()
+        cursor = client.get("/api/v1/products/changes", headers=auth_headers).json()["cursor"]
+        client.delete(f"/api/v1/products/{product['id']}", headers=auth_headers)
+        
+        changes = client.get(f"/api/v1/products/changes?since={cursor}", headers=auth_headers).json()["changes"]
+        assert len(changes) == 1
+        assert changes[0]["op"] == "delete"
+        assert changes[0]["sku"] == "FEED-DEL"
+        assert changes[0]["product"] is None
+    
+    def test_limit_pages_through_changes(self, client: TestClient, auth_headers: dict):
+        for i in range(3):
+            client.post("/api/v1/products", json={"name": f"P{i}", "sku": f"FEED-{i}", "stock": i}, headers=auth_headers)
+        
+        page = client.get("/api/v1/products/changes?limit=2", headers=auth_headers).json()
+        assert len(page["changes"]) == 2
+        assert page["has_more"] is True
+        rest = client.get(f"/api/v1/products/changes?since={page['cursor']}&limit=2", headers=auth_headers).json()
+        assert [c["sku"] for c in rest["changes"]] == ["FEED-2"]
+    
+    def test_wait_returns_empty_after_timeout(self, client: TestClient, auth_headers: dict):
+        response = client.get("/api/v1/products/changes?since=0&wait=0.2", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["changes"] == []
+    
+    def test_negative_cursor_rejected(self, client: TestClient, auth_headers: dict):
+        response = client.get("/api/v1/products/changes?since=-1", headers=auth_headers)
+        assert response.status_code == 400
+
+
+class TestStockSubscriptionAPI:
+    def test_websocket_receives_snapshot_and_deltas(self, client: TestClient, auth_headers: dict):
+        product = client.post("/api/v1/products", json={"name": "Live", "sku": "LIVE-1", "stock": 10}, headers=auth_headers).json()
+        token = auth_headers["Authorization"].split()[1]
+        
+        with client.websocket_connect(
+            f"/api/v1/subscriptions/stock/ws?token={token}&sku=live-1&product_id=99999"
+        ) as websocket:
+            snapshot = websocket.receive_json()
+            assert snapshot["type"] == "subscribed"
+            assert snapshot["products"][0]["stock"] == 10
+            assert snapshot["missing"] == ["99999"]
+            
+            client.post(f"/api/v1/products/{product['id']}/decrement", json={"amount": 3}, headers=auth_headers)
+            event = websocket.receive_json()
+            assert event["type"] == "stock"
+            assert event["stock"] == 7
+            assert event["delta"] == -3
+    
+    def test_websocket_rejects_invalid_token(self, client: TestClient):
+        from starlette.websockets import WebSocketDisconnect
+        
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with client.websocket_connect("/api/v1/subscriptions/stock/ws?token=bad&product_id=1"):
+                pass
+        assert exc_info.value.code == 1008
+    
+    def test_sse_requires_products(self, client: TestClient, auth_headers: dict):
+        response = client.get("/api/v1/subscriptions/stock", headers=auth_headers)
+        assert response.status_code == 400
+
+
+class TestReadRouting:
+    def test_reads_go_to_replica_unless_pinned(self, client: TestClient, auth_headers: dict, test_db, tmp_path, monkeypatch):
+        from sqlalchemy import create_engine
+        from app.infrastructure import database
+        from app.infrastructure.replicas import ReplicaRouter
+        
+        replica_url = f"sqlite:///{tmp_path}/replica.db"
+        database.Base.metadata.create_all(bind=create_engine(replica_url))
+        monkeypatch.setattr(database, "replica_router", ReplicaRouter([replica_url]))
+        product = client.post("/api/v1/products", json={"name": "Fresh", "sku": "RYW-1", "stock": 1}, headers=auth_headers).json()
+        
+        pinned = client.get(
+            f"/api/v1/products/{product['id']}",
+            headers={**auth_headers, "X-Read-Consistency": "primary"}
+        )
+        assert pinned.status_code == 200
+        
+        lagging = client.get(f"/api/v1/products/{product['id']}", headers=auth_headers)
+        assert lagging.status_code == 404
+        database.replica_router.dispose()
+
+
+class TestLocationStockAPI:
+    def _create_product(self, client: TestClient, auth_headers: dict, stock: int = 5) -> int:
+        response = client.post(
+            "/api/v1/products",
+            json={"name": "Multi", "sku": "LOC-001", "stock": stock},
+            headers=auth_headers
+        )
+        return response.json()["id"]
+    
+    def test_location_changes_roll_up_to_product_total(self, client: TestClient, auth_headers: dict):
+        product_id = self._create_product(client, auth_headers)
+        response = client.post(
+            f"/api/v1/products/{product_id}/locations/store-01/increment",
+            json={"amount": 10},
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json() == {"product_id": product_id, "location": "STORE-01", "stock": 10, "total_stock": 15}
+        client.post(f"/api/v1/products/{product_id}/locations/STORE-02/increment", json={"amount": 4}, headers=auth_headers)
+        client.post(f"/api/v1/products/{product_id}/locations/STORE-01/decrement", json={"amount": 3}, headers=auth_headers)
+        
+        breakdown = client.get(f"/api/v1/products/{product_id}/locations", headers=auth_headers).json()
+        assert breakdown["total_stock"] == 16
+        assert breakdown["unassigned_stock"] == 5
+        assert [(l["location"], l["stock"]) for l in breakdown["locations"]] == [("STORE-01", 7), ("STORE-02", 4)]
+        assert client.get(f"/api/v1/products/{product_id}", headers=auth_headers).json()["stock"] == 16
+    
+    def test_location_decrement_cannot_go_negative(self, client: TestClient, auth_headers: dict):
+        product_id = self._create_product(client, auth_headers, stock=50)
+        client.post(f"/api/v1/products/{product_id}/locations/STORE-01/increment", json={"amount": 2}, headers=auth_headers)
+        response = client.post(
+            f"/api/v1/products/{product_id}/locations/STORE-01/decrement",
+            json={"amount": 3},
+            headers=auth_headers
+        )
+        assert response.status_code == 400
+        assert "Insufficient stock" in response.json()["detail"]
+        unknown = client.post(
+            f"/api/v1/products/{product_id}/locations/NOWHERE/decrement",
+            json={"amount": 1},
+            headers=auth_headers
+        )
+        assert unknown.status_code == 400
+        assert client.get(f"/api/v1/products/{product_id}", headers=auth_headers).json()["stock"] == 52
+    
+    def test_product_level_decrement_only_uses_unassigned_stock(self, client: TestClient, auth_headers: dict):
+        product_id = self._create_product(client, auth_headers, stock=2)
+        client.post(f"/api/v1/products/{product_id}/locations/STORE-01/increment", json={"amount": 5}, headers=auth_headers)
+        response = client.post(f"/api/v1/products/{product_id}/decrement", json={"amount": 3}, headers=auth_headers)
+        assert response.status_code == 400
+        below_located = client.put(f"/api/v1/products/{product_id}", json={"stock": 4}, headers=auth_headers)
+        assert below_located.status_code == 400
+        availability = client.get(f"/api/v1/products/{product_id}/availability", headers=auth_headers)
+        assert availability.json()["available"] == 2
+    
+    def test_locations_for_missing_product(self, client: TestClient, auth_headers: dict):
+        response = client.post("/api/v1/products/99999/locations/STORE-01/increment", headers=auth_headers)
+        assert response.status_code == 404
+
+
+class TestAllocationAPI:
+    def create(self, client: TestClient, auth_headers: dict, sku: str, stock: int) -> int:
+        return client.post(
+            "/api/v1/products",
+            json={"name": sku, "sku": sku, "stock": stock},
+            headers=auth_headers
+        ).json()["id"]
+    
+    def test_allocate_several_products(self, client: TestClient, auth_headers: dict):
+        a = self.create(client, auth_headers, "ALLOC-A", 10)
+        b = self.create(client, auth_headers, "ALLOC-B", 4)
+        
+        response = client.post(
+            "/api/v1/allocations",
+            json={"lines": [{"product_id": a, "quantity": 3}, {"product_id": b, "quantity": 4}]},
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 200
+        lines = response.json()["lines"]
+        assert [(l["sku"], l["quantity"], l["stock"]) for l in lines] == [("ALLOC-A", 3, 7), ("ALLOC-B", 4, 0)]
+        assert client.get(f"/api/v1/products/{b}", headers=auth_headers).json()["stock"] == 0
+    
+    def test_shortfall_allocates_nothing(self, client: TestClient, auth_headers: dict):
+        a = self.create(client, auth_headers, "ALLOC-C", 10)
+        b = self.create(client, auth_headers, "ALLOC-D", 1)
+        
+        response = client.post(
+            "/api/v1/allocations",
+            json={"lines": [{"product_id": a, "quantity": 3}, {"product_id": b, "quantity": 2}]},
+            headers=auth_headers
+        )
+        
+        assert response.status_code == 409
+        assert response.json()["shortfalls"] == [{"product_id": b, "requested": 2, "available": 1}]
+        assert client.get(f"/api/v1/products/{a}", headers=auth_headers).json()["stock"] == 10
+    
+    def test_allocation_validation(self, client: TestClient, auth_headers: dict):
+        response = client.post("/api/v1/allocations", json={"lines": []}, headers=auth_headers)
+        assert response.status_code == 422
+        
+        response = client.post(
+            "/api/v1/allocations",
+            json={"lines": [{"product_id": 99999, "quantity": 1}]},
+            headers=auth_headers
+        )
+        assert response.status_code == 404
+
+
+class TestInventorySummaryAPI:
+    def test_summary_follows_stock_changes(self, client: TestClient, auth_headers: dict):
+        empty = client.get("/api/v1/inventory/summary", headers=auth_headers)
+        assert empty.status_code == 200
+        assert empty.json()["total_skus"] == 0
+        
+        first = client.post("/api/v1/products", json={"name": "A", "sku": "SUM-A", "stock": 2}, headers=auth_headers).json()
+        client.post("/api/v1/products", json={"name": "B", "sku": "SUM-B", "stock": 30}, headers=auth_headers)
+        client.post(f"/api/v1/products/{first['id']}/decrement", json={"amount": 2}, headers=auth_headers)
+        
+        summary = client.get("/api/v1/inventory/summary", headers=auth_headers).json()
+        assert summary == {
+            "total_skus": 2,
+            "total_units": 30,
+            "out_of_stock": 1,
+            "low_stock": 0,
+            "low_stock_threshold": 10
+        }
+
+
+
+class TestJobsAPI:
+    def run_jobs(self, client: TestClient, handlers) -> None:
+        from sqlalchemy.orm import Session
+        from app.api.dependency_factories import get_db
+        from app.infrastructure.job_runner import JobRunner
+        
+        db = next(client.app.dependency_overrides[get_db]())
+        runner = JobRunner(lambda: Session(bind=db.get_bind()), handlers, chunk_size=2)
+        while runner.run_once() is not None:
+            pass
+    
+    def test_import_is_accepted_then_completes(self, client: TestClient, auth_headers: dict):
+        from app.infrastructure.job_handlers import ProductImportHandler
+        
+        response = client.post(
+            "/api/v1/jobs/product-imports",
+            json={"products": [
+                {"name": "A", "sku": "job-a", "stock": 1},
+                {"name": "B", "sku": "JOB-B", "stock": 2},
+                {"name": "A again", "sku": "JOB-A", "stock": 9}
+            ]},
+            headers=auth_headers
+        )
+        assert response.status_code == 202
+        job = response.json()
+        assert job["status"] == "queued"
+        assert response.headers["location"] == f"/api/v1/jobs/{job['id']}"
+        assert client.get(f"/api/v1/jobs/{job['id']}/result", headers=auth_headers).status_code == 409
+        
+        self.run_jobs(client, [ProductImportHandler()])
+        
+        status = client.get(f"/api/v1/jobs/{job['id']}", headers=auth_headers).json()
+        assert (status["status"], status["progress_done"], status["progress_total"]) == ("succeeded", 3, 3)
+        result = client.get(f"/api/v1/jobs/{job['id']}/result", headers=auth_headers)
+        assert result.json() == {"created": 2, "skipped": 1}
+        skus = sorted(p["sku"] for p in client.get("/api/v1/products", headers=auth_headers).json())
+        assert skus == ["JOB-A", "JOB-B"]
+    
+    def test_export_result_is_the_file(self, client: TestClient, auth_headers: dict, tmp_path, monkeypatch):
+        from app.core.config import settings
+        from app.api.schemas import ProductResponse
+        from app.infrastructure.job_handlers import ProductExportHandler
+        
+        monkeypatch.setattr(settings, "JOB_EXPORT_DIR", str(tmp_path))
+        for i in range(3):
+            client.post("/api/v1/products", json={"name": f"E{i}", "sku": f"EXP-{i}", "stock": i}, headers=auth_headers)
+        job = client.post("/api/v1/jobs/product-exports", headers=auth_headers).json()
+        
+        self.run_jobs(client, [ProductExportHandler(
+            str(tmp_path),
+            lambda product: ProductResponse.model_validate(product).model_dump_json()
+        )])
+        
+        response = client.get(f"/api/v1/jobs/{job['id']}/result", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line)["sku"] for line in response.text.splitlines()] == ["EXP-0", "EXP-1", "EXP-2"]
+    
+    def test_unknown_job(self, client: TestClient, auth_headers: dict):
+        assert client.get("/api/v1/jobs/999", headers=auth_headers).status_code == 404
+        assert client.get("/api/v1/jobs/999/result", headers=auth_headers).status_code == 404
+
+class TestAccessLog:
+    def test_errors_are_logged_with_timing_breakdown(self, client: TestClient, auth_headers: dict):
+        import logging
+        
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger = logging.getLogger("app.access")
+        logger.addHandler(handler)
+        try:
+            response = client.get("/api/v1/products/99999", headers=auth_headers)
+        finally:
+            logger.removeHandler(handler)
+        
+        assert response.status_code == 404
+        fields = records[-1].fields
+        assert fields["route"] == "/api/v1/products/{product_id}"
+        assert fields["status"] == 404
+        assert fields["user"] == "testuser"
+        assert fields["db_queries"] >= 1
+        assert fields["auth_ms"] > 0
+        assert fields["sampled"] is False
@@ -0,0 +1,40 @@
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine
+from app.infrastructure.database import Base
+from app.infrastructure.migrations import SCHEMA_REVISION, check_schema_revision
+
+
+@pytest.fixture
+def migrated_engine(tmp_path):
+    url = f"sqlite:///{tmp_path / 'migrations.db'}"
+    config = Config("alembic.ini")
+    config.set_main_option("sqlalchemy.url", url)
+    command.upgrade(config, "head")
+    engine = create_engine(url)
+    yield engine
+    engine.dispose()
+
+
+class TestMigrations:
+    def test_schema_revision_matches_migration_head(self):
+        script = ScriptDirectory.from_config(Config("alembic.ini"))
+        assert script.get_current_head() == SCHEMA_REVISION
+    
+    def test_migrations_match_models(self, migrated_engine):
+        with migrated_engine.connect() as connection:
+            context = MigrationContext.configure(connection)
+            assert compare_metadata(context, Base.metadata) == []
+    
+    def test_startup_check_accepts_migrated_database(self, migrated_engine):
+        assert check_schema_revision(migrated_engine, strict=True) is True
+    
+    def test_startup_check_rejects_unmigrated_database(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+        assert check_schema_revision(engine) is False
+        with pytest.raises(RuntimeError):
+            check_schema_revision(engine, strict=True)
@@ -0,0 +1,80 @@
+import io
+import json
+import logging
+import time
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from app.api.middleware import AccessLogMiddleware
+from app.core.request_timing import current_timings, record_user, timed_auth
+from app.infrastructure.access_log import AccessLogWriter, JSONFormatter, instrument_query_timing
+def build_app(records, **options):
+    app = FastAPI()
+    engine = create_engine("sqlite://")
+    instrument_query_timing()
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        with timed_auth():
+            record_user("alice")
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        if item_id == 404:
+            raise HTTPException(status_code=404)
+        if item_id == 1000:
+            time.sleep(0.02)
+        return {"id": item_id}
+    app.add_middleware(AccessLogMiddleware, writer=records.append, **options)
+    return app
+class TestAccessLogMiddleware:
+    def test_successes_are_sampled(self):
+        records = []
+        with TestClient(build_app(records, sample_rate=0.0)) as client:
+            client.get("/items/1")
+        assert records == []
+        with TestClient(build_app(records, sample_rate=1.0)) as client:
+            client.get("/items/1")
+        assert records[0]["sampled"] is True
+        assert records[0]["status"] == 200
+    def test_errors_and_slow_requests_are_always_logged(self):
+        records = []
+        with TestClient(build_app(records, sample_rate=0.0, slow_threshold_ms=10)) as client:
+            client.get("/items/404")
+            client.get("/items/1000")
+            client.get("/items/1")
+        assert [record["status"] for record in records] == [404, 200]
+        assert records[1]["slow"] is True
+    def test_timing_breakdown(self):
+        records = []
+        with TestClient(build_app(records, sample_rate=1.0)) as client:
+            client.get("/items/7")
+        record = records[0]
+        assert record["route"] == "/items/{item_id}"
+        assert record["user"] == "alice"
+        assert record["db_queries"] == 1
+        assert 0 <= record["db_ms"] <= record["duration_ms"]
+        assert record["auth_ms"] >= 0
+    def test_timing_helpers_are_noops_outside_requests(self):
+        assert current_timings() is None
+        with timed_auth():
+            record_user("nobody")
+class TestAccessLogWriter:
+    def test_writes_json_lines_from_background_thread(self):
+        stream = io.StringIO()
+        writer = AccessLogWriter("test.access", queue_size=10)
+        writer.start(stream)
+        writer.write({"route": "/items/{item_id}", "status": 200})
+        writer.stop()
+        line = json.loads(stream.getvalue().splitlines()[0])
+        assert line["route"] == "/items/{item_id}"
+        assert line["status"] == 200
+        assert line["logger"] == "test.access"
+    def test_full_queue_drops_instead_of_blocking(self):
+        writer = AccessLogWriter("test.access.full", queue_size=1)
+        writer.logger.addHandler(writer._handler)
+        writer.write({"n": 1})
+        writer.write({"n": 2})
+        writer.logger.removeHandler(writer._handler)
+        assert writer._queue.qsize() == 1
+    def test_formatter_falls_back_to_message(self):
+        record = logging.makeLogRecord({"msg": "hello %s", "args": ("world",), "name": "x"})
+        assert json.loads(JSONFormatter().format(record))["message"] == "hello world"
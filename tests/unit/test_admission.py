@@ -0,0 +1,74 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.api.middleware import AdmissionControlMiddleware, AdmissionController, TokenBucketLimiter
+from app.infrastructure.pool import PoolWaitTracker
+class TestTokenBucketLimiter:
+    def test_burst_then_limited_per_key(self):
+        limiter = TokenBucketLimiter(rate_per_second=1, burst=2)
+        assert limiter.acquire("alice") == 0
+        assert limiter.acquire("alice") == 0
+        assert 0 < limiter.acquire("alice") <= 1
+        assert limiter.acquire("bob") == 0
+    def test_disabled_with_zero_rate(self):
+        limiter = TokenBucketLimiter(rate_per_second=0, burst=0)
+        assert limiter.acquire("alice") == 0
+class TestAdmissionController:
+    def test_reserved_share_survives_general_saturation(self):
+        controller = AdmissionController(3, reserved={"health": 1})
+        assert controller.try_acquire("default") == "general"
+        assert controller.try_acquire("default") == "general"
+        assert controller.try_acquire("default") is None
+        assert controller.try_acquire("health") == "health"
+        assert controller.try_acquire("health") is None
+    def test_queued_request_times_out_or_gets_released_slot(self):
+        async def scenario():
+            controller = AdmissionController(1, reserved={}, queue_timeout_seconds=0.05)
+            slot = controller.try_acquire("default")
+            assert await controller.acquire("default") is None
+            waiter = asyncio.ensure_future(controller.acquire("default"))
+            await asyncio.sleep(0)
+            controller.release(slot)
+            return await waiter
+        assert asyncio.run(scenario()) == "general"
+    def test_full_queue_rejects_immediately(self):
+        async def scenario():
+            controller = AdmissionController(1, reserved={}, max_queue=0)
+            controller.try_acquire("default")
+            return await controller.acquire("default")
+        assert asyncio.run(scenario()) is None
+class TestAdmissionControlMiddleware:
+    @pytest.fixture
+    def app(self):
+        app = FastAPI()
+        @app.get("/health")
+        def health():
+            return {"status": "healthy"}
+        @app.get("/work")
+        def work():
+            return {"ok": True}
+        return app
+    def test_pool_saturation_sheds_general_traffic_only(self, app):
+        tracker = PoolWaitTracker(alpha=1.0)
+        tracker.observe(2.0)
+        app.add_middleware(
+            AdmissionControlMiddleware,
+            controller=AdmissionController(4, reserved={"health": 1}),
+            lanes={"health": ("/health",)},
+            pool_wait=lambda: tracker.recent_wait(60),
+            pool_wait_threshold_seconds=0.5,
+            retry_after_seconds=3
+        )
+        client = TestClient(app)
+        shed = client.get("/work")
+        assert shed.status_code == 503
+        assert shed.headers["Retry-After"] == "3"
+        assert client.get("/health").status_code == 200
+        tracker.reset()
+        assert client.get("/work").status_code == 200
+    def test_pool_wait_signal_expires(self):
+        tracker = PoolWaitTracker(alpha=1.0)
+        tracker.observe(2.0)
+        assert tracker.recent_wait(60) == 2.0
+        assert tracker.recent_wait(-1) == 0.0
@@ -0,0 +1,152 @@
+import random
+import threading
+from datetime import datetime, timedelta
+import pytest
+from unittest.mock import Mock
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+from app.domain.allocation_models import AllocationLine
+from app.domain.allocation_service import AllocationService
+from app.domain.interfaces import IAllocationRepository
+from app.domain.models import Product
+from app.domain.reservation_models import Reservation
+from app.infrastructure.allocation_repository import SQLAlchemyAllocationRepository
+from app.infrastructure.database import Base
+from app.infrastructure.db_models import ProductModel
+from app.infrastructure.location_repository import SQLAlchemyLocationRepository
+from app.infrastructure.repositories import SQLAlchemyProductRepository, held_stock
+from app.infrastructure.reservation_repository import SQLAlchemyReservationRepository
+from app.infrastructure.sqlite import install_pragma_hook, profile_pragmas
+from app.core.exceptions import AllocationShortfallError, InsufficientStockError, InvalidAmountError, ProductNotFoundError
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'allocations.db'}", connect_args={"timeout": 30})
+    install_pragma_hook(engine, profile_pragmas(busy_timeout_ms=30000), begin="IMMEDIATE")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+def seed(engine, stocks):
+    with Session(bind=engine) as db:
+        repository = SQLAlchemyProductRepository(db)
+        return [repository.create(Product(id=None, name=f"P{i}", sku=f"P-{i}", stock=stock)).id for i, stock in enumerate(stocks)]
+def stocks(engine):
+    with Session(bind=engine) as db:
+        return dict(db.execute(select(ProductModel.id, ProductModel.stock)).all())
+def held(engine):
+    with Session(bind=engine) as db:
+        return dict(db.execute(select(ProductModel.id, held_stock(ProductModel.id))).all())
+def hold(db, product_id, quantity):
+    return SQLAlchemyReservationRepository(db).create(
+        Reservation(id=None, product_id=product_id, quantity=quantity, expires_at=datetime.utcnow() + timedelta(minutes=10))
+    )
+class TestAllocationService:
+    def test_merges_repeated_products_and_publishes_each_line(self):
+        repository = Mock(spec=IAllocationRepository)
+        repository.allocate.return_value = [
+            Product(id=1, name="A", sku="A", stock=7, version=2),
+            Product(id=2, name="B", sku="B", stock=4, version=2)
+        ]
+        events = Mock()
+        allocation = AllocationService(repository, events).allocate([(2, 1), (1, 2), (1, 1)])
+        merged = repository.allocate.call_args.args[0]
+        assert [(line.product_id, line.quantity) for line in merged] == [(2, 1), (1, 3)]
+        assert [(line.product_id, line.quantity, line.product.stock) for line in allocation.lines] == [(2, 1, 4), (1, 3, 7)]
+        assert events.publish.call_count == 2
+        assert events.publish.call_args_list[1].args[1] == -3
+    def test_rejects_empty_non_positive_and_oversized_orders(self):
+        service = AllocationService(Mock(spec=IAllocationRepository), max_lines=2)
+        with pytest.raises(InvalidAmountError):
+            service.allocate([])
+        with pytest.raises(InvalidAmountError):
+            service.allocate([(1, 0)])
+        with pytest.raises(InvalidAmountError):
+            service.allocate([(1, 1), (2, 1), (3, 1)])
+        service.repository.allocate.assert_not_called()
+class TestAllocationRepository:
+    def test_allocates_all_lines_atomically(self, engine):
+        a, b = seed(engine, [10, 5])
+        with Session(bind=engine) as db:
+            products = SQLAlchemyAllocationRepository(db).allocate([AllocationLine(b, 2), AllocationLine(a, 3)])
+            assert not db.in_transaction()
+        assert [(p.id, p.stock, p.version) for p in products] == [(a, 7, 2), (b, 3, 2)]
+        assert stocks(engine) == {a: 7, b: 3}
+    def test_shortfall_reports_every_short_line_and_changes_nothing(self, engine):
+        a, b, c = seed(engine, [10, 1, 0])
+        with Session(bind=engine) as db:
+            with pytest.raises(AllocationShortfallError) as exc_info:
+                SQLAlchemyAllocationRepository(db).allocate([AllocationLine(a, 3), AllocationLine(b, 2), AllocationLine(c, 1)])
+        assert [(s.product_id, s.requested, s.available) for s in exc_info.value.shortfalls] == [(b, 2, 1), (c, 1, 0)]
+        assert stocks(engine) == {a: 10, b: 1, c: 0}
+    def test_located_stock_is_not_allocatable(self, engine):
+        (a,) = seed(engine, [0])
+        with Session(bind=engine) as db:
+            SQLAlchemyLocationRepository(db).adjust(a, "STORE-01", 4)
+            with pytest.raises(AllocationShortfallError):
+                SQLAlchemyAllocationRepository(db).allocate([AllocationLine(a, 1)])
+    def test_held_stock_is_not_allocatable(self, engine):
+        a, b = seed(engine, [5, 5])
+        with Session(bind=engine) as db:
+            hold(db, a, 4)
+            with pytest.raises(AllocationShortfallError) as exc_info:
+                SQLAlchemyAllocationRepository(db).allocate([AllocationLine(a, 2), AllocationLine(b, 2)])
+            assert [(s.product_id, s.requested, s.available) for s in exc_info.value.shortfalls] == [(a, 2, 1)]
+            products = SQLAlchemyAllocationRepository(db).allocate([AllocationLine(a, 1)])
+        assert products[0].stock == 4
+        assert stocks(engine) == {a: 4, b: 5}
+    def test_missing_product_raises_not_found(self, engine):
+        (a,) = seed(engine, [3])
+        with Session(bind=engine) as db:
+            with pytest.raises(ProductNotFoundError):
+                SQLAlchemyAllocationRepository(db).allocate([AllocationLine(a, 1), AllocationLine(a + 100, 1)])
+        assert stocks(engine) == {a: 3}
+    def test_concurrent_orders_never_oversell(self, engine):
+        initial = 40
+        product_ids = seed(engine, [initial] * 6)
+        allocated = {product_id: 0 for product_id in product_ids}
+        reserved = {product_id: 0 for product_id in product_ids}
+        errors = []
+        lock = threading.Lock()
+        def place_orders(seed_value):
+            rng = random.Random(seed_value)
+            for _ in range(25):
+                lines = [AllocationLine(product_id, rng.randint(1, 3)) for product_id in rng.sample(product_ids, 3)]
+                try:
+                    with Session(bind=engine) as db:
+                        SQLAlchemyAllocationRepository(db).allocate(lines)
+                except AllocationShortfallError:
+                    continue
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                with lock:
+                    for line in lines:
+                        allocated[line.product_id] += line.quantity
+        def place_holds(seed_value):
+            rng = random.Random(seed_value)
+            for _ in range(25):
+                product_id, quantity = rng.choice(product_ids), rng.randint(1, 3)
+                try:
+                    with Session(bind=engine) as db:
+                        hold(db, product_id, quantity)
+                except InsufficientStockError:
+                    continue
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                with lock:
+                    reserved[product_id] += quantity
+        threads = [threading.Thread(target=place_orders, args=(i,)) for i in range(8)]
+        threads += [threading.Thread(target=place_holds, args=(100 + i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(60)
+        assert not any(thread.is_alive() for thread in threads)
+        assert errors == []
+        final = stocks(engine)
+        assert all(stock >= 0 for stock in final.values())
+        assert {product_id: initial - allocated[product_id] for product_id in product_ids} == final
+        assert held(engine) == reserved
+        assert all(final[product_id] >= reserved[product_id] for product_id in product_ids)
+        assert sum(allocated.values()) > 0
+        assert sum(reserved.values()) > 0
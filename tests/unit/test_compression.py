@@ -0,0 +1,73 @@
+import gzip
+import json
+import zlib
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+from app.api.middleware.compression import CompressionMiddleware, GzipStream, available_encodings, negotiate
+PAYLOAD = [{"id": i, "name": f"Product {i}", "sku": f"SKU-{i:05d}", "stock": i % 50} for i in range(500)]
+@pytest.fixture
+def client():
+    app = FastAPI()
+    @app.get("/products")
+    def products():
+        return PAYLOAD
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+    @app.get("/image")
+    def image():
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+    @app.get("/export")
+    def export():
+        return StreamingResponse((json.dumps(p) + "\n" for p in PAYLOAD[:3]), media_type="application/x-ndjson")
+    @app.get("/text")
+    def text():
+        return PlainTextResponse("x" * 5000)
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=["gzip"],
+        levels={"gzip": 9},
+        minimum_size=500,
+        content_types=["application/json", "application/x-ndjson"]
+    )
+    return TestClient(app)
+class TestNegotiation:
+    def test_prefers_server_order_among_equal_weights(self):
+        assert negotiate("gzip, br", ["br", "gzip"]) == "br"
+        assert negotiate("br;q=0.5, gzip", ["br", "gzip"]) == "gzip"
+    def test_wildcard_and_refusals(self):
+        assert negotiate("*", ["gzip"]) == "gzip"
+        assert negotiate("gzip;q=0", ["gzip"]) is None
+        assert negotiate("identity", ["gzip"]) is None
+        assert negotiate("", ["gzip"]) is None
+    def test_unavailable_codecs_are_not_offered(self):
+        assert "gzip" in available_encodings([" GZIP", "definitely-not-a-codec"])
+        assert "definitely-not-a-codec" not in available_encodings(["definitely-not-a-codec"])
+class TestCompressionMiddleware:
+    def test_large_json_is_compressed(self, client):
+        response = client.get("/products", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < len(json.dumps(PAYLOAD)) / 4
+        assert response.json() == PAYLOAD
+    def test_small_bodies_other_types_and_identity_are_untouched(self, client):
+        assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+        assert "content-encoding" not in client.get("/image", headers={"Accept-Encoding": "gzip"}).headers
+        assert "content-encoding" not in client.get("/text", headers={"Accept-Encoding": "gzip"}).headers
+        assert "content-encoding" not in client.get("/products", headers={"Accept-Encoding": "identity"}).headers
+    def test_streams_are_compressed_chunk_by_chunk(self, client):
+        with client.stream("GET", "/export", headers={"Accept-Encoding": "gzip"}) as response:
+            assert response.headers["content-encoding"] == "gzip"
+            assert "content-length" not in response.headers
+            chunks = list(response.iter_raw())
+        decoder = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        first = decoder.decompress(chunks[0])
+        assert first.startswith(json.dumps(PAYLOAD[0]).encode() + b"\n")
+        rest = b"".join(decoder.decompress(chunk) for chunk in chunks[1:])
+        assert [json.loads(line) for line in (first + rest).splitlines()] == PAYLOAD[:3]
+    def test_gzip_stream_output_is_standard_gzip(self):
+        stream = GzipStream(level=1)
+        data = stream.compress(b"a" * 100) + stream.flush() + stream.compress(b"b") + stream.finish()
+        assert gzip.decompress(data) == b"a" * 100 + b"b"
@@ -0,0 +1,121 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from app.domain.models import Product
+from app.edge.export import export_delta, export_snapshot
+from app.edge.format import SNAPSHOT_HEADER, write_delta, write_snapshot
+from app.edge.lookup import EdgeStockReader, StockSnapshot, read_delta
+from app.infrastructure.database import Base
+from app.infrastructure.location_repository import SQLAlchemyLocationRepository
+from app.infrastructure.repositories import SQLAlchemyProductRepository
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    with Session(bind=engine) as db:
+        yield db
+def rows_of(pairs):
+    return lambda: iter(pairs)
+class TestSnapshotFormat:
+    def test_round_trip_binary_search(self, tmp_path):
+        path = str(tmp_path / "stock.snap")
+        pairs = [(f"SKU-{i:05d}", i * 3) for i in range(1000)]
+        assert write_snapshot(path, rows_of(pairs), generation=7) == 1000
+        with StockSnapshot(path) as snapshot:
+            assert snapshot.generation == 7
+            assert len(snapshot) == 1000
+            assert snapshot.key_width == 12
+            for sku, stock in pairs:
+                assert snapshot.get(sku) == stock
+            assert snapshot.get(" sku-00042 ") == 126
+            assert snapshot.get("SKU-0000") is None
+            assert snapshot.get("SKU-99999") is None
+            assert snapshot.get("A" * 40) is None
+            assert snapshot.get("") is None
+    def test_layout_is_header_keys_then_stocks(self, tmp_path):
+        path = tmp_path / "stock.snap"
+        write_snapshot(str(path), rows_of([("A", 1), ("BC", 2)]), generation=3)
+        data = path.read_bytes()
+        assert len(data) == SNAPSHOT_HEADER.size + 2 * 4 + 2 * 4
+        assert data[SNAPSHOT_HEADER.size:SNAPSHOT_HEADER.size + 8] == b"A\0\0\0BC\0\0"
+    def test_empty_snapshot(self, tmp_path):
+        path = str(tmp_path / "stock.snap")
+        assert write_snapshot(path, rows_of([]), generation=0) == 0
+        with StockSnapshot(path) as snapshot:
+            assert snapshot.get("ANY") is None
+    def test_rejects_unsorted_rows(self, tmp_path):
+        with pytest.raises(ValueError):
+            write_snapshot(str(tmp_path / "stock.snap"), rows_of([("B", 1), ("A", 2)]), generation=1)
+    def test_widens_keys_when_a_longer_sku_appears(self, tmp_path):
+        path = str(tmp_path / "stock.snap")
+        calls = []
+        def rows():
+            calls.append(1)
+            return iter([("A", 1), ("LONGER-THAN-FOUR", 2)] if len(calls) > 1 else [("A", 1)])
+        assert write_snapshot(path, rows, generation=1) == 2
+        with StockSnapshot(path) as snapshot:
+            assert snapshot.get("LONGER-THAN-FOUR") == 2
+    def test_rejects_foreign_files(self, tmp_path):
+        path = tmp_path / "junk.snap"
+        path.write_bytes(b"\0" * 64)
+        with pytest.raises(ValueError):
+            StockSnapshot(str(path))
+class TestEdgeStockReader:
+    def test_applies_deltas_in_order(self, tmp_path):
+        snapshot = str(tmp_path / "stock.snap")
+        write_snapshot(snapshot, rows_of([("A", 1), ("B", 2), ("C", 3)]), generation=10)
+        first = str(tmp_path / "stock.delta.1")
+        second = str(tmp_path / "stock.delta.2")
+        write_delta(first, [("B", 20), ("D", 40)], base_generation=10, generation=12)
+        write_delta(second, [("B", 21), ("C", None)], base_generation=12, generation=15)
+        with EdgeStockReader(snapshot, [first, second]) as reader:
+            assert reader.generation == 15
+            assert [reader.get(sku) for sku in "ABCDE"] == [1, 21, None, 40, None]
+            assert reader.apply_delta(first) is False
+            assert reader.get("b") == 21
+    def test_rejects_gap(self, tmp_path):
+        snapshot = str(tmp_path / "stock.snap")
+        write_snapshot(snapshot, rows_of([("A", 1)]), generation=10)
+        delta = str(tmp_path / "stock.delta")
+        write_delta(delta, [("A", 5)], base_generation=11, generation=12)
+        with EdgeStockReader(snapshot) as reader:
+            with pytest.raises(ValueError):
+                reader.apply_delta(delta)
+            assert reader.get("A") == 1
+class TestExport:
+    def test_snapshot_and_delta_follow_change_feed(self, session, tmp_path):
+        products = SQLAlchemyProductRepository(session)
+        created = {
+            sku: products.create(Product(id=None, name=sku, sku=sku, stock=stock))
+            for sku, stock in [("ZED", 9), ("ALPHA", 1), ("MID-01", 5)]
+        }
+        snapshot = str(tmp_path / "stock.snap")
+        generation, count = export_snapshot(session, snapshot, batch_size=2)
+        assert (generation, count) == (3, 3)
+        loaded = products.get_by_id(created["ALPHA"].id)
+        loaded.increment_stock(10)
+        products.update(loaded)
+        products.delete(created["ZED"].id)
+        products.create(Product(id=None, name="New", sku="NEW", stock=4))
+        delta = str(tmp_path / "stock.delta")
+        assert export_delta(session, delta, since=generation, batch_size=1) == (6, 3)
+        base, last, entries = read_delta(delta)
+        assert (base, last) == (3, 6)
+        assert dict(entries) == {"ALPHA": 11, "ZED": -1, "NEW": 4}
+        with EdgeStockReader(snapshot, [delta]) as reader:
+            assert reader.get("alpha") == 11
+            assert reader.get("ZED") is None
+            assert reader.get("NEW") == 4
+            assert reader.get("MID-01") == 5
+        assert export_delta(session, str(tmp_path / "empty.delta"), since=6) == (6, 0)
+    def test_exports_include_located_stock(self, session, tmp_path):
+        product = SQLAlchemyProductRepository(session).create(Product(id=None, name="S", sku="STORES", stock=5))
+        SQLAlchemyLocationRepository(session).adjust(product.id, "STORE1", 10)
+        snapshot = str(tmp_path / "stock.snap")
+        generation, _ = export_snapshot(session, snapshot)
+        SQLAlchemyLocationRepository(session).adjust(product.id, "STORE2", 3)
+        delta = str(tmp_path / "stock.delta")
+        export_delta(session, delta, since=generation)
+        assert dict(read_delta(delta)[2]) == {"STORES": 18}
+        with EdgeStockReader(snapshot, []) as reader:
+            assert reader.get("STORES") == 15
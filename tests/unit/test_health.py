@@ -0,0 +1,83 @@
+import asyncio
+import time
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+from app.infrastructure.health import DatabaseHealthMonitor, ErrorRateTracker
+from app.infrastructure.migrations import SCHEMA_REVISION
+from app.infrastructure.pool import pool_usage
+def stamp(url, revision):
+    engine = create_engine(url)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"))
+        connection.execute(text("INSERT INTO alembic_version VALUES (:revision)"), {"revision": revision})
+    engine.dispose()
+class TestErrorRateTracker:
+    def test_counts_server_errors_in_window(self):
+        tracker = ErrorRateTracker(window_seconds=60)
+        for status_code in (200, 404, 500, 503):
+            tracker.record(status_code)
+        assert tracker.snapshot() == {"window_seconds": 60, "total": 4, "errors": 2, "error_rate": 0.5}
+    def test_old_buckets_expire(self, monkeypatch):
+        tracker = ErrorRateTracker(window_seconds=10)
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        tracker.record(500)
+        now[0] += 11
+        tracker.record(200)
+        assert tracker.snapshot()["errors"] == 0
+        assert tracker.snapshot()["total"] == 1
+class TestDatabaseHealthMonitor:
+    def test_starting_until_first_check(self, tmp_path):
+        monitor = DatabaseHealthMonitor(f"sqlite:///{tmp_path}/h.db")
+        assert monitor.status()["status"] == "starting"
+    def test_ready_after_successful_ping(self, tmp_path):
+        url = f"sqlite:///{tmp_path}/h.db"
+        stamp(url, SCHEMA_REVISION)
+        monitor = DatabaseHealthMonitor(url, require_schema=True)
+        asyncio.run(monitor.check_once())
+        status = monitor.status()
+        assert status["status"] == "ready"
+        assert status["schema_ok"] is True
+        assert status["latency_ms"] >= 0
+        asyncio.run(monitor.stop())
+    def test_schema_mismatch_only_blocks_when_required(self, tmp_path):
+        url = f"sqlite:///{tmp_path}/h.db"
+        stamp(url, "0001")
+        lenient = DatabaseHealthMonitor(url)
+        strict = DatabaseHealthMonitor(url, require_schema=True)
+        asyncio.run(lenient.check_once())
+        asyncio.run(strict.check_once())
+        assert lenient.status()["status"] == "ready"
+        assert lenient.status()["schema_ok"] is False
+        assert strict.status()["status"] == "unavailable"
+    def test_failed_ping_is_unavailable(self, tmp_path):
+        monitor = DatabaseHealthMonitor(f"sqlite:///{tmp_path}/missing/dir/h.db")
+        asyncio.run(monitor.check_once())
+        status = monitor.status()
+        assert status["status"] == "unavailable"
+        assert status["error"]
+    def test_slow_ping_times_out_without_overlapping(self, tmp_path, monkeypatch):
+        monitor = DatabaseHealthMonitor(f"sqlite:///{tmp_path}/h.db", timeout_seconds=0.05)
+        monkeypatch.setattr(monitor, "ping", lambda: time.sleep(0.3))
+        async def run():
+            await monitor.check_once()
+            first = monitor.error
+            await monitor.check_once()
+            return first, monitor.error
+        first, second = asyncio.run(run())
+        assert "timed out" in first
+        assert "still running" in second
+    def test_stale_result_is_unavailable(self, tmp_path):
+        monitor = DatabaseHealthMonitor(f"sqlite:///{tmp_path}/h.db", interval_seconds=1, check_schema=False)
+        asyncio.run(monitor.check_once())
+        monitor.checked_at -= 10
+        assert monitor.status()["status"] == "unavailable"
+class TestPoolUsage:
+    def test_reports_queue_pool_saturation(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path}/p.db", poolclass=QueuePool, pool_size=2, max_overflow=2)
+        with engine.connect():
+            usage = pool_usage(engine)
+        assert usage["checked_out"] == 1
+        assert usage["capacity"] == 4
+        assert usage["saturation"] == 0.25
+        assert pool_usage(None) == {"initialized": False}
@@ -0,0 +1,153 @@
+import asyncio
+import threading
+import pytest
+from unittest.mock import Mock
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from app.core.metrics import metrics
+from app.domain.interfaces import IProductRepository
+from app.domain.models import Product
+from app.infrastructure.cache import LocalCache
+from app.infrastructure.cached_repositories import CachedProductRepository, evict_on
+from app.infrastructure.change_feed import ChangeSignal
+from app.infrastructure.invalidation import (
+    InMemoryInvalidationBus,
+    InvalidationMessage,
+    PostgresInvalidationBus,
+    PRODUCT_CHANGED
+)
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    with Session(bind=engine) as db:
+        yield db
+@pytest.fixture
+def bus():
+    return InMemoryInvalidationBus()
+@pytest.fixture
+def cache(bus):
+    cache = LocalCache("test-products", max_entries=2, ttl_seconds=60)
+    bus.subscribe(PRODUCT_CHANGED, evict_on(cache))
+    return cache
+class TestLocalCache:
+    def test_get_set_and_evict_by_tag(self, cache):
+        cache.set(("id", 1), "p1", tags=("1",))
+        cache.set(("sku", "A"), "p1", tags=("1",))
+        assert cache.get(("id", 1)) == "p1"
+        cache.evict_tag("1")
+        assert cache.get(("id", 1)) is None
+        assert cache.get(("sku", "A")) is None
+    def test_bounded_size_evicts_least_recently_used(self, cache):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+    def test_expired_entries_are_misses(self):
+        cache = LocalCache("test-ttl", ttl_seconds=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+class TestInvalidationBus:
+    def test_publish_delivers_after_commit(self, session, bus, cache):
+        cache.set(("id", 7), "p7", tags=("7",))
+        bus.publish(session, PRODUCT_CHANGED, 7)
+        assert cache.get(("id", 7)) == "p7"
+        session.commit()
+        assert cache.get(("id", 7)) is None
+    def test_rollback_discards_pending_messages(self, session, bus, cache):
+        cache.set(("id", 7), "p7", tags=("7",))
+        session.execute(text("SELECT 1"))
+        bus.publish(session, PRODUCT_CHANGED, 7)
+        session.rollback()
+        session.commit()
+        assert cache.get(("id", 7)) == "p7"
+    def test_reset_clears_subscribed_caches(self, bus, cache):
+        cache.set("a", 1)
+        bus.reset()
+        assert len(cache) == 0
+    def test_lag_metric_is_recorded(self, session, bus):
+        before = metrics.summary("invalidation.lag_seconds").count
+        bus.publish(session, PRODUCT_CHANGED, 1)
+        session.commit()
+        assert metrics.summary("invalidation.lag_seconds").count == before + 1
+    def test_message_round_trip(self):
+        message = InvalidationMessage(PRODUCT_CHANGED, "42", 1700000000.5, "worker-1")
+        decoded = InvalidationMessage.decode(PRODUCT_CHANGED, message.encode())
+        assert decoded == message
+    def test_postgres_bus_emits_notify_in_session(self):
+        db = Mock()
+        db.info = {}
+        bus = PostgresInvalidationBus(connect=Mock())
+        bus.publish(db, PRODUCT_CHANGED, 3)
+        statement, params = db.execute.call_args.args
+        assert "pg_notify" in str(statement)
+        assert params["channel"] == PRODUCT_CHANGED
+        assert params["payload"].startswith("3|")
+class TestCachedProductRepository:
+    def test_reads_are_served_from_cache_until_invalidated(self, session, bus, cache):
+        inner = Mock(spec=IProductRepository)
+        inner.get_by_id.return_value = Product(id=1, name="P", sku="P-1", stock=5)
+        repository = CachedProductRepository(inner, cache, bus)
+        repository.get_by_id(1)
+        repository.get_by_id(1)
+        assert inner.get_by_id.call_count == 1
+        bus.publish(session, PRODUCT_CHANGED, 1)
+        session.commit()
+        repository.get_by_id(1)
+        assert inner.get_by_id.call_count == 2
+    def test_cache_is_bypassed_when_bus_is_not_live(self, cache):
+        inner = Mock(spec=IProductRepository)
+        inner.get_by_id.return_value = Product(id=1, name="P", sku="P-1", stock=5)
+        repository = CachedProductRepository(inner, cache, PostgresInvalidationBus(connect=Mock()))
+        repository.get_by_id(1)
+        repository.get_by_id(1)
+        assert inner.get_by_id.call_count == 2
+    def test_many_reads_load_only_cache_misses(self, bus):
+        cache = LocalCache("test-many", ttl_seconds=60)
+        inner = Mock(spec=IProductRepository)
+        inner.get_by_id.return_value = Product(id=1, name="P", sku="P-1", stock=5)
+        inner.get_many_by_ids.return_value = [Product(id=2, name="Q", sku="Q-1", stock=1)]
+        repository = CachedProductRepository(inner, cache, bus)
+        repository.get_by_id(1)
+        products = repository.get_many_by_ids([1, 2])
+        assert sorted(p.id for p in products) == [1, 2]
+        inner.get_many_by_ids.assert_called_once_with([2])
+    def test_fill_is_dropped_when_eviction_lands_during_load(self, session, bus, cache):
+        inner = Mock(spec=IProductRepository)
+        stale, fresh = Product(id=1, name="Old", sku="P-1", stock=5), Product(id=1, name="New", sku="P-1", stock=9)
+        def load_then_commit_write(product_id):
+            bus.publish(session, PRODUCT_CHANGED, 1)
+            session.commit()
+            return stale
+        inner.get_by_id.side_effect = load_then_commit_write
+        repository = CachedProductRepository(inner, cache, bus)
+        assert repository.get_by_id(1) is stale
+        assert cache.get(("id", 1)) is None
+        inner.get_by_id.side_effect = None
+        inner.get_by_id.return_value = fresh
+        assert repository.get_by_id(1) is fresh
+        assert repository.get_by_id(1) is fresh
+        assert inner.get_by_id.call_count == 2
+    def test_fill_for_other_tags_survives_unrelated_eviction(self, cache):
+        generation = cache.generation()
+        cache.evict_tag("2")
+        cache.set(("id", 1), "p1", tags=("1",), since=generation)
+        assert cache.get(("id", 1)) == "p1"
+        cache.clear()
+        cache.set(("id", 1), "p1", tags=("1",), since=generation)
+        assert cache.get(("id", 1)) is None
+class TestChangeSignal:
+    def test_commit_on_another_thread_wakes_waiter(self, bus):
+        signal = ChangeSignal()
+        bus.subscribe(PRODUCT_CHANGED, signal.notify)
+        async def wait_for_change():
+            def commit_change():
+                with Session(bind=create_engine("sqlite://")) as db:
+                    bus.publish(db, PRODUCT_CHANGED, 1)
+                    db.commit()
+            asyncio.get_running_loop().call_later(0.05, threading.Thread(target=commit_change).start)
+            return await signal.wait(5)
+        assert asyncio.run(wait_for_change()) is True
+    def test_wait_times_out_without_changes(self):
+        assert asyncio.run(ChangeSignal().wait(0.01)) is False
@@ -0,0 +1,88 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.domain.allocation_models import AllocationLine
+from app.domain.models import Product
+from app.domain.reservation_models import Reservation
+from app.infrastructure.allocation_repository import SQLAlchemyAllocationRepository
+from app.infrastructure.database import Base
+from app.infrastructure.db_models import InventorySummaryModel, ProductModel
+from app.infrastructure.inventory_reconciler import InventoryReconciler
+from app.infrastructure.inventory_repository import SQLAlchemyInventoryRepository
+from app.infrastructure.location_repository import SQLAlchemyLocationRepository
+from app.infrastructure.repositories import SQLAlchemyProductRepository
+from app.infrastructure.reservation_repository import SQLAlchemyReservationRepository
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return engine
+@pytest.fixture
+def session(engine):
+    with Session(bind=engine) as db:
+        yield db
+def totals(db):
+    summary = SQLAlchemyInventoryRepository(db).get_summary()
+    return (summary.total_skus, summary.total_units, summary.out_of_stock, summary.low_stock)
+class TestInventorySummary:
+    def test_every_write_path_applies_deltas(self, session, monkeypatch):
+        monkeypatch.setattr(settings, "LOW_STOCK_THRESHOLD", 5)
+        products = SQLAlchemyProductRepository(session)
+        a = products.create(Product(id=None, name="A", sku="A", stock=0))
+        b = products.create(Product(id=None, name="B", sku="B", stock=3))
+        c = products.create(Product(id=None, name="C", sku="C", stock=20))
+        assert totals(session) == (3, 23, 1, 1)
+        loaded = products.get_by_id(a.id)
+        loaded.increment_stock(4)
+        products.update(loaded)
+        assert totals(session) == (3, 27, 0, 2)
+        SQLAlchemyLocationRepository(session).adjust(c.id, "STORE-01", 5)
+        assert totals(session) == (3, 32, 0, 2)
+        reservations = SQLAlchemyReservationRepository(session)
+        held = reservations.create(Reservation(id=None, product_id=b.id, quantity=3, expires_at=datetime.utcnow() + timedelta(minutes=5)))
+        reservations.commit(held)
+        assert totals(session) == (3, 29, 1, 1)
+        SQLAlchemyAllocationRepository(session).allocate([AllocationLine(a.id, 4), AllocationLine(c.id, 18)])
+        assert totals(session) == (3, 7, 2, 0)
+        products.delete(c.id)
+        assert totals(session) == (2, 0, 2, 0)
+        assert SQLAlchemyInventoryRepository(session).reconcile().is_zero()
+    def test_rejected_writes_leave_the_summary_alone(self, session):
+        products = SQLAlchemyProductRepository(session)
+        product = products.create(Product(id=None, name="A", sku="A", stock=2))
+        stale = products.get_by_id(product.id)
+        fresh = products.get_by_id(product.id)
+        fresh.increment_stock(1)
+        products.update(fresh)
+        stale.decrement_stock(2)
+        with pytest.raises(Exception):
+            products.update(stale)
+        assert totals(session) == (1, 3, 0, 1)
+    def test_located_units_count_towards_totals_and_reconcile(self, engine, session, monkeypatch):
+        monkeypatch.setattr(settings, "LOW_STOCK_THRESHOLD", 10)
+        product = SQLAlchemyProductRepository(session).create(Product(id=None, name="A", sku="A", stock=5))
+        assert totals(session) == (1, 5, 0, 1)
+        locations = SQLAlchemyLocationRepository(session)
+        locations.adjust(product.id, "STORE1", 10)
+        assert totals(session) == (1, 15, 0, 0)
+        locations.adjust(product.id, "STORE1", -7)
+        assert totals(session) == (1, 8, 0, 1)
+        assert InventoryReconciler(lambda: Session(bind=engine)).reconcile_once().is_zero()
+    def test_deltas_are_spread_over_shards(self, session, monkeypatch):
+        monkeypatch.setattr(settings, "INVENTORY_SUMMARY_SHARDS", 4)
+        products = SQLAlchemyProductRepository(session)
+        for i in range(8):
+            products.create(Product(id=None, name=f"P{i}", sku=f"P{i}", stock=1))
+        assert session.query(InventorySummaryModel).count() == 4
+        assert totals(session) == (8, 8, 0, 8)
+    def test_reconcile_repairs_drift(self, engine, session):
+        products = SQLAlchemyProductRepository(session)
+        product = products.create(Product(id=None, name="A", sku="A", stock=50))
+        session.execute(update(ProductModel).where(ProductModel.id == product.id).values(stock=0))
+        session.commit()
+        drift = InventoryReconciler(lambda: Session(bind=engine)).reconcile_once()
+        assert (drift.total_units, drift.out_of_stock) == (-50, 1)
+        assert totals(session) == (1, 0, 1, 0)
+        assert InventoryReconciler(lambda: Session(bind=engine)).reconcile_once().is_zero()
@@ -0,0 +1,151 @@
+import json
+import pytest
+from unittest.mock import Mock
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from app.domain.interfaces import IJobRepository
+from app.domain.job_models import Job
+from app.domain.job_service import JobService
+from app.domain.models import Product
+from app.infrastructure.database import Base
+from app.infrastructure.db_models import ProductModel
+from app.infrastructure.inventory_repository import SQLAlchemyInventoryRepository
+from app.infrastructure.job_handlers import InventoryReconcileHandler, ProductExportHandler, ProductImportHandler
+from app.infrastructure.job_repository import SQLAlchemyJobRepository
+from app.infrastructure.job_runner import JobRunner
+from app.infrastructure.repositories import SQLAlchemyProductRepository
+from app.core.exceptions import InvalidAmountError, JobLeaseLostError, JobNotFoundError, JobStateError
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+@pytest.fixture
+def sessions(engine):
+    return lambda: Session(bind=engine)
+def submit(sessions, kind, params=None):
+    with sessions() as db:
+        return SQLAlchemyJobRepository(db).create(Job(id=None, kind=kind, params=params or {}, created_by="alice"))
+def load(sessions, job_id):
+    with sessions() as db:
+        return SQLAlchemyJobRepository(db).get_by_id(job_id)
+def import_params(count):
+    return {"products": [{"name": f"P{i}", "sku": f"sku-{i}", "stock": i} for i in range(count)]}
+class FailingHandler:
+    kind = "always.fails"
+    def __init__(self):
+        self.calls = 0
+    def run_chunk(self, db, job, chunk_size):
+        self.calls += 1
+        raise RuntimeError("boom")
+class TestJobService:
+    def test_submit_notifies_workers(self):
+        repository = Mock(spec=IJobRepository)
+        repository.create.side_effect = lambda job: job
+        notify = Mock()
+        job = JobService(repository, notify).submit_product_export(created_by="alice")
+        assert (job.kind, job.status, job.created_by) == (Job.PRODUCT_EXPORT, Job.QUEUED, "alice")
+        notify.assert_called_once_with()
+    def test_import_limits(self):
+        service = JobService(Mock(spec=IJobRepository), import_max_items=2)
+        with pytest.raises(InvalidAmountError):
+            service.submit_product_import([])
+        with pytest.raises(InvalidAmountError):
+            service.submit_product_import([{"name": "A", "sku": "A", "stock": 1}] * 3)
+    def test_result_requires_success(self):
+        repository = Mock(spec=IJobRepository)
+        repository.get_by_id.return_value = Job(id=3, kind=Job.PRODUCT_EXPORT, status=Job.RUNNING)
+        with pytest.raises(JobStateError):
+            JobService(repository).get_result(3)
+        repository.get_by_id.return_value = None
+        with pytest.raises(JobNotFoundError):
+            JobService(repository).get_job(3)
+class TestJobRunner:
+    def test_import_runs_in_chunks(self, sessions):
+        job = submit(sessions, Job.PRODUCT_IMPORT, import_params(5))
+        with sessions() as db:
+            SQLAlchemyProductRepository(db).create(Product(id=None, name="Existing", sku="SKU-3", stock=100))
+        runner = JobRunner(sessions, [ProductImportHandler()], chunk_size=2)
+        finished = runner.run_once()
+        assert (finished.id, finished.status, finished.attempts) == (job.id, Job.SUCCEEDED, 1)
+        assert (finished.progress_done, finished.progress_total) == (5, 5)
+        assert finished.result == {"created": 4, "skipped": 1}
+        assert runner.run_once() is None
+        with sessions() as db:
+            assert db.execute(select(func.count(ProductModel.id))).scalar_one() == 5
+            assert len(set(db.execute(select(ProductModel.change_seq)).scalars())) == 5
+            summary = SQLAlchemyInventoryRepository(db).get_summary()
+            assert (summary.total_skus, summary.total_units) == (5, 0 + 1 + 2 + 4 + 100)
+    def test_resumes_from_checkpoint_after_crash(self, sessions):
+        job = submit(sessions, Job.PRODUCT_IMPORT, import_params(5))
+        handler = ProductImportHandler()
+        with sessions() as db:
+            repository = SQLAlchemyJobRepository(db)
+            claimed = repository.claim("crashed-worker", lease_seconds=-1)
+            step = handler.run_chunk(db, claimed, 2)
+            repository.checkpoint(job.id, "crashed-worker", *step, lease_seconds=-1)
+            handler.run_chunk(db, repository.get_by_id(job.id), 2)
+            db.rollback()
+        assert load(sessions, job.id).progress_done == 2
+        finished = JobRunner(sessions, [handler], chunk_size=2).run_once()
+        assert (finished.status, finished.attempts, finished.result) == (Job.SUCCEEDED, 2, {"created": 5, "skipped": 0})
+        with sessions() as db:
+            assert db.execute(select(func.count(ProductModel.id))).scalar_one() == 5
+            assert SQLAlchemyInventoryRepository(db).reconcile().is_zero()
+    def test_live_lease_is_not_stolen(self, sessions):
+        job = submit(sessions, Job.INVENTORY_RECONCILE)
+        with sessions() as db:
+            assert SQLAlchemyJobRepository(db).claim("worker-a", lease_seconds=60).id == job.id
+            assert SQLAlchemyJobRepository(db).claim("worker-b", lease_seconds=60) is None
+            with pytest.raises(JobLeaseLostError):
+                SQLAlchemyJobRepository(db).checkpoint(job.id, "worker-b", None, 1, 1, {}, True, 60)
+    def test_retries_then_fails(self, sessions):
+        handler = FailingHandler()
+        job = submit(sessions, handler.kind)
+        runner = JobRunner(sessions, [handler], max_attempts=2)
+        assert runner.run_once().status == Job.QUEUED
+        failed = runner.run_once()
+        assert (failed.status, failed.attempts, failed.error) == (Job.FAILED, 2, "boom")
+        assert failed.finished_at is not None
+        assert runner.run_once() is None
+        assert handler.calls == 2
+    def test_unknown_kind_fails(self, sessions):
+        job = submit(sessions, "nobody.handles.this")
+        failed = JobRunner(sessions, []).run_once()
+        assert (failed.id, failed.status) == (job.id, Job.FAILED)
+    def test_stopping_hands_job_back(self, sessions):
+        job = submit(sessions, Job.PRODUCT_IMPORT, import_params(3))
+        runner = JobRunner(sessions, [ProductImportHandler()], chunk_size=1)
+        runner._stopping.set()
+        released = runner.run_once()
+        assert (released.status, released.attempts, released.progress_done) == (Job.QUEUED, 0, 0)
+    def test_export_truncates_partial_writes_on_resume(self, sessions, tmp_path):
+        with sessions() as db:
+            products = SQLAlchemyProductRepository(db)
+            for i in range(5):
+                products.create(Product(id=None, name=f"P{i}", sku=f"P-{i}", stock=i))
+        handler = ProductExportHandler(str(tmp_path / "exports"), lambda p: json.dumps({"sku": p.sku, "stock": p.stock}))
+        job = submit(sessions, Job.PRODUCT_EXPORT)
+        with sessions() as db:
+            repository = SQLAlchemyJobRepository(db)
+            claimed = repository.claim("crashed-worker", lease_seconds=-1)
+            repository.checkpoint(job.id, "crashed-worker", *handler.run_chunk(db, claimed, 2), lease_seconds=-1)
+        with open(handler.path_for(job.id), "ab") as output:
+            output.write(b'{"sku": "P-2", "sto')
+        finished = JobRunner(sessions, [handler], chunk_size=2).run_once()
+        assert finished.status == Job.SUCCEEDED
+        assert finished.result["rows"] == 5
+        with open(handler.path_for(job.id)) as exported:
+            lines = [json.loads(line) for line in exported]
+        assert [line["sku"] for line in lines] == [f"P-{i}" for i in range(5)]
+        assert finished.result["bytes"] == sum(len(json.dumps(line)) + 1 for line in lines)
+    def test_reconcile_reports_drift(self, sessions):
+        with sessions() as db:
+            SQLAlchemyProductRepository(db).create(Product(id=None, name="A", sku="A", stock=4))
+            db.execute(ProductModel.__table__.update().values(stock=7))
+            db.commit()
+        submit(sessions, Job.INVENTORY_RECONCILE)
+        finished = JobRunner(sessions, [InventoryReconcileHandler()]).run_once()
+        assert finished.result["drift"]["total_units"] == 3
+        assert finished.result["summary"]["total_units"] == 7
@@ -0,0 +1,173 @@
+import os
+import re
+from contextlib import contextmanager
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from app.domain.models import Product
+from app.infrastructure.database import Base
+from app.infrastructure.repositories import SQLAlchemyProductRepository
+from app.infrastructure.user_repository import UserRepository
+PRODUCTS = 200_000
+USERS = 50_000
+RESERVATIONS = 50_000
+TABLES = ("products", "users", "stock_reservations", "product_locations", "product_tombstones")
+ID_INDEXES = {"ix_products_id": "products_pkey", "ix_users_id": "users_pkey"}
+SQLITE_SEED = [
+    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < {products}) "
+    "INSERT INTO products (id, name, sku, stock, change_seq, version) "
+    "SELECT i, 'Product ' || i, printf('SKU-%08d', i), i % 100, i, 1 FROM n",
+    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < {users}) "
+    "INSERT INTO users (id, username, email, hashed_password, is_active) "
+    "SELECT i, 'user' || i, 'user' || i || '@example.com', 'x', 1 FROM n",
+    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < {reservations}) "
+    "INSERT INTO stock_reservations (product_id, quantity, status, expires_at) "
+    "SELECT (i * 7) % {products} + 1, 1, CASE WHEN i % 4 = 0 THEN 'active' ELSE 'committed' END, "
+    "datetime('now', '+1 hour') FROM n",
+    "UPDATE change_counters SET value = {products}",
+    "ANALYZE"
+]
+POSTGRES_SEED = [
+    "INSERT INTO products (id, name, sku, stock, change_seq, version) "
+    "SELECT i, 'Product ' || i, 'SKU-' || lpad(i::text, 8, '0'), i % 100, i, 1 "
+    "FROM generate_series(1, {products}) AS i",
+    "INSERT INTO users (id, username, email, hashed_password, is_active) "
+    "SELECT i, 'user' || i, 'user' || i || '@example.com', 'x', true FROM generate_series(1, {users}) AS i",
+    "INSERT INTO stock_reservations (product_id, quantity, status, expires_at) "
+    "SELECT (i * 7) % {products} + 1, 1, CASE WHEN i % 4 = 0 THEN 'active' ELSE 'committed' END, "
+    "now() + interval '1 hour' FROM generate_series(1, {reservations}) AS i",
+    "SELECT setval(pg_get_serial_sequence('products', 'id'), {products})",
+    "SELECT setval(pg_get_serial_sequence('users', 'id'), {users})",
+    "UPDATE change_counters SET value = {products}",
+    "ANALYZE"
+]
+class Plan:
+    def __init__(self, scans, indexes, sorts, cost):
+        self.scans = scans
+        self.indexes = indexes
+        self.sorts = sorts
+        self.cost = cost
+def sqlite_plan(connection, statement, parameters):
+    scans, indexes, sorts = set(), set(), False
+    for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all():
+        detail = row[3]
+        match = re.match(r"(SCAN|SEARCH) (\w+)(?: USING (?:COVERING )?INDEX (\w+)| USING INTEGER PRIMARY KEY)?", detail)
+        if match:
+            action, table, index = match.groups()
+            if "INTEGER PRIMARY KEY" in detail:
+                index = f"{table}_pkey"
+            if index is not None:
+                indexes.add(ID_INDEXES.get(index, index))
+            if action == "SCAN" and table in TABLES:
+                scans.add(table)
+        sorts = sorts or "TEMP B-TREE FOR ORDER BY" in detail
+    return scans, indexes, sorts
+def postgres_plan(connection, statement, parameters):
+    scans, indexes, sorts = set(), set(), False
+    root = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()[0]["Plan"]
+    nodes = [root]
+    while nodes:
+        node = nodes.pop()
+        nodes.extend(node.get("Plans", []))
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in TABLES:
+            scans.add(node["Relation Name"])
+        if "Index Name" in node:
+            indexes.add(ID_INDEXES.get(node["Index Name"], node["Index Name"]))
+        sorts = sorts or node["Node Type"] == "Sort"
+    return scans, indexes, sorts, root["Total Cost"]
+def seeded_engine(engine, seed):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        for statement in seed:
+            connection.exec_driver_sql(statement.format(products=PRODUCTS, users=USERS, reservations=RESERVATIONS))
+    return engine
+@pytest.fixture(scope="module", params=["sqlite", "postgresql"])
+def backend(request, tmp_path_factory):
+    if request.param == "sqlite":
+        engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('plans') / 'plans.db'}")
+        steps = [0]
+        def count_steps():
+            steps[0] += 1
+            return 0
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection, _):
+            dbapi_connection.execute("PRAGMA foreign_keys=ON")
+            dbapi_connection.set_progress_handler(count_steps, 10)
+        yield seeded_engine(engine, SQLITE_SEED), steps
+        engine.dispose()
+        return
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    engine = seeded_engine(create_engine(url), POSTGRES_SEED)
+    yield engine, None
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+@contextmanager
+def captured(engine):
+    statements = []
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            statements.append((statement, parameters))
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+def run_and_explain(backend, call):
+    engine, steps = backend
+    with Session(bind=engine) as db:
+        with captured(engine) as statements:
+            before = steps[0] if steps else 0
+            call(db)
+            vm_steps = (steps[0] - before) * 10 if steps else None
+    plans = []
+    with engine.connect() as connection:
+        for statement, parameters in statements:
+            if statement.split()[0].upper() not in ("SELECT", "UPDATE", "DELETE", "WITH"):
+                continue
+            if steps:
+                plans.append(Plan(*sqlite_plan(connection, statement, parameters), cost=None))
+            else:
+                plans.append(Plan(*postgres_plan(connection, statement, parameters)))
+    return plans, vm_steps
+def update_stock(db):
+    repository = SQLAlchemyProductRepository(db)
+    product = repository.get_by_id(PRODUCTS // 2)
+    product.increment_stock(1)
+    repository.update(product)
+CASES = {
+    "product_by_id": (lambda db: SQLAlchemyProductRepository(db).get_by_id(PRODUCTS - 5), {"products_pkey"}, 200, 20),
+    "product_by_sku": (lambda db: SQLAlchemyProductRepository(db).get_by_sku(f"SKU-{PRODUCTS - 5:08d}"), {"ix_products_sku"}, 200, 20),
+    "products_by_ids": (lambda db: SQLAlchemyProductRepository(db).get_many_by_ids(list(range(PRODUCTS - 50, PRODUCTS))), {"products_pkey"}, 5_000, 500),
+    "products_by_skus": (lambda db: SQLAlchemyProductRepository(db).get_many_by_skus([f"SKU-{i:08d}" for i in range(1, PRODUCTS, PRODUCTS // 50)]), {"ix_products_sku"}, 5_000, 500),
+    "product_page_deep": (lambda db: SQLAlchemyProductRepository(db).get_page(after_id=PRODUCTS - 500, limit=100), {"products_pkey"}, 5_000, 500),
+    "product_list_first_page": (lambda db: SQLAlchemyProductRepository(db).get_all(skip=0, limit=100), set(), 5_000, 500),
+    "product_changes_deep": (lambda db: SQLAlchemyProductRepository(db).get_changes(since=PRODUCTS - 500, limit=100), {"ix_products_change_seq", "ix_product_tombstones_change_seq"}, 20_000, 1_000),
+    "product_update": (update_stock, {"products_pkey"}, 2_000, 200),
+    "product_delete": (lambda db: SQLAlchemyProductRepository(db).delete(PRODUCTS - 1), {"products_pkey"}, 2_000, 200),
+    "product_create": (lambda db: SQLAlchemyProductRepository(db).create(Product(id=None, name="New", sku="PLAN-NEW", stock=1)), set(), 2_000, 200),
+    "user_by_id": (lambda db: UserRepository(db).get_by_id(USERS - 5), {"users_pkey"}, 200, 20),
+    "user_by_username": (lambda db: UserRepository(db).get_by_username(f"user{USERS - 5}"), {"ix_users_username"}, 200, 20),
+    "user_by_email": (lambda db: UserRepository(db).get_by_email(f"user{USERS - 5}@example.com"), {"ix_users_email"}, 200, 20)
+}
+class TestQueryPlans:
+    @pytest.mark.parametrize("case", list(CASES))
+    def test_repository_queries_use_indexes_within_budget(self, backend, case):
+        call, expected_indexes, step_budget, cost_budget = CASES[case]
+        plans, vm_steps = run_and_explain(backend, call)
+        assert plans
+        for plan in plans:
+            assert not plan.scans - ({"products"} if case == "product_list_first_page" else set()), plan.scans
+            assert not plan.sorts or case == "product_changes_deep"
+            if plan.cost is not None:
+                assert plan.cost <= cost_budget, plan.cost
+        assert expected_indexes <= set().union(*(plan.indexes for plan in plans))
+        if vm_steps is not None:
+            assert vm_steps <= step_budget, vm_steps
+    def test_keyset_page_cost_does_not_grow_with_depth(self, backend):
+        def page_cost(after_id):
+            plans, vm_steps = run_and_explain(backend, lambda db: SQLAlchemyProductRepository(db).get_page(after_id=after_id, limit=100))
+            return vm_steps if vm_steps is not None else sum(plan.cost for plan in plans)
+        assert page_cost(PRODUCTS - 200) <= page_cost(0) * 2
@@ -0,0 +1,57 @@
+import time
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from app.api.middleware import ReadYourWritesMiddleware
+from app.infrastructure.replicas import ReplicaRouter
+BROKEN = "sqlite:////nonexistent-dir/replica.db"
+def bound_url(session) -> str:
+    return str(session.get_bind().url)
+class TestReplicaRouter:
+    def test_disabled_without_urls(self):
+        assert not ReplicaRouter(["", ""]).enabled
+    def test_round_robin_between_healthy_replicas(self, tmp_path):
+        urls = [f"sqlite:///{tmp_path}/a.db", f"sqlite:///{tmp_path}/b.db"]
+        router = ReplicaRouter(urls)
+        chosen = []
+        for _ in range(4):
+            session = router.open_session()
+            chosen.append(bound_url(session))
+            assert session.info["replica"] is True
+            session.close()
+        assert chosen == urls + urls
+        router.dispose()
+    def test_unreachable_replica_is_ejected(self, tmp_path):
+        healthy = f"sqlite:///{tmp_path}/a.db"
+        router = ReplicaRouter([BROKEN, healthy], eject_seconds=60)
+        for _ in range(3):
+            session = router.open_session()
+            assert bound_url(session) == healthy
+            assert session.execute(text("SELECT 1")).scalar() == 1
+            session.close()
+        assert router.healthy_urls() == [healthy]
+        router.dispose()
+    def test_falls_back_to_primary_when_all_replicas_are_down(self):
+        router = ReplicaRouter([BROKEN], eject_seconds=0.05)
+        assert router.open_session() is None
+        assert router.healthy_urls() == []
+        time.sleep(0.06)
+        assert router.healthy_urls() == [BROKEN]
+class TestReadYourWritesMiddleware:
+    def test_successful_writes_pin_the_client(self):
+        app = FastAPI()
+        @app.post("/write")
+        def write():
+            return {}
+        @app.post("/lookup")
+        def lookup():
+            return {}
+        @app.get("/read")
+        def read():
+            return {}
+        app.add_middleware(ReadYourWritesMiddleware, cookie_name="rw_pin", window_seconds=5, exempt_paths={"/lookup"})
+        client = TestClient(app)
+        assert "rw_pin" not in client.get("/read").cookies
+        assert "rw_pin" not in client.post("/lookup").cookies
+        pinned_until = float(client.post("/write").cookies["rw_pin"])
+        assert time.time() < pinned_until <= time.time() + 5
@@ -0,0 +1,60 @@
+import re
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from app.core.security import verify_password
+from app.domain.models import Product
+from app.infrastructure.database import Base
+from app.infrastructure.db_models import ProductModel, UserModel
+from app.infrastructure.inventory_repository import SQLAlchemyInventoryRepository
+from app.infrastructure.repositories import SQLAlchemyProductRepository
+from app.tools.seed import ean13, generate_catalog, load_products, load_users, password_hashes, zipf_sample
+SKU_PATTERN = re.compile(r"^([A-Z]{3}-\d{7}(-(XS|S|M|L|XL|XXL))?|20\d{11})$")
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    with Session(bind=engine) as db:
+        yield db
+class TestSeed:
+    def test_catalog_is_deterministic_by_seed(self):
+        first = generate_catalog(np.random.default_rng([7, 0]), 1000)
+        second = generate_catalog(np.random.default_rng([7, 0]), 1000)
+        other = generate_catalog(np.random.default_rng([8, 0]), 1000)
+        assert first.skus() == second.skus() and first.names() == second.names()
+        assert np.array_equal(first.stock, second.stock)
+        assert first.skus() != other.skus()
+    def test_skus_are_unique_and_well_formed(self):
+        catalog = generate_catalog(np.random.default_rng(1), 20_000)
+        skus = catalog.skus()
+        assert len(set(skus)) == len(skus)
+        assert all(SKU_PATTERN.match(sku) for sku in skus)
+        assert ean13(np.array([400638133393]))[0] == 4006381333931
+    def test_stock_is_skewed(self):
+        stock = generate_catalog(np.random.default_rng(2), 50_000, out_of_stock=0.05, stock_median=20).stock
+        assert 0.04 < (stock == 0).mean() < 0.06
+        assert 15 <= np.median(stock[stock > 0]) <= 25
+        assert stock.max() > 20 * np.median(stock)
+    def test_zipf_sample_concentrates_on_few_keys(self):
+        picks = zipf_sample(np.random.default_rng(3), 10_000, 50_000)
+        counts = np.sort(np.bincount(picks, minlength=10_000))[::-1]
+        assert counts[:100].sum() > 0.5 * len(picks)
+        assert np.array_equal(picks, zipf_sample(np.random.default_rng(3), 10_000, 50_000))
+    def test_load_keeps_summary_and_change_feed_consistent(self, session):
+        SQLAlchemyProductRepository(session).create(Product(id=None, name="Existing", sku="EXISTING", stock=5))
+        catalog = generate_catalog(np.random.default_rng(4), 2_500, first_serial=2)
+        assert load_products(session, catalog, batch_size=1_000) == 2_500
+        assert session.execute(select(func.count()).select_from(ProductModel)).scalar_one() == 2_501
+        assert SQLAlchemyInventoryRepository(session).reconcile().is_zero()
+        changes = SQLAlchemyProductRepository(session).get_changes(since=0, limit=5_000)
+        assert [change.seq for change in changes] == list(range(1, 2_502))
+        assert [change.sku for change in changes[1:]] == catalog.skus()
+    def test_users_share_precomputed_hashes(self, session):
+        hashes = password_hashes(np.random.default_rng([5, 1]), "loadtest123", 2)
+        assert hashes == password_hashes(np.random.default_rng([5, 1]), "loadtest123", 2)
+        assert load_users(session, 30, hashes, batch_size=7) == 30
+        users = session.execute(select(UserModel).order_by(UserModel.id)).scalars().all()
+        assert [user.username for user in users[:2]] == ["user0000001", "user0000002"]
+        assert {user.hashed_password for user in users} == set(hashes)
+        assert verify_password("loadtest123", users[0].hashed_password)
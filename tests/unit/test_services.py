@@ -1,13 +1,17 @@
 import pytest
 from unittest.mock import Mock, MagicMock
 from app.domain.services import ProductService
-from app.domain.interfaces import IProductRepository
+from app.domain.location_service import LocationService
+from app.domain.location_models import LocationStock
+from app.domain.interfaces import IProductRepository, ILocationRepository
 from app.domain.models import Product
 from app.core.exceptions import (
     ProductNotFoundError,
     DuplicateSKUError,
     InvalidAmountError,
-    InsufficientStockError
+    InsufficientStockError,
+    VersionConflictError,
+    PreconditionFailedError
 )
 @pytest.fixture
 def mock_repository():
@@ -77,6 +81,11 @@ class TestProductService:
         mock_repository.get_all.return_value = []
         service.get_all_products(skip=1, limit=2)
         mock_repository.get_all.assert_called_once_with(skip=1, limit=2)
+    def test_get_all_products_after_cursor_uses_keyset_page(self, service, mock_repository):
+        mock_repository.get_page.return_value = []
+        service.get_all_products(limit=2, after_id=40)
+        mock_repository.get_page.assert_called_once_with(after_id=40, limit=2)
+        mock_repository.get_all.assert_not_called()
     def test_update_product_success(self, service, mock_repository, sample_product):
         updated_product = Product(id=1, name="New Name", sku="TEST-001", stock=20)
         mock_repository.get_by_id.return_value = sample_product
@@ -109,35 +118,76 @@ class TestProductService:
         mock_repository.get_by_id.return_value = None
         with pytest.raises(ProductNotFoundError):
             service.delete_product(999)
-    def test_increment_stock_success(self, service, mock_repository, sample_product):
-        mock_repository.get_by_id.return_value = sample_product
-        updated_product = Product(id=1, name="Test Product", sku="TEST-001", stock=15)
-        mock_repository.update.return_value = updated_product
+    def test_increment_stock_success(self, service, mock_repository):
+        mock_repository.adjust_stock.return_value = Product(id=1, name="Test Product", sku="TEST-001", stock=15)
         updated = service.increment_stock(1, amount=5)
         assert updated.stock == 15
-        mock_repository.update.assert_called_once()
-    def test_increment_stock_default_amount(self, service, mock_repository, sample_product):
-        mock_repository.get_by_id.return_value = sample_product
-        updated_product = Product(id=1, name="Test Product", sku="TEST-001", stock=11)
-        mock_repository.update.return_value = updated_product
+        mock_repository.adjust_stock.assert_called_once_with(1, 5)
+        mock_repository.get_by_id.assert_not_called()
+        mock_repository.update.assert_not_called()
+    def test_increment_stock_default_amount(self, service, mock_repository):
+        mock_repository.adjust_stock.return_value = Product(id=1, name="Test Product", sku="TEST-001", stock=11)
         updated = service.increment_stock(1)
         assert updated.stock == 11
-    def test_increment_stock_invalid_amount_raises_error(self, service, mock_repository, sample_product):
-        mock_repository.get_by_id.return_value = sample_product
+        mock_repository.adjust_stock.assert_called_once_with(1, 1)
+    def test_increment_stock_invalid_amount_raises_error(self, service, mock_repository):
         with pytest.raises(InvalidAmountError):
             service.increment_stock(1, amount=0)
-    def test_decrement_stock_success(self, service, mock_repository, sample_product):
-        mock_repository.get_by_id.return_value = sample_product
-        updated_product = Product(id=1, name="Test Product", sku="TEST-001", stock=7)
-        mock_repository.update.return_value = updated_product
+        mock_repository.adjust_stock.assert_not_called()
+    def test_decrement_stock_success(self, service, mock_repository):
+        mock_repository.adjust_stock.return_value = Product(id=1, name="Test Product", sku="TEST-001", stock=7)
         updated = service.decrement_stock(1, amount=3)
         assert updated.stock == 7
-        mock_repository.update.assert_called_once()
+        mock_repository.adjust_stock.assert_called_once_with(1, -3)
     def test_decrement_stock_insufficient_raises_error(self, service, mock_repository):
-        product = Product(id=1, name="Test Product", sku="TEST-001", stock=5)
-        mock_repository.get_by_id.return_value = product
+        mock_repository.adjust_stock.side_effect = InsufficientStockError(5, 10)
         with pytest.raises(InsufficientStockError) as exc_info:
             service.decrement_stock(1, amount=10)
         error = exc_info.value
         assert error.current_stock == 5
         assert error.requested_amount == 10
+    def test_decrement_stock_invalid_amount_raises_error(self, service, mock_repository):
+        with pytest.raises(InvalidAmountError):
+            service.decrement_stock(1, amount=-2)
+        mock_repository.adjust_stock.assert_not_called()
+    def test_update_product_stale_expected_version_raises_precondition_failed(self, service, mock_repository):
+        mock_repository.get_by_id.return_value = Product(id=1, name="A", sku="A", stock=10, version=4)
+        with pytest.raises(PreconditionFailedError) as exc_info:
+            service.update_product(1, name="B", expected_version=3)
+        assert exc_info.value.current_version == 4
+        mock_repository.update.assert_not_called()
+    def test_update_product_lost_race_with_expected_version_is_not_retried(self, service, mock_repository):
+        mock_repository.get_by_id.return_value = Product(id=1, name="A", sku="A", stock=10, version=3)
+        mock_repository.update.side_effect = VersionConflictError(1, 3, 4)
+        with pytest.raises(PreconditionFailedError):
+            service.update_product(1, name="B", expected_version=3)
+        mock_repository.update.assert_called_once()
+    def test_get_products_by_ids_preserves_order_and_reports_missing(self, service, mock_repository):
+        mock_repository.get_many_by_ids.return_value = [
+            Product(id=1, name="A", sku="A", stock=1),
+            Product(id=3, name="C", sku="C", stock=3)
+        ]
+        products, missing = service.get_products_by_ids([3, 2, 1, 3])
+        assert [p.id for p in products] == [3, 1]
+        assert missing == [2]
+        mock_repository.get_many_by_ids.assert_called_once_with([3, 2, 1])
+    def test_get_products_by_skus_normalizes_keys(self, service, mock_repository):
+        mock_repository.get_many_by_skus.return_value = [Product(id=1, name="A", sku="SKU-A", stock=1)]
+        products, missing = service.get_products_by_skus(["sku-a", "nope"])
+        assert [p.sku for p in products] == ["SKU-A"]
+        assert missing == ["nope"]
+class TestLocationService:
+    def test_decrement_normalizes_location_and_publishes_delta(self, sample_product):
+        repository = Mock(spec=ILocationRepository)
+        repository.adjust.return_value = (LocationStock(1, "STORE-01", 3), sample_product)
+        events = Mock()
+        location_stock, product = LocationService(repository, events).decrement_stock(1, " store-01 ", 2)
+        repository.adjust.assert_called_once_with(1, "STORE-01", -2)
+        assert (location_stock.stock, product) == (3, sample_product)
+        events.publish.assert_called_once_with(sample_product, -2)
+    def test_rejects_blank_location_and_non_positive_amounts(self):
+        service = LocationService(Mock(spec=ILocationRepository))
+        with pytest.raises(InvalidAmountError):
+            service.increment_stock(1, "  ", 1)
+        with pytest.raises(InvalidAmountError):
+            service.decrement_stock(1, "STORE-01", 0)
@@ -0,0 +1,47 @@
+import asyncio
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from app.domain.models import Product
+from app.domain.user_models import User
+from app.infrastructure import database
+from app.infrastructure.database import Base, get_db
+from app.infrastructure.repositories import SQLAlchemyProductRepository
+from app.infrastructure.user_repository import UserRepository
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    with Session(bind=engine) as db:
+        yield db
+class TestLazySession:
+    def test_get_db_does_not_check_out_a_connection(self, monkeypatch):
+        engine = create_engine("sqlite://")
+        monkeypatch.setattr(database, "get_session", lambda: Session(bind=engine))
+        async def resolve():
+            dependency = get_db()
+            db = await dependency.__anext__()
+            in_transaction = db.in_transaction()
+            await dependency.aclose()
+            return in_transaction
+        assert asyncio.run(resolve()) is False
+    def test_writes_release_the_connection_at_commit(self, session):
+        product = SQLAlchemyProductRepository(session).create(Product(id=None, name="P", sku="P-1", stock=3))
+        assert product.id is not None
+        assert product.created_at is not None
+        assert not session.in_transaction()
+        updated = SQLAlchemyProductRepository(session).update(Product(id=product.id, name="Q", sku="P-1", stock=5))
+        assert updated.stock == 5
+        assert not session.in_transaction()
+        user = UserRepository(session).create(User(id=None, username="u", email="u@example.com", hashed_password="x"))
+        assert user.id is not None
+        assert not session.in_transaction()
+    def test_versioned_update_issues_no_reads(self, session):
+        repository = SQLAlchemyProductRepository(session)
+        product = repository.get_by_id(repository.create(Product(id=None, name="P", sku="P-1", stock=3)).id)
+        product.increment_stock(2)
+        statements = []
+        event.listen(session.get_bind(), "before_cursor_execute", lambda conn, cursor, statement, *_: statements.append(statement))
+        assert repository.update(product).stock == 5
+        assert statements
+        assert not [statement for statement in statements if statement.lstrip().upper().startswith("SELECT")]
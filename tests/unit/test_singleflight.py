@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import pytest
+from unittest.mock import Mock
+from app.core.singleflight import AsyncSingleFlight, SingleFlight
+from app.domain.interfaces import IProductRepository
+from app.domain.models import Product
+from app.infrastructure.cached_repositories import CoalescingProductRepository
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_execution(self):
+        flight = SingleFlight("test-shared")
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        def load():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "value"
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", load)))
+        leader.start()
+        started.wait(5)
+        followers = [threading.Thread(target=lambda: results.append(flight.do("k", load))) for _ in range(4)]
+        for thread in followers:
+            thread.start()
+        while flight._coalesced.value < 4:
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+        assert results == ["value"] * 5
+        assert len(calls) == 1
+        assert flight._executed.value == 1
+    def test_sequential_calls_execute_again(self):
+        flight = SingleFlight("test-sequential")
+        load = Mock(side_effect=[1, 2])
+        assert flight.do("k", load) == 1
+        assert flight.do("k", load) == 2
+    def test_error_propagates_to_waiters(self):
+        flight = SingleFlight("test-error")
+        started = threading.Event()
+        release = threading.Event()
+        def load():
+            started.set()
+            release.wait(5)
+            raise ValueError("boom")
+        errors = []
+        def call():
+            try:
+                flight.do("k", load)
+            except ValueError as e:
+                errors.append(e)
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=call)
+        follower.start()
+        while flight._coalesced.value < 1:
+            threading.Event().wait(0.01)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+        assert len(errors) == 2
+    def test_forget_starts_a_new_flight(self):
+        flight = SingleFlight("test-forget")
+        started = threading.Event()
+        release = threading.Event()
+        def slow():
+            started.set()
+            release.wait(5)
+            return "old"
+        leader = threading.Thread(target=lambda: flight.do("k", slow))
+        leader.start()
+        started.wait(5)
+        flight.forget("product_changed", "1")
+        assert flight.do("k", lambda: "new") == "new"
+        release.set()
+        leader.join(5)
+class TestAsyncSingleFlight:
+    def test_concurrent_awaits_share_one_execution(self):
+        flight = AsyncSingleFlight("test-async")
+        calls = []
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "value"
+        async def main():
+            return await asyncio.gather(*[flight.do("k", load) for _ in range(5)])
+        assert asyncio.run(main()) == ["value"] * 5
+        assert len(calls) == 1
+        assert flight._coalesced.value == 4
+    def test_follower_retries_when_leader_is_cancelled(self):
+        flight = AsyncSingleFlight("test-async-cancel")
+        async def load():
+            await asyncio.sleep(0.05)
+            return "value"
+        async def main():
+            leader = asyncio.create_task(flight.do("k", load))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(flight.do("k", load))
+            await asyncio.sleep(0)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+        assert asyncio.run(main()) == "value"
+class TestCoalescingProductRepository:
+    def test_reads_go_through_flight_with_scope(self):
+        inner = Mock(spec=IProductRepository)
+        inner.get_by_id.return_value = Product(id=1, name="P", sku="P-1", stock=1)
+        flight = Mock(spec=SingleFlight)
+        flight.do.side_effect = lambda key, fn: fn()
+        repo = CoalescingProductRepository(inner, flight, scope="replica")
+        assert repo.get_by_id(1).sku == "P-1"
+        assert flight.do.call_args[0][0] == ("replica", "id", 1)
+    def test_writes_bypass_flight(self):
+        inner = Mock(spec=IProductRepository)
+        flight = Mock(spec=SingleFlight)
+        repo = CoalescingProductRepository(inner, flight)
+        repo.delete(1)
+        inner.delete.assert_called_once_with(1)
+        flight.do.assert_not_called()
@@ -0,0 +1,154 @@
+import threading
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from app.core.exceptions import InsufficientStockError
+from app.domain.models import Product
+from app.domain.services import ProductService
+from app.domain.allocation_service import AllocationService
+from app.infrastructure.allocation_repository import SQLAlchemyAllocationRepository
+from app.infrastructure.change_feed import PRODUCT_SEQUENCE
+from app.infrastructure.database import Base
+from app.infrastructure.db_models import ChangeCounterModel, ProductModel
+from app.infrastructure.inventory_repository import SQLAlchemyInventoryRepository
+from app.infrastructure.location_repository import SQLAlchemyLocationRepository
+from app.infrastructure.repositories import SQLAlchemyProductRepository
+from app.infrastructure.sqlite import create_sqlite_engines, is_sqlite_file, parse_pragmas, profile_pragmas
+@pytest.fixture
+def url(tmp_path):
+    return make_url(f"sqlite:///{tmp_path / 'store.db'}")
+@pytest.fixture
+def engines(url):
+    writer, reader = create_sqlite_engines(url, profile_pragmas(busy_timeout_ms=10000), read_pool_size=4)
+    Base.metadata.create_all(bind=writer)
+    yield writer, reader
+    writer.dispose()
+    reader.dispose()
+def seed(writer, stock):
+    with Session(bind=writer) as db:
+        return SQLAlchemyProductRepository(db).create(Product(id=None, name="P", sku="P-1", stock=stock)).id
+def run_threads(targets):
+    errors = []
+    def guarded(target):
+        try:
+            target()
+        except Exception as e:
+            errors.append(e)
+    threads = [threading.Thread(target=guarded, args=(target,)) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+class TestSQLiteProfile:
+    def test_pragmas_are_applied_per_connection(self, engines):
+        writer, reader = engines
+        with writer.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+            assert connection.exec_driver_sql("PRAGMA busy_timeout").scalar() == 10000
+            assert connection.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+        with reader.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA query_only").scalar() == 1
+            with pytest.raises(OperationalError):
+                connection.execute(text("DELETE FROM products"))
+    def test_extra_pragmas(self, url):
+        writer, reader = create_sqlite_engines(url, profile_pragmas(extra=parse_pragmas("cache_size=-65536, temp_store=MEMORY,")))
+        with writer.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA cache_size").scalar() == -65536
+            assert connection.exec_driver_sql("PRAGMA temp_store").scalar() == 2
+        writer.dispose()
+        reader.dispose()
+    def test_is_sqlite_file(self):
+        assert is_sqlite_file("sqlite:///./app.db")
+        assert not is_sqlite_file("sqlite://")
+        assert not is_sqlite_file("sqlite:///:memory:")
+        assert not is_sqlite_file("postgresql://localhost/store")
+    def test_readers_are_not_blocked_by_an_open_write(self, engines):
+        writer, reader = engines
+        product_id = seed(writer, 5)
+        with Session(bind=writer) as write, Session(bind=reader) as read:
+            write.execute(ProductModel.__table__.update().values(stock=50))
+            assert read.execute(select(ProductModel.stock).where(ProductModel.id == product_id)).scalar_one() == 5
+            write.commit()
+            read.rollback()
+            assert read.execute(select(ProductModel.stock).where(ProductModel.id == product_id)).scalar_one() == 50
+    def test_concurrent_writers_across_engines_do_not_lock_out(self, url, engines):
+        writer, _ = engines
+        other, other_reader = create_sqlite_engines(url, profile_pragmas(busy_timeout_ms=10000))
+        product_id = seed(writer, 10000)
+        def work(engine):
+            def run():
+                for _ in range(20):
+                    with Session(bind=engine) as db:
+                        ProductService(SQLAlchemyProductRepository(db)).increment_stock(product_id, 1)
+                    with Session(bind=engine) as db:
+                        AllocationService(SQLAlchemyAllocationRepository(db)).allocate([(product_id, 2)])
+            return run
+        errors = run_threads([work(engine) for engine in (writer, other, writer, other)])
+        assert errors == []
+        with Session(bind=writer) as db:
+            assert db.get(ProductModel, product_id).stock == 10000 - 4 * 20
+            assert SQLAlchemyInventoryRepository(db).reconcile().is_zero()
+        other.dispose()
+        other_reader.dispose()
+    def test_concurrent_writes_keep_the_change_feed_gap_free(self, engines):
+        writer, reader = engines
+        with Session(bind=writer) as db:
+            repository = SQLAlchemyProductRepository(db)
+            product_ids = [repository.create(Product(id=None, name="P", sku=f"SEQ-{i}", stock=100)).id for i in range(8)]
+        done = threading.Event()
+        seen = {}
+        def writes(product_id):
+            def run():
+                for i in range(15):
+                    with Session(bind=writer) as db:
+                        if i % 2:
+                            SQLAlchemyLocationRepository(db).adjust(product_id, f"S{i % 3}", 1)
+                        else:
+                            ProductService(SQLAlchemyProductRepository(db)).increment_stock(product_id, 1)
+            return run
+        def poll():
+            cursor = 0
+            while True:
+                finished = done.is_set()
+                with Session(bind=reader) as db:
+                    changes = SQLAlchemyProductRepository(db).get_changes(since=cursor, limit=5)
+                for change in changes:
+                    assert change.seq > cursor
+                    cursor = change.seq
+                    seen[change.product_id] = change.product.stock
+                if finished and not changes:
+                    return
+        poller = threading.Thread(target=poll)
+        poller.start()
+        errors = run_threads([writes(product_id) for product_id in product_ids])
+        done.set()
+        poller.join()
+        assert errors == []
+        assert seen == {product_id: 115 for product_id in product_ids}
+        with Session(bind=writer) as db:
+            counter = db.get(ChangeCounterModel, PRODUCT_SEQUENCE).value
+            sequences = db.scalars(select(ProductModel.change_seq)).all()
+        assert counter == 8 + 8 * 15
+        assert max(sequences) == counter
+        assert len(set(sequences)) == 8
+    def test_concurrent_decrements_never_oversell(self, engines):
+        writer, _ = engines
+        product_id = seed(writer, 50)
+        sold = []
+        def run():
+            for _ in range(10):
+                with Session(bind=writer) as db:
+                    try:
+                        ProductService(SQLAlchemyProductRepository(db)).decrement_stock(product_id, 1)
+                        sold.append(1)
+                    except InsufficientStockError:
+                        pass
+        assert run_threads([run] * 8) == []
+        assert len(sold) == 50
+        with Session(bind=writer) as db:
+            assert db.get(ProductModel, product_id).stock == 0
+            assert SQLAlchemyInventoryRepository(db).reconcile().is_zero()
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+import pytest
+from tests.conftest import SQLALCHEMY_TEST_DATABASE_URL
+PROBE = """
+import sys
+import app.main
+from app.infrastructure import database
+print(",".join(m for m in ("jose", "passlib", "bcrypt", "cryptography", "psycopg2") if m in sys.modules))
+print(database._engine is None)
+"""
+@pytest.fixture
+def health_on_test_db(monkeypatch):
+    from app.main import db_health
+    monkeypatch.setattr(db_health, "url", SQLALCHEMY_TEST_DATABASE_URL)
+    monkeypatch.setattr(db_health, "_engine", None)
+    monkeypatch.setattr(db_health, "_pending", None)
+    return db_health
+class TestColdStart:
+    def test_import_does_not_load_crypto_or_engine(self):
+        result = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        eager_modules, engine_unset = result.stdout.splitlines()
+        assert eager_modules == ""
+        assert engine_unset == "True"
+    def test_liveness_does_not_touch_database(self, client):
+        from app.infrastructure import database
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert database._engine is None or database._engine.pool.checkedout() == 0
+    def test_readiness_serves_cached_ping_without_request_path_connection(self, health_on_test_db, client):
+        import time
+        from app.infrastructure import database
+        for _ in range(50):
+            response = client.get("/health/ready")
+            if response.json()["status"] != "starting":
+                break
+            time.sleep(0.05)
+        assert client.get("/health/live").status_code == 200
+        body = response.json()
+        assert response.status_code == 200
+        assert body["database"]["ok"] is True
+        assert set(body["requests"]) == {"window_seconds", "total", "errors", "error_rate"}
+        assert "initialized" in body["pool"]
+        assert database._engine is None or database._engine.pool.checkedout() == 0
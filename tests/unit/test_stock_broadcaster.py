@@ -0,0 +1,65 @@
+import asyncio
+import threading
+from unittest.mock import Mock
+from app.core.metrics import metrics
+from app.domain.interfaces import IProductRepository
+from app.domain.models import Product
+from app.domain.services import ProductService
+from app.infrastructure.invalidation import InvalidationMessage, PRODUCT_CHANGED
+from app.infrastructure.stock_broadcaster import StockBroadcaster, refresh_on
+def product(stock: int, product_id: int = 1) -> Product:
+    return Product(id=product_id, name="P", sku=f"P-{product_id}", stock=stock)
+class TestStockBroadcaster:
+    def test_publish_from_worker_thread_reaches_subscriber(self):
+        broadcaster = StockBroadcaster()
+        async def scenario():
+            subscription = broadcaster.subscribe([product(5)])
+            threading.Thread(target=broadcaster.publish, args=(product(8), 3)).start()
+            return await subscription.next_event(5)
+        event = asyncio.run(scenario())
+        assert event["stock"] == 8
+        assert event["delta"] == 3
+    def test_unwatched_products_are_ignored(self):
+        broadcaster = StockBroadcaster()
+        async def scenario():
+            subscription = broadcaster.subscribe([product(5)])
+            broadcaster.publish(product(1, product_id=2), -4)
+            await asyncio.sleep(0)
+            return subscription.queue.qsize()
+        assert asyncio.run(scenario()) == 0
+        assert not broadcaster.is_watched(2)
+    def test_slow_consumer_is_dropped(self):
+        broadcaster = StockBroadcaster(queue_size=2)
+        before = metrics.counter("stream.dropped").value
+        async def scenario():
+            slow = broadcaster.subscribe([product(0)])
+            for stock in range(1, 5):
+                broadcaster.publish(product(stock))
+            await asyncio.sleep(0)
+            return slow
+        slow = asyncio.run(scenario())
+        assert slow.dropped
+        assert slow.queue.get_nowait() is None
+        assert not broadcaster.is_watched(1)
+        assert metrics.counter("stream.dropped").value == before + 1
+    def test_own_messages_skip_refetch_and_delta_is_derived(self):
+        broadcaster = StockBroadcaster()
+        session_factory = Mock()
+        refresh = refresh_on(broadcaster, "local", session_factory)
+        refresh(InvalidationMessage(PRODUCT_CHANGED, "1", 0.0, "local"))
+        assert not session_factory.called
+        async def scenario():
+            subscription = broadcaster.subscribe([product(5)])
+            broadcaster.publish(product(2))
+            return await subscription.next_event(5)
+        assert asyncio.run(scenario())["delta"] == -3
+class TestProductServiceEvents:
+    def test_stock_changes_are_published_after_update(self):
+        repository = Mock(spec=IProductRepository)
+        repository.adjust_stock.return_value = product(6)
+        events = Mock()
+        ProductService(repository, events).decrement_stock(1, 4)
+        repository.adjust_stock.assert_called_once_with(1, -4)
+        published, delta = events.publish.call_args.args
+        assert published.stock == 6
+        assert delta == -4
@@ -0,0 +1,72 @@
+import time
+from datetime import timedelta
+import pytest
+from app.core import security
+from app.core.security import (
+    SigningKeyring,
+    VerifiedTokenCache,
+    create_access_token,
+    decode_access_token,
+    parse_signing_keys
+)
+@pytest.fixture(autouse=True)
+def isolated_keyring(monkeypatch):
+    cache = VerifiedTokenCache(max_entries=2)
+    keyring = SigningKeyring({"k1": "secret-one"}, "k1", cache)
+    monkeypatch.setattr(security, "token_cache", cache)
+    monkeypatch.setattr(security, "keyring", keyring)
+    return keyring
+class TestVerifiedTokenCache:
+    def test_second_decode_is_served_from_cache(self, isolated_keyring, monkeypatch):
+        token = create_access_token({"sub": "alice"})
+        assert decode_access_token(token)["sub"] == "alice"
+        monkeypatch.setattr(security, "verify_access_token", lambda token: pytest.fail("verified twice"))
+        assert decode_access_token(token)["sub"] == "alice"
+    def test_expired_entry_is_not_served(self):
+        cache = VerifiedTokenCache()
+        cache.put("t", {"sub": "alice", "exp": time.time() - 1}, "k1")
+        assert cache.get("t") is None
+        assert len(cache) == 0
+    def test_tokens_without_exp_are_not_cached(self):
+        cache = VerifiedTokenCache()
+        cache.put("t", {"sub": "alice"}, "k1")
+        assert cache.get("t") is None
+    def test_bounded_size_evicts_oldest(self):
+        cache = VerifiedTokenCache(max_entries=2)
+        exp = time.time() + 60
+        for token in ("a", "b", "c"):
+            cache.put(token, {"exp": exp}, "k1")
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+    def test_returned_claims_are_copies(self):
+        cache = VerifiedTokenCache()
+        cache.put("t", {"sub": "alice", "exp": time.time() + 60}, "k1")
+        cache.get("t")["sub"] = "mallory"
+        assert cache.get("t")["sub"] == "alice"
+    def test_invalid_token_is_rejected(self):
+        assert decode_access_token("not-a-token") is None
+        expired = create_access_token({"sub": "alice"}, expires_delta=timedelta(seconds=-1))
+        assert decode_access_token(expired) is None
+class TestSigningKeyring:
+    def test_parse_signing_keys(self):
+        assert parse_signing_keys("a:one, b:two,broken,") == {"a": "one", "b": "two"}
+    def test_old_tokens_stay_valid_while_old_key_is_kept(self, isolated_keyring):
+        old = create_access_token({"sub": "alice"})
+        isolated_keyring.rotate({"k1": "secret-one", "k2": "secret-two"}, "k2")
+        new = create_access_token({"sub": "bob"})
+        assert decode_access_token(old)["sub"] == "alice"
+        assert decode_access_token(new)["sub"] == "bob"
+    def test_removing_a_key_drops_its_cached_tokens(self, isolated_keyring):
+        old = create_access_token({"sub": "alice"})
+        assert decode_access_token(old)["sub"] == "alice"
+        isolated_keyring.rotate({"k2": "secret-two"}, "k2")
+        assert len(isolated_keyring.cache) == 0
+        assert decode_access_token(old) is None
+    def test_changing_a_secret_drops_its_cached_tokens(self, isolated_keyring):
+        old = create_access_token({"sub": "alice"})
+        decode_access_token(old)
+        isolated_keyring.rotate({"k1": "rotated"}, "k1")
+        assert decode_access_token(old) is None
+    def test_active_kid_must_exist(self, isolated_keyring):
+        with pytest.raises(ValueError):
+            isolated_keyring.rotate({"k1": "secret-one"}, "missing")
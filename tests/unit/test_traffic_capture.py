@@ -0,0 +1,99 @@
+import asyncio
+import time
+import httpx
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from app.api.middleware import TrafficCaptureMiddleware
+from app.infrastructure.traffic_capture import NDJSONFileWriter
+from app.tools.replay import Replayer, format_report, load_capture, percentile
+def build_app():
+    app = FastAPI()
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        if item_id == 404:
+            raise HTTPException(status_code=404, detail="missing")
+        return {"id": item_id}
+    @app.post("/login")
+    def login(body: dict):
+        return {"ok": body["password"] == "secret"}
+    return app
+class TestTrafficCaptureMiddleware:
+    def test_records_route_template_and_sizes(self):
+        records = []
+        app = build_app()
+        app.add_middleware(TrafficCaptureMiddleware, writer=records.append, sample_rate=1.0)
+        with TestClient(app) as client:
+            client.get("/items/7?verbose=1")
+        record = records[0]
+        assert record["route"] == "/items/{item_id}"
+        assert record["path"] == "/items/7"
+        assert record["query"] == "verbose=1"
+        assert record["path_params"] == {"item_id": "7"}
+        assert record["status"] == 200
+        assert record["response_bytes"] == len(b'{"id":7}')
+        assert record["duration_ms"] >= 0
+        assert "body" not in record
+    def test_bodies_are_redacted_when_enabled(self):
+        records = []
+        app = build_app()
+        app.add_middleware(TrafficCaptureMiddleware, writer=records.append, sample_rate=1.0, capture_bodies=True)
+        with TestClient(app) as client:
+            client.post("/login", json={"username": "alice", "password": "secret"})
+        assert records[0]["body"] == {"username": "alice", "password": "***"}
+        assert records[0]["request_bytes"] > 0
+    def test_sampling_and_exclusions(self):
+        records = []
+        app = build_app()
+        app.add_middleware(TrafficCaptureMiddleware, writer=records.append, sample_rate=0.0)
+        with TestClient(app) as client:
+            client.get("/items/1")
+        assert records == []
+        app = build_app()
+        app.add_middleware(TrafficCaptureMiddleware, writer=records.append, sample_rate=1.0, exclude_prefixes=("/items",))
+        with TestClient(app) as client:
+            client.get("/items/1")
+        assert records == []
+    def test_unmatched_route(self):
+        records = []
+        app = build_app()
+        app.add_middleware(TrafficCaptureMiddleware, writer=records.append, sample_rate=1.0)
+        with TestClient(app) as client:
+            client.get("/nope")
+        assert records[0]["route"] == "<unmatched>"
+        assert records[0]["status"] == 404
+class TestNDJSONFileWriter:
+    def test_writes_lines_and_rotates(self, tmp_path):
+        writer = NDJSONFileWriter(str(tmp_path / "traffic.ndjson"), max_bytes=200, backup_count=2)
+        writer.start()
+        for i in range(20):
+            writer.write({"ts": i, "route": "/items/{item_id}"})
+        writer.stop()
+        records = load_capture([str(tmp_path / "traffic.ndjson*")])
+        assert (tmp_path / "traffic.ndjson.1").exists()
+        assert [record["ts"] for record in records] == sorted(record["ts"] for record in records)
+        assert records[-1]["ts"] == 19
+class TestReplay:
+    def test_percentile_nearest_rank(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 0.5) == 50.0
+        assert percentile(values, 0.99) == 99.0
+        assert percentile([3.0], 0.9) == 3.0
+        assert percentile([], 0.5) == 0.0
+    def test_replay_reports_latency_and_errors(self):
+        now = time.time()
+        records = [
+            {"ts": now, "method": "GET", "route": "/items/{item_id}", "path": "/items/1", "query": ""},
+            {"ts": now + 0.01, "method": "GET", "route": "/items/{item_id}", "path": "/items/404", "query": ""},
+            {"ts": now + 0.02, "method": "POST", "route": "/login", "path": "/login", "query": "", "body": {"password": "***"}}
+        ]
+        async def run():
+            transport = httpx.ASGITransport(app=build_app())
+            async with httpx.AsyncClient(transport=transport, base_url="http://replay") as client:
+                replayer = Replayer(client, speedup=0, concurrency=2, password="secret")
+                await replayer.run(records)
+                return replayer.report()
+        report = asyncio.run(run())
+        assert report["routes"]["GET /items/{item_id}"]["count"] == 2
+        assert report["routes"]["POST /login"]["count"] == 1
+        assert report["errors"] == [{"route": "GET /items/{item_id}", "error": "404", "count": 1}]
+        assert "GET /items/{item_id}" in format_report(report)